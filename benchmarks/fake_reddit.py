@@ -0,0 +1,435 @@
+"""A local stand-in for the Reddit API, used by the benchmark suite.
+
+Serves Reddit-shaped JSON for the endpoints the server's hot paths touch:
+subreddit listings, comment trees and /api/morechildren, about pages
+(subreddit, rules, moderators, users), user listings and /api/info. It also
+answers the OAuth token endpoint, so PRAW can be pointed at it with
+REDDIT_OAUTH_URL and REDDIT_URL.
+
+Responses come from recorded fixtures when available (see `--record`), and
+are otherwise generated deterministically from the request path, so the same
+request always returns the same payload.
+
+Usage:
+    python benchmarks/fake_reddit.py --port 8765 --latency-ms 20
+    python benchmarks/fake_reddit.py --record --fixtures benchmarks/fixtures
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+LISTING_SORTS = ("hot", "new", "top", "rising", "controversial", "best")
+BASE_TIME = 1_700_000_000
+
+# Paths recorded by --record. Subreddit listings and comment pages are
+# enough to also serve /api/info and /api/morechildren from the recording.
+RECORD_PATHS = [
+    ("/r/python/hot", {"limit": 100}),
+    ("/r/python/new", {"limit": 100}),
+    ("/r/python/top", {"limit": 100, "t": "day"}),
+    ("/r/python/about", {}),
+    ("/r/python/about/rules", {}),
+    ("/r/python/about/moderators", {}),
+    ("/r/askreddit/hot", {"limit": 100}),
+    ("/r/askreddit/about", {}),
+]
+
+
+def _base36(number: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while True:
+        number, rem = divmod(number, 36)
+        out = digits[rem] + out
+        if not number:
+            return out
+
+
+def _seed(*parts) -> int:
+    return int(hashlib.sha1("/".join(map(str, parts)).encode()).hexdigest()[:12], 16)
+
+
+class Corpus:
+    """Produces the JSON payloads served by the fake API."""
+
+    def __init__(self, fixtures_dir=None, posts_per_subreddit=1000, comments_per_post=400):
+        self.posts_per_subreddit = posts_per_subreddit
+        self.comments_per_post = comments_per_post
+        self.fixtures = {}
+        self.things = {}
+        self._post_index = {}
+        self._comment_index = {}
+        if fixtures_dir and os.path.isdir(fixtures_dir):
+            self._load_fixtures(fixtures_dir)
+
+    # Fixtures -----------------------------------------------------------
+
+    def _load_fixtures(self, fixtures_dir):
+        with open(os.path.join(fixtures_dir, "index.json")) as f:
+            index = json.load(f)
+        for path, filename in index.items():
+            with open(os.path.join(fixtures_dir, filename)) as f:
+                payload = json.load(f)
+            self.fixtures[path] = payload
+            self._index_things(payload)
+
+    def _index_things(self, payload):
+        if isinstance(payload, list):
+            for part in payload:
+                self._index_things(part)
+        elif isinstance(payload, dict):
+            if payload.get("kind") in ("t1", "t3") and "name" in payload.get("data", {}):
+                self.things[payload["data"]["name"]] = payload
+            for value in payload.values():
+                if isinstance(value, (dict, list)):
+                    self._index_things(value)
+
+    # Synthetic things ---------------------------------------------------
+
+    def post(self, subreddit: str, index: int):
+        rng = random.Random(_seed("post", subreddit, index))
+        post_id = _base36(_seed("post-id", subreddit, index) % 36 ** 7)
+        is_self = rng.random() < 0.6
+        selftext = " ".join(rng.choice(("lorem", "ipsum", "dolor", "python", "reddit", "async")) for _ in range(rng.randint(0, 400))) if is_self else ""
+        permalink = f"/r/{subreddit}/comments/{post_id}/post_{index}/"
+        return {"kind": "t3", "data": {
+            "id": post_id,
+            "name": f"t3_{post_id}",
+            "title": f"Synthetic post {index} in r/{subreddit}",
+            "selftext": selftext,
+            "selftext_html": None,
+            "author": f"user{rng.randint(1, 5000)}",
+            "author_fullname": f"t2_{_base36(rng.randint(1, 10 ** 8))}",
+            "subreddit": subreddit,
+            "subreddit_id": f"t5_{_base36(_seed('sr', subreddit) % 36 ** 6)}",
+            "subreddit_name_prefixed": f"r/{subreddit}",
+            "score": rng.randint(0, 50000),
+            "ups": rng.randint(0, 50000),
+            "upvote_ratio": round(rng.uniform(0.5, 1.0), 2),
+            "num_comments": rng.randint(0, 5000),
+            "created_utc": float(BASE_TIME - index * 60),
+            "url": f"https://www.reddit.com{permalink}" if is_self else f"https://example.com/{post_id}",
+            "permalink": permalink,
+            "is_self": is_self,
+            "over_18": False,
+            "spoiler": False,
+            "stickied": False,
+            "locked": False,
+            "link_flair_text": rng.choice((None, "Discussion", "Help", "News")),
+            "domain": f"self.{subreddit}" if is_self else "example.com",
+            "thumbnail": "self" if is_self else "default",
+            "total_awards_received": rng.randint(0, 3),
+            "distinguished": None
+        }}
+
+    def comment(self, link_id: str, number: int, parent_id: str, depth: int):
+        rng = random.Random(_seed("comment", link_id, number))
+        comment_id = _base36(_seed("comment-id", link_id, number) % 36 ** 7)
+        body = " ".join(rng.choice(("this", "is", "a", "synthetic", "comment", "about", "python")) for _ in range(rng.randint(3, 120)))
+        return {"kind": "t1", "data": {
+            "id": comment_id,
+            "name": f"t1_{comment_id}",
+            "link_id": link_id,
+            "parent_id": parent_id,
+            "author": "op_user" if number % 97 == 5 else f"user{rng.randint(1, 5000)}",
+            "body": body,
+            "body_html": None,
+            "score": rng.randint(-20, 5000),
+            "created_utc": float(BASE_TIME + number * 30),
+            "permalink": f"/r/python/comments/{link_id[3:]}/_/{comment_id}/",
+            "depth": depth,
+            "distinguished": "moderator" if number == 311 else None,
+            "stickied": False,
+            "replies": ""
+        }}
+
+    def thing(self, fullname: str):
+        """Resolves a fullname from the recording, or synthesizes it."""
+        if fullname in self.things:
+            return self.things[fullname]
+        kind, _, ident = fullname.partition("_")
+        rng = random.Random(_seed("info", fullname))
+        if kind == "t3":
+            payload = self.post("python", rng.randint(0, self.posts_per_subreddit))
+        elif kind == "t1":
+            payload = self.comment(f"t3_{_base36(rng.randint(1, 10 ** 6))}", rng.randint(0, 1000), "t3_x", 0)
+        else:
+            return None
+        payload["data"].update(id=ident, name=fullname)
+        return payload
+
+    # Endpoints ----------------------------------------------------------
+
+    def listing(self, subreddit: str, sort: str, params):
+        limit = min(int(params.get("limit", 25)), 100)
+        start = 0
+        after = params.get("after")
+        before = params.get("before")
+        if (after or before) and subreddit not in self._post_index:
+            self._post_index[subreddit] = {
+                self.post(subreddit, i)["data"]["name"]: i for i in range(self.posts_per_subreddit)
+            }
+        if after:
+            start = self._post_index[subreddit].get(after, -1) + 1
+        elif before:
+            # Post 0 is the newest; an unknown anchor yields nothing, as on Reddit.
+            end = self._post_index[subreddit].get(before, 0)
+            children = [self.post(subreddit, i) for i in range(max(end - limit, 0), end)]
+            previous = children[0]["data"]["name"] if children and end - limit > 0 else None
+            return {"kind": "Listing", "data": {"after": None, "before": previous, "dist": len(children), "children": children}}
+        children = [self.post(subreddit, i) for i in range(start, min(start + limit, self.posts_per_subreddit))]
+        if sort in ("top", "controversial"):
+            children.sort(key=lambda child: child["data"]["score"], reverse=(sort == "top"))
+        next_after = children[-1]["data"]["name"] if children and start + limit < self.posts_per_subreddit else None
+        return {"kind": "Listing", "data": {"after": next_after, "before": None, "dist": len(children), "children": children}}
+
+    def comments(self, article: str, params):
+        link_id = f"t3_{article}"
+        post = self.post("python", _seed("article", article) % self.posts_per_subreddit)
+        post["data"].update(id=article, name=link_id, author="op_user", num_comments=self.comments_per_post)
+        limit = min(int(params.get("limit", 200)), 500)
+        total = self.comments_per_post
+        number = 0
+        top_level = []
+        while number < min(limit, total):
+            node = self.comment(link_id, number, link_id, 0)
+            number += 1
+            replies = []
+            for _ in range(3):
+                if number >= min(limit, total):
+                    break
+                replies.append(self.comment(link_id, number, node["data"]["name"], 1))
+                number += 1
+            if replies:
+                node["data"]["replies"] = {"kind": "Listing", "data": {"children": replies, "after": None, "before": None}}
+            top_level.append(node)
+        if number < total:
+            remaining = [self.comment(link_id, n, link_id, 0)["data"]["id"] for n in range(number, total)]
+            top_level.append({"kind": "more", "data": {
+                "count": len(remaining), "name": f"t1_{remaining[0]}", "id": remaining[0],
+                "parent_id": link_id, "depth": 0, "children": remaining
+            }})
+        return [
+            {"kind": "Listing", "data": {"children": [post], "after": None, "before": None}},
+            {"kind": "Listing", "data": {"children": top_level, "after": None, "before": None}}
+        ]
+
+    def morechildren(self, params):
+        link_id = params.get("link_id", "t3_x")
+        if link_id not in self._comment_index:
+            self._comment_index[link_id] = {
+                self.comment(link_id, n, link_id, 0)["data"]["id"]: n for n in range(self.comments_per_post)
+            }
+        numbers = self._comment_index[link_id]
+        things = [
+            self.comment(link_id, numbers[ident], link_id, 0)
+            for ident in params.get("children", "").split(",") if ident in numbers
+        ]
+        return {"json": {"errors": [], "data": {"things": things}}}
+
+    def about_subreddit(self, subreddit: str):
+        rng = random.Random(_seed("about", subreddit))
+        return {"kind": "t5", "data": {
+            "id": _base36(_seed("sr", subreddit) % 36 ** 6),
+            "name": f"t5_{_base36(_seed('sr', subreddit) % 36 ** 6)}",
+            "display_name": subreddit,
+            "display_name_prefixed": f"r/{subreddit}",
+            "title": f"The r/{subreddit} community",
+            "public_description": f"Everything about {subreddit}.",
+            "description": "\n\n".join(f"* Sidebar rule {i}: be excellent to each other." for i in range(40)),
+            "subscribers": rng.randint(1000, 5_000_000),
+            "created_utc": float(BASE_TIME - rng.randint(10 ** 7, 4 * 10 ** 8)),
+            "over18": False,
+            "subreddit_type": "public",
+            "url": f"/r/{subreddit}/"
+        }}
+
+    def rules(self, subreddit: str):
+        return {"rules": [{
+            "kind": "all", "short_name": f"Rule {i}", "description": f"Rule {i} of r/{subreddit}.",
+            "violation_reason": f"Rule {i}", "created_utc": float(BASE_TIME), "priority": i
+        } for i in range(8)], "site_rules": ["Spam"]}
+
+    def moderators(self, subreddit: str):
+        return {"kind": "UserList", "data": {"children": [{
+            "name": f"mod{i}_{subreddit}", "id": f"t2_{_base36(_seed('mod', subreddit, i) % 36 ** 6)}",
+            "date": float(BASE_TIME), "mod_permissions": ["all"]
+        } for i in range(12)]}}
+
+    def about_user(self, username: str):
+        rng = random.Random(_seed("user", username))
+        return {"kind": "t2", "data": {
+            "name": username, "id": _base36(_seed("user-id", username) % 36 ** 6),
+            "link_karma": rng.randint(0, 10 ** 5), "comment_karma": rng.randint(0, 10 ** 6),
+            "created_utc": float(BASE_TIME - rng.randint(10 ** 6, 10 ** 8)), "is_suspended": False
+        }}
+
+    def user_comments(self, username: str, params):
+        limit = min(int(params.get("limit", 25)), 100)
+        link_id = f"t3_{_base36(_seed('user-link', username) % 36 ** 6)}"
+        children = []
+        for number in range(limit):
+            node = self.comment(link_id, number, link_id, 0)
+            node["data"].update(author=username, subreddit="python")
+            children.append(node)
+        return {"kind": "Listing", "data": {"after": None, "before": None, "children": children}}
+
+    def info(self, params):
+        children = []
+        for fullname in params.get("id", "").split(","):
+            payload = self.thing(fullname) if fullname else None
+            if payload is not None:
+                children.append(payload)
+        return {"kind": "Listing", "data": {"after": None, "before": None, "children": children}}
+
+    def route(self, method: str, path: str, params):
+        """Returns `(status, payload)` for a request."""
+        if path.endswith("/api/v1/access_token"):
+            return 200, {"access_token": "fake-token", "token_type": "bearer", "expires_in": 86400, "scope": "*"}
+        if path in self.fixtures:
+            return 200, self.fixtures[path]
+        parts = [part for part in path.split("/") if part]
+        if parts[:1] == ["r"] and len(parts) >= 3:
+            subreddit = parts[1]
+            if parts[2] in LISTING_SORTS:
+                return 200, self.listing(subreddit, parts[2], params)
+            if parts[2:] == ["about"]:
+                return 200, self.about_subreddit(subreddit)
+            if parts[2:] == ["about", "rules"]:
+                return 200, self.rules(subreddit)
+            if parts[2:] == ["about", "moderators"]:
+                return 200, self.moderators(subreddit)
+        if parts[:1] in (["best"], ["hot"], ["new"]):
+            return 200, self.listing("popular", parts[0], params)
+        if parts[:1] == ["comments"] and len(parts) >= 2:
+            return 200, self.comments(parts[1], params)
+        if parts == ["api", "morechildren"]:
+            return 200, self.morechildren(params)
+        if parts == ["api", "info"]:
+            return 200, self.info(params)
+        if parts[:1] == ["user"] and len(parts) >= 3:
+            if parts[2] == "about":
+                return 200, self.about_user(parts[1])
+            if parts[2] == "comments":
+                return 200, self.user_comments(parts[1], params)
+        return 404, {"message": "Not Found", "error": 404}
+
+
+class FakeRedditServer:
+    """Runs a Corpus behind a threaded HTTP server on localhost."""
+
+    def __init__(self, corpus=None, port=0, latency_ms=0.0):
+        self.corpus = corpus or Corpus()
+        self.latency = latency_ms / 1000.0
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self, method):
+                url = urlparse(self.path)
+                params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    body = self.rfile.read(length).decode()
+                    params.update({key: values[-1] for key, values in parse_qs(body).items()})
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                status, payload = server.corpus.route(method, url.path, params)
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("x-ratelimit-used", "1")
+                self.send_header("x-ratelimit-remaining", "100000")
+                self.send_header("x-ratelimit-reset", "600")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeRedditServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def record_fixtures(fixtures_dir: str) -> None:
+    """Captures RECORD_PATHS, plus one comment page, from the live API."""
+    import praw
+
+    reddit = praw.Reddit(
+        client_id=os.environ["REDDIT_CLIENT_ID"],
+        client_secret=os.environ["REDDIT_CLIENT_SECRET"],
+        refresh_token=os.environ["REDDIT_REFRESH_TOKEN"],
+        user_agent=os.environ["REDDIT_USER_AGENT"]
+    )
+    os.makedirs(fixtures_dir, exist_ok=True)
+    paths = list(RECORD_PATHS)
+    index = {}
+    while paths:
+        path, params = paths.pop(0)
+        payload = reddit.request(method="GET", path=path, params={**params, "raw_json": 1})
+        filename = path.strip("/").replace("/", "__") + ".json"
+        with open(os.path.join(fixtures_dir, filename), "w") as f:
+            json.dump(payload, f)
+        index[path] = filename
+        if path == "/r/python/hot":
+            first = payload["data"]["children"][0]["data"]["id"]
+            paths.append((f"/comments/{first}", {"limit": 500}))
+    with open(os.path.join(fixtures_dir, "index.json"), "w") as f:
+        json.dump(index, f, indent=2)
+    print(f"Recorded {len(index)} responses into {fixtures_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response.")
+    parser.add_argument("--fixtures", default=os.path.join(os.path.dirname(__file__), "fixtures"))
+    parser.add_argument("--record", action="store_true", help="Record fixtures from the live API and exit.")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.fixtures)
+        return
+    server = FakeRedditServer(Corpus(args.fixtures), port=args.port, latency_ms=args.latency_ms).start()
+    print(f"Fake Reddit API listening on {server.url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Offline throughput and latency benchmarks for reddit_server.py.
+
+Starts the fake Reddit API from fake_reddit.py on a local port, points the
+server's PRAW client at it, and drives tool calls through FastMCP's
+`call_tool`, so argument validation, the worker pool, caching, coalescing
+and result serialization are all part of the measurement.
+
+Two phases are run:
+  * per-tool: each tool is called `--calls` times at `--concurrency`, then a
+    short sequential pass under tracemalloc measures its peak memory;
+  * mix: a weighted mix of all tools, as a busy multi-agent client would
+    send, reported per tool and in total.
+Every phase starts with empty response and disk caches, and each run uses
+its own temporary REDDIT_MCP_DATA_DIR.
+
+For each tool the report shows p50/p95/p99 latency, calls per second,
+upstream requests per call, error count and peak memory.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --calls 500 --concurrency 32 --latency-ms 40
+    python benchmarks/run_benchmarks.py --tools get_hot_posts retrieve_post_comments --json bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.dirname(HERE))
+
+from fake_reddit import Corpus, FakeRedditServer  # noqa: E402
+
+SUBREDDITS = [f"sub{i}" for i in range(50)] + ["python", "askreddit"]
+USERS = [f"user{i}" for i in range(200)]
+
+
+def _post_ids(corpus, count):
+    return [corpus.post("python", i)["data"]["id"] for i in range(count)]
+
+
+def build_cases(corpus):
+    """Returns `{tool_name: (weight_in_mix, make_arguments(rng))}`."""
+    post_ids = _post_ids(corpus, 200)
+    return {
+        "get_hot_posts": (12, lambda rng: {"subreddit": rng.choice(SUBREDDITS), "limit": 25}),
+        "get_new_submissions": (10, lambda rng: {"subreddit": rng.choice(SUBREDDITS), "limit": 25}),
+        "get_top_posts": (6, lambda rng: {"subreddit": rng.choice(SUBREDDITS), "time_filter": "day", "limit": 25}),
+        "retrieve_reddit_posts": (4, lambda rng: {"subreddit": rng.choice(SUBREDDITS), "size": 100}),
+        "get_subreddit_details": (8, lambda rng: {"subreddit": rng.choice(SUBREDDITS)}),
+        "get_subreddit_rules": (8, lambda rng: {"subreddit": rng.choice(SUBREDDITS)}),
+        "get_moderators": (4, lambda rng: {"subreddit": rng.choice(SUBREDDITS)}),
+        "retrieve_specific_content": (8, lambda rng: {"id": f"t3_{rng.choice(post_ids)}"}),
+        "retrieve_contents_batch": (3, lambda rng: {"ids": [f"t3_{pid}" for pid in rng.sample(post_ids, 150)]}),
+        "retrieve_post_comments": (8, lambda rng: {"article": rng.choice(post_ids), "max_comments": 500, "replace_more_limit": 8}),
+        "find_best_answer_in_post": (4, lambda rng: {"post_id": rng.choice(post_ids), "strategy": "mod_reply"}),
+        "get_user_info": (3, lambda rng: {"username": rng.choice(USERS)}),
+        "get_user_comments": (3, lambda rng: {"username": rng.choice(USERS), "limit": 50}),
+    }
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def succeeded(result) -> bool:
+    if isinstance(result, tuple):
+        structured = result[1]
+        payload = structured.get("result", structured)
+    else:
+        payload = json.loads(result[0].text)
+    return bool(payload.get("successful"))
+
+
+def upstream_counts(server):
+    return {name: entry["upstream_requests"] for name, entry in server.metrics.snapshot()["tools"].items()}
+
+
+async def drive(server, calls, concurrency):
+    """Runs `(tool, arguments)` calls with bounded concurrency."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples = {}
+    errors = {}
+
+    async def one(name, arguments):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                ok = succeeded(await server.mcp.call_tool(name, arguments))
+            except Exception:
+                ok = False
+            samples.setdefault(name, []).append(time.perf_counter() - started)
+            if not ok:
+                errors[name] = errors.get(name, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(name, arguments) for name, arguments in calls))
+    return samples, errors, time.perf_counter() - started
+
+
+def reset_server_state(server):
+    server.response_cache.clear()
+    server.disk_cache.clear()
+
+
+def summarize(name, latencies, errors, elapsed, upstream, memory=None):
+    return {
+        "tool": name,
+        "calls": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "calls_per_second": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "upstream_per_call": round(upstream / len(latencies), 2) if latencies else None,
+        "peak_memory_kib": round(memory / 1024, 1) if memory is not None else None
+    }
+
+
+async def run(args, server, cases):
+    rng = random.Random(args.seed)
+    report = {"settings": vars(args), "per_tool": [], "mix": {}}
+
+    for name, (_, make) in cases.items():
+        reset_server_state(server)
+        before = upstream_counts(server).get(name, 0)
+        calls = [(name, make(rng)) for _ in range(args.calls)]
+        samples, errors, elapsed = await drive(server, calls, args.concurrency)
+        upstream = upstream_counts(server).get(name, 0) - before
+
+        reset_server_state(server)
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for _ in range(args.memory_calls):
+            await server.mcp.call_tool(name, make(rng))
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+        report["per_tool"].append(summarize(name, samples.get(name, []), errors.get(name, 0), elapsed, upstream, peak))
+
+    reset_server_state(server)
+    names = list(cases)
+    weights = [cases[name][0] for name in names]
+    calls = []
+    for _ in range(args.mix_calls):
+        name = rng.choices(names, weights)[0]
+        calls.append((name, cases[name][1](rng)))
+    before = upstream_counts(server)
+    samples, errors, elapsed = await drive(server, calls, args.concurrency)
+    after = upstream_counts(server)
+    all_latencies = [value for values in samples.values() for value in values]
+    report["mix"] = {
+        "total": summarize("(all)", all_latencies, sum(errors.values()), elapsed,
+                           sum(after.values()) - sum(before.values())),
+        "tools": [
+            summarize(name, samples[name], errors.get(name, 0), elapsed, after.get(name, 0) - before.get(name, 0))
+            for name in names if name in samples
+        ]
+    }
+    return report
+
+
+def print_table(title, rows):
+    columns = ["tool", "calls", "errors", "p50_ms", "p95_ms", "p99_ms", "calls_per_second", "upstream_per_call", "peak_memory_kib"]
+    widths = {column: max(len(column), *(len(str(row.get(column))) for row in rows)) for column in columns}
+    print(f"\n{title}")
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(str(row.get(column)).ljust(widths[column]) for column in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reddit_server.py against a local fake Reddit API.")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per tool in the per-tool phase.")
+    parser.add_argument("--mix-calls", type=int, default=1000, help="Calls in the mixed phase.")
+    parser.add_argument("--memory-calls", type=int, default=10, help="Sequential calls per tool traced for peak memory.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent in-flight tool calls.")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated network latency per upstream request.")
+    parser.add_argument("--tools", nargs="*", help="Only benchmark these tools.")
+    parser.add_argument("--fixtures", default=os.path.join(HERE, "fixtures"), help="Recorded responses to serve.")
+    parser.add_argument("--paced", action="store_true", help="Keep the server's default request pacing.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Also write the report to this file.")
+    args = parser.parse_args()
+
+    corpus = Corpus(args.fixtures)
+    fake = FakeRedditServer(corpus, latency_ms=args.latency_ms).start()
+    os.environ["REDDIT_OAUTH_URL"] = fake.url
+    os.environ["REDDIT_URL"] = fake.url
+    if not args.paced:
+        # Measure the server itself, not the politeness delay towards Reddit.
+        os.environ.setdefault("REDDIT_MCP_RATE", "100000")
+        os.environ.setdefault("REDDIT_MCP_BURST", "100000")
+    os.environ.setdefault("REDDIT_MCP_MAX_INFLIGHT", str(max(args.concurrency, 8)))
+    # A fresh data directory, so that no disk cache survives from earlier runs.
+    data_dir = tempfile.TemporaryDirectory(prefix="reddit-mcp-bench-")
+    os.environ["REDDIT_MCP_DATA_DIR"] = data_dir.name
+
+    import reddit_server
+
+    cases = build_cases(corpus)
+    if args.tools:
+        unknown = set(args.tools) - set(cases)
+        if unknown:
+            parser.error(f"No benchmark case for: {', '.join(sorted(unknown))}")
+        cases = {name: case for name, case in cases.items() if name in args.tools}
+
+    try:
+        report = asyncio.run(run(args, reddit_server, cases))
+    finally:
+        fake.stop()
+        data_dir.cleanup()
+
+    print_table(f"Per-tool ({args.calls} calls each, concurrency {args.concurrency}, {args.latency_ms} ms upstream latency)", report["per_tool"])
+    print_table(f"Mix ({args.mix_calls} calls)", report["mix"]["tools"] + [report["mix"]["total"]])
+    print(f"\nUpstream requests served by the fake API: {fake.requests}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
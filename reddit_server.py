@@ -1,12 +1,36 @@
 
+import time
+
+# Startup phase timestamps, reported by `--startup-profile`.
+_startup_marks = [("module_start", time.perf_counter())]
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import heapq
 import itertools  
+import json
+import math
 import os
-import praw
+import re
+import secrets
+import sqlite3
+import statistics
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import anyio
 from mcp.server.fastmcp import FastMCP, tools as mcp_tools
 from typing import Optional
 from typing import Dict, Any
 from datetime import datetime, timezone
-from dateutil.relativedelta import relativedelta
+
+# praw (with prawcore and requests) and dateutil are imported on first use:
+# MCP clients spawn this server per session, and most sessions never touch
+# the tools that need them before the first call anyway.
+_startup_marks.append(("imports", time.perf_counter()))
 
 
 def safe_execute(func, *args, **kwargs) -> Dict[str, Any]:
@@ -21,28 +45,1854 @@ def safe_execute(func, *args, **kwargs) -> Dict[str, Any]:
         return {"successful": True, "data": result, "error": None}
     except Exception as e:
         # If any error occurs, catch it and return a failure response
+        note_tool_error(e)
         return {"successful": False, "data": {}, "error": str(e)}
-# Environment variables
-os.environ["REDDIT_CLIENT_ID"] = "VoDq1m6w4nmuLk7oDUmN8Q"
-os.environ["REDDIT_CLIENT_SECRET"] = "rxSEa8e2uyFSK6cfrJVlAe_omhgsXQ"
-os.environ["REDDIT_USER_AGENT"] = "python:futuregen:v1.0 (by u/Striking_Economy698)"
-os.environ["REDDIT_REFRESH_TOKEN"] = "200334591410393-Uwlr-vfZ65KzOQGmmr2qCUV_TrT53w"
-
-# PRAW using refresh token
-reddit = praw.Reddit(
-    client_id=os.environ["REDDIT_CLIENT_ID"].strip(),
-    client_secret=os.environ["REDDIT_CLIENT_SECRET"].strip(),
-    refresh_token=os.environ["REDDIT_REFRESH_TOKEN"].strip(),
-    user_agent=os.environ["REDDIT_USER_AGENT"].strip()
-)
+
+
+def safe_execute_listing(func, *args, **kwargs) -> Dict[str, Any]:
+    """`safe_execute` for listing bodies that return `(items, cursors)`.
+
+    The items become 'data' and the `after`/`before` cursors are returned
+    next to them.
+    """
+    response = safe_execute(func, *args, **kwargs)
+    if response["successful"]:
+        items, cursors = response["data"]
+        response.update(cursors, data=items)
+    return response
+
+
+RESPONSE_FORMATS = ('records', 'columnar')
+FORMAT_ERROR = "Invalid format. Use 'records' or 'columnar'."
+
+
+def to_columnar(items: list) -> Dict[str, Any]:
+    """Packs a list of dicts as `{"fields": [...], "rows": [[...], ...]}`.
+
+    Field names are sent once instead of once per item; an item without a
+    field has None in that column.
+    """
+    fields = list(dict.fromkeys(key for item in items for key in item))
+    return {"fields": fields, "rows": [[item.get(field) for field in fields] for item in items]}
+
+
+def format_response(response: Dict[str, Any], format: str) -> Dict[str, Any]:
+    """Converts a successful list response's 'data' to the requested format."""
+    if format != 'columnar' or not response.get("successful"):
+        return response
+    return dict(response, data=to_columnar(response["data"]))
+
+
+TRUNCATION_MARK = "…"
+
+
+def _json_chars(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def fit_to_budget(data, max_chars: int, text_fields: tuple, optional_fields: tuple = ()) -> tuple:
+    """Shrinks `data`, a dict or a list of dicts, to about `max_chars` of JSON.
+
+    Optional fields are dropped first, in the order given. Then the texts in
+    `text_fields` are cut to one common length, chosen so that the longest
+    texts give up the most and short ones stay whole. Trailing list items
+    are dropped only if the others would not fit even with their texts cut
+    to nothing; callers that page must then resume from the last item kept.
+    Returns `(data, report)`, where `report` is None if nothing had to be
+    elided.
+    """
+    size = _json_chars(data)
+    if size <= max_chars:
+        return data, None
+    original = size
+    single = isinstance(data, dict)
+    items = [dict(data)] if single else [dict(item) for item in data]
+    if single:
+        size = _json_chars(items)
+    overhead = size - original  # the list brackets around a single item
+    budget = max_chars + overhead
+
+    fields_dropped = []
+    for field in optional_fields:
+        if size <= budget:
+            break
+        if any(field in item for item in items):
+            for item in items:
+                item.pop(field, None)
+            fields_dropped.append(field)
+            size = _json_chars(items)
+
+    items_dropped = 0
+    if not single and size > budget:
+        # Keep as many leading items as fit with every text cut to nothing.
+        used, keep = 2, 0
+        for item in items:
+            shortest = {field: TRUNCATION_MARK for field in text_fields if isinstance(item.get(field), str) and item[field]}
+            used += _json_chars(dict(item, **shortest)) + (2 if keep else 0)
+            if used > budget:
+                break
+            keep += 1
+        items_dropped = len(items) - keep
+        if items_dropped:
+            del items[keep:]
+            size = _json_chars(items)
+
+    texts = [(item, field, item[field]) for item in items for field in text_fields if isinstance(item.get(field), str)]
+    texts_truncated = 0
+    if size > budget and texts:
+        fixed = size - sum(_json_chars(text) for _, _, text in texts)
+
+        def cut(text, cap):
+            return text if len(text) <= cap else text[:cap] + TRUNCATION_MARK
+
+        def size_at(cap):
+            return fixed + sum(_json_chars(cut(text, cap)) for _, _, text in texts)
+
+        low, high = 0, max(len(text) for _, _, text in texts)
+        while low < high:
+            cap = (low + high + 1) // 2
+            if size_at(cap) <= budget:
+                low = cap
+            else:
+                high = cap - 1
+        for item, field, text in texts:
+            if len(text) > low:
+                item[field] = cut(text, low)
+                texts_truncated += 1
+        size = size_at(low)
+
+    returned = size - overhead
+    report = {
+        "original_chars": original,
+        "returned_chars": returned,
+        "chars_elided": original - returned,
+        "fields_dropped": fields_dropped,
+        "texts_truncated": texts_truncated,
+        "items_dropped": items_dropped
+    }
+    return (items[0] if single else items), report
+
+
+def budget_response(response: Dict[str, Any], max_chars: Optional[int], text_fields: tuple,
+                    optional_fields: tuple = ()) -> Dict[str, Any]:
+    """Applies `fit_to_budget` to a successful response's 'data'.
+
+    What was elided is reported under 'truncated'.
+    """
+    if max_chars is None or not response.get("successful"):
+        return response
+    data, report = fit_to_budget(response["data"], max_chars, text_fields, optional_fields)
+    if report is None:
+        return response
+    return dict(response, data=data, truncated=report)
+
+
+def budget_listing_response(response: Dict[str, Any], max_chars: Optional[int], text_fields: tuple,
+                            names: list, start: Optional[str]) -> Dict[str, Any]:
+    """`budget_response` for a listing page read from the `start` cursor.
+
+    `names` holds the fullname of each item in 'data'. If trailing items
+    had to be left out, 'after' is moved back to the last item returned, so
+    the next page starts with the first item left out.
+    """
+    budgeted = budget_response(response, max_chars, text_fields)
+    dropped = budgeted.get("truncated", {}).get("items_dropped")
+    if dropped:
+        kept = len(names) - dropped
+        budgeted["after"] = names[kept - 1] if kept else start
+    return budgeted
+
+
+# Environment variables (values already set in the environment take precedence)
+os.environ.setdefault("REDDIT_CLIENT_ID", "VoDq1m6w4nmuLk7oDUmN8Q")
+os.environ.setdefault("REDDIT_CLIENT_SECRET", "rxSEa8e2uyFSK6cfrJVlAe_omhgsXQ")
+os.environ.setdefault("REDDIT_USER_AGENT", "python:futuregen:v1.0 (by u/Striking_Economy698)")
+os.environ.setdefault("REDDIT_REFRESH_TOKEN", "200334591410393-Uwlr-vfZ65KzOQGmmr2qCUV_TrT53w")
+
+# Execution settings
+# Tool bodies are blocking PRAW calls, so they run on a bounded worker pool
+# instead of the FastMCP event loop. REDDIT_MCP_MAX_INFLIGHT caps how many
+# HTTP requests may be outstanding against Reddit at once, across all workers.
+WORKER_THREADS = int(os.environ.get("REDDIT_MCP_WORKERS", "16"))
+MAX_INFLIGHT_REQUESTS = int(os.environ.get("REDDIT_MCP_MAX_INFLIGHT", "8"))
+NATIVE_ASYNC = os.environ.get("REDDIT_MCP_NATIVE_ASYNC", "").lower() in ("1", "true", "yes")
+CACHE_MAX_ENTRIES = int(os.environ.get("REDDIT_MCP_CACHE_SIZE", "2048"))
+# Long-running reads stop after this many seconds and return what they have.
+DEADLINE_SECONDS = float(os.environ.get("REDDIT_MCP_DEADLINE_SECONDS", "50"))
+
+# On-disk state (persistent cache and friends) lives under this directory.
+DATA_DIR = os.environ.get("REDDIT_MCP_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "reddit-mcp")
+DISK_CACHE_MAX_MB = float(os.environ.get("REDDIT_MCP_DISK_CACHE_MB", "64"))
+# Local full-text index of fetched posts and comments.
+CORPUS_MAX_MB = float(os.environ.get("REDDIT_MCP_CORPUS_MB", "256"))
+CORPUS_RETENTION_DAYS = float(os.environ.get("REDDIT_MCP_CORPUS_RETENTION_DAYS", "30"))
+
+RATE_LIMIT_PER_SECOND = float(os.environ.get("REDDIT_MCP_RATE", "1.6"))
+RATE_LIMIT_BURST = int(os.environ.get("REDDIT_MCP_BURST", "10"))
+
+# Extra accounts for the client pool, as a JSON list or the path of a JSON
+# file; see load_account_configs().
+ACCOUNTS_CONFIG = os.environ.get("REDDIT_ACCOUNTS", "")
+WRITE_ACCOUNT = os.environ.get("REDDIT_WRITE_ACCOUNT", "default")
+POOL_STRATEGY = os.environ.get("REDDIT_MCP_POOL_STRATEGY", "least_loaded")
+
+_upstream_slots = threading.BoundedSemaphore(MAX_INFLIGHT_REQUESTS)
+
+# The priority lane of the tool call running in the current context.
+current_lane = contextvars.ContextVar("current_lane", default="interactive")
+
+
+class RequestScheduler:
+    """Paces upstream requests with a token bucket and serves priority lanes.
+
+    The bucket refills at REDDIT_MCP_RATE requests per second until Reddit's
+    X-Ratelimit-* headers have been seen; after that the refill rate spreads
+    the remaining budget evenly over the time left in the window, and
+    requests stop entirely once the budget is spent. Waiting requests are
+    granted strictly by lane priority, except that a request which has waited
+    longer than `starvation_seconds` is served next regardless of lane.
+    """
+
+    LANES = ("moderation", "interactive", "background")
+
+    def __init__(self, rate: float, burst: int, starvation_seconds: float = 30.0):
+        self.default_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.starvation_seconds = starvation_seconds
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._remaining = None
+        self._reset_at = None
+        self._cond = threading.Condition()
+        self._queues = {lane: deque() for lane in self.LANES}
+        self._stats = {lane: {"granted": 0, "wait_total": 0.0, "wait_max": 0.0} for lane in self.LANES}
+
+    def acquire(self, lane: str = "interactive") -> float:
+        """Blocks until the caller may send one request; returns the wait in seconds."""
+        if lane not in self._queues:
+            lane = "interactive"
+        ticket = (time.monotonic(), object())
+        with self._cond:
+            self._queues[lane].append(ticket)
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                delay = self._blocked_until - now if self._blocked_until > now else 0.0
+                if not delay and self._next_ticket(now) is ticket:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._queues[lane].popleft()
+                        waited = now - ticket[0]
+                        stats = self._stats[lane]
+                        stats["granted"] += 1
+                        stats["wait_total"] += waited
+                        stats["wait_max"] = max(stats["wait_max"], waited)
+                        self._cond.notify_all()
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+                # Waiters that are not next re-check periodically so a
+                # starving ticket is noticed even if nobody is granted.
+                self._cond.wait(timeout=delay or 1.0)
+
+    def update(self, headers, status_code: Optional[int] = None) -> None:
+        """Adjusts pacing from a response's X-Ratelimit-* headers."""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        with self._cond:
+            now = time.monotonic()
+            if remaining is not None and reset is not None:
+                self._refill(now)
+                self._remaining = float(remaining)
+                seconds_to_reset = max(float(reset), 1.0)
+                self._reset_at = now + seconds_to_reset
+                if self._remaining < 1:
+                    self._blocked_until = self._reset_at
+                else:
+                    self.rate = self._remaining / seconds_to_reset
+            if status_code == 429:
+                retry_after = headers.get("retry-after") or reset or 60
+                self._blocked_until = max(self._blocked_until, now + float(retry_after))
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            lanes = {}
+            for lane in self.LANES:
+                stats = self._stats[lane]
+                queue = self._queues[lane]
+                lanes[lane] = {
+                    "queue_depth": len(queue),
+                    "oldest_wait_seconds": round(now - queue[0][0], 3) if queue else 0.0,
+                    "granted": stats["granted"],
+                    "avg_wait_seconds": round(stats["wait_total"] / stats["granted"], 4) if stats["granted"] else 0.0,
+                    "max_wait_seconds": round(stats["wait_max"], 4)
+                }
+            return {
+                "lanes": lanes,
+                "tokens": round(self._tokens, 3),
+                "refill_rate_per_second": round(self.rate, 4),
+                "burst": self.burst,
+                "ratelimit_remaining": self._remaining,
+                "ratelimit_reset_seconds": round(self._reset_at - now, 1) if self._reset_at else None,
+                "blocked_seconds": round(max(self._blocked_until - now, 0.0), 1)
+            }
+
+    def pending(self) -> int:
+        """Number of requests currently waiting for a grant."""
+        with self._cond:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def blocked_seconds(self) -> float:
+        """Seconds until the scheduler grants again after a spent budget or 429."""
+        with self._cond:
+            return max(self._blocked_until - time.monotonic(), 0.0)
+
+    def _refill(self, now: float) -> None:
+        if self._reset_at is not None and now >= self._reset_at:
+            # The window rolled over without a fresh header; fall back.
+            self._reset_at = None
+            self._remaining = None
+            self.rate = self.default_rate
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _next_ticket(self, now: float):
+        heads = [self._queues[lane][0] for lane in self.LANES if self._queues[lane]]
+        if not heads:
+            return None
+        oldest = min(heads, key=lambda ticket: ticket[0])
+        if now - oldest[0] >= self.starvation_seconds:
+            return oldest
+        return heads[0]
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class ToolCall:
+    """Per-call bookkeeping shared by a tool's worker and fan-out threads."""
+
+    __slots__ = ("tool", "error", "http_status")
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.error = None
+        self.http_status = None
+
+
+current_call = contextvars.ContextVar("current_call", default=None)
+
+
+def note_tool_error(exc: Exception) -> None:
+    """Records the class of an exception a tool turned into an error response."""
+    call = current_call.get()
+    if call is not None:
+        call.error = type(exc).__name__
+
+
+class ServerMetrics:
+    """Thread-safe per-tool counters and latency histograms."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._tools = {}
+
+    def _tool(self, name: str) -> Dict[str, Any]:
+        entry = self._tools.get(name)
+        if entry is None:
+            entry = self._tools[name] = {
+                "calls": 0,
+                "errors": {},
+                "latency_buckets": [0] * (len(self.buckets) + 1),
+                "latency_sum": 0.0,
+                "latency_max": 0.0,
+                "upstream_requests": 0,
+                "upstream_bytes": 0,
+                "response_bytes": 0
+            }
+        return entry
+
+    def record_call(self, call: ToolCall, seconds: float, result) -> None:
+        error = call.error
+        if error is None and isinstance(result, dict) and result.get("successful") is False:
+            error = f"http_{call.http_status}" if call.http_status else "unsuccessful"
+        index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+        with self._lock:
+            entry = self._tool(call.tool)
+            entry["calls"] += 1
+            entry["latency_buckets"][index] += 1
+            entry["latency_sum"] += seconds
+            entry["latency_max"] = max(entry["latency_max"], seconds)
+            if error:
+                entry["errors"][error] = entry["errors"].get(error, 0) + 1
+
+    def record_response(self, tool: str, nbytes: int) -> None:
+        with self._lock:
+            self._tool(tool)["response_bytes"] += nbytes
+
+    def record_upstream(self, tool: Optional[str], nbytes: int) -> None:
+        with self._lock:
+            entry = self._tool(tool or "(none)")
+            entry["upstream_requests"] += 1
+            entry["upstream_bytes"] += nbytes
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            tools = {}
+            for name, entry in sorted(self._tools.items()):
+                calls = entry["calls"]
+                tools[name] = {
+                    "calls": calls,
+                    "errors": dict(entry["errors"]),
+                    "error_rate": round(sum(entry["errors"].values()) / calls, 4) if calls else None,
+                    "latency_avg_seconds": round(entry["latency_sum"] / calls, 4) if calls else None,
+                    "latency_max_seconds": round(entry["latency_max"], 4),
+                    "latency_p50_seconds": self._quantile(entry, 0.50),
+                    "latency_p95_seconds": self._quantile(entry, 0.95),
+                    "latency_p99_seconds": self._quantile(entry, 0.99),
+                    "latency_histogram": dict(zip([str(b) for b in self.buckets] + ["+Inf"], entry["latency_buckets"])),
+                    "upstream_requests": entry["upstream_requests"],
+                    "upstream_requests_per_call": round(entry["upstream_requests"] / calls, 3) if calls else None,
+                    "upstream_bytes": entry["upstream_bytes"],
+                    "response_bytes": entry["response_bytes"]
+                }
+            return {"uptime_seconds": round(time.time() - self.started_at, 1), "tools": tools}
+
+    def _quantile(self, entry: Dict[str, Any], q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th observation.
+        calls = entry["calls"]
+        if not calls:
+            return None
+        seen = 0
+        for bound, count in zip(self.buckets, entry["latency_buckets"]):
+            seen += count
+            if seen >= q * calls:
+                return bound
+        return round(entry["latency_max"], 4)
+
+    def prometheus(self) -> str:
+        """Renders the counters in the Prometheus text exposition format."""
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            tools = sorted(self._tools.items())
+            family("reddit_mcp_tool_calls_total", "counter", "Tool calls handled.")
+            for name, entry in tools:
+                lines.append(f'reddit_mcp_tool_calls_total{{tool="{name}"}} {entry["calls"]}')
+            family("reddit_mcp_tool_errors_total", "counter", "Tool calls that returned an error, by error class.")
+            for name, entry in tools:
+                for error, count in sorted(entry["errors"].items()):
+                    lines.append(f'reddit_mcp_tool_errors_total{{tool="{name}",error="{error}"}} {count}')
+            family("reddit_mcp_tool_latency_seconds", "histogram", "Tool call latency.")
+            for name, entry in tools:
+                cumulative = 0
+                for bound, count in zip([str(b) for b in self.buckets] + ["+Inf"], entry["latency_buckets"]):
+                    cumulative += count
+                    lines.append(f'reddit_mcp_tool_latency_seconds_bucket{{tool="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'reddit_mcp_tool_latency_seconds_sum{{tool="{name}"}} {entry["latency_sum"]:.6f}')
+                lines.append(f'reddit_mcp_tool_latency_seconds_count{{tool="{name}"}} {entry["calls"]}')
+            family("reddit_mcp_upstream_requests_total", "counter", "HTTP requests sent to Reddit.")
+            for name, entry in tools:
+                lines.append(f'reddit_mcp_upstream_requests_total{{tool="{name}"}} {entry["upstream_requests"]}')
+            family("reddit_mcp_upstream_bytes_total", "counter", "Response bytes received from Reddit.")
+            for name, entry in tools:
+                lines.append(f'reddit_mcp_upstream_bytes_total{{tool="{name}"}} {entry["upstream_bytes"]}')
+            family("reddit_mcp_response_bytes_total", "counter", "JSON bytes returned to MCP clients.")
+            for name, entry in tools:
+                lines.append(f'reddit_mcp_response_bytes_total{{tool="{name}"}} {entry["response_bytes"]}')
+        return "\n".join(lines) + "\n"
+
+
+metrics = ServerMetrics()
+
+
+@functools.cache
+def bounded_requestor_class():
+    """Builds the prawcore requestor class; deferred so prawcore loads lazily."""
+    import prawcore
+    import requests
+
+    class BoundedRequestor(prawcore.Requestor):
+        """A prawcore requestor that routes every API call through its account's scheduler.
+
+        Each request waits for a scheduler grant in the caller's lane, then holds
+        an upstream slot while it is on the wire. Token endpoint calls are not
+        rate limited by Reddit and skip the scheduler.
+        """
+
+        def __init__(self, *args, account=None, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.account = account
+            # Keep one pooled connection per allowed in-flight request.
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_INFLIGHT_REQUESTS)
+            self._http.mount("https://", adapter)
+            self._http.mount("http://", adapter)
+
+        def request(self, *args, **kwargs):
+            url = args[1] if len(args) > 1 else kwargs.get("url", "")
+            paced = "access_token" not in str(url)
+            if paced:
+                self.account.scheduler.acquire(current_lane.get())
+            try:
+                with _upstream_slots:
+                    response = super().request(*args, **kwargs)
+            except Exception as e:
+                self.account.record_failure(e)
+                raise
+            if paced:
+                self.account.scheduler.update(response.headers, response.status_code)
+            self.account.record_response(response.status_code)
+            call = current_call.get()
+            if call is not None and response.status_code >= 400:
+                call.http_status = response.status_code
+            metrics.record_upstream(call.tool if call else None, len(response.content or b""))
+            return response
+
+    return BoundedRequestor
+
+
+_async_upstream_slots = None
+
+
+@functools.cache
+def scheduled_async_requestor_class():
+    """Builds the asyncprawcore requestor class; asyncprawcore is optional."""
+    import contextlib
+    import asyncprawcore
+
+    class ScheduledAsyncRequestor(asyncprawcore.Requestor):
+        """The asyncpraw counterpart of BoundedRequestor.
+
+        The scheduler grant is waited for on a worker thread, since the
+        scheduler blocks, and an asyncio slot out of MAX_INFLIGHT_REQUESTS is
+        held while the request is on the wire. The body is read before it is
+        handed on, so its size can be recorded.
+        """
+
+        def __init__(self, *args, account=None, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.account = account
+
+        @contextlib.asynccontextmanager
+        async def request(self, *args, **kwargs):
+            global _async_upstream_slots
+            if _async_upstream_slots is None:
+                _async_upstream_slots = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+            url = args[1] if len(args) > 1 else kwargs.get("url", "")
+            paced = "access_token" not in str(url)
+            if paced:
+                await anyio.to_thread.run_sync(self.account.scheduler.acquire, current_lane.get())
+            received = False
+            try:
+                async with _async_upstream_slots, super().request(*args, **kwargs) as response:
+                    body = await response.read()
+                    received = True
+                    if paced:
+                        self.account.scheduler.update(response.headers, response.status)
+                    self.account.record_response(response.status)
+                    call = current_call.get()
+                    if call is not None and response.status >= 400:
+                        call.http_status = response.status
+                    metrics.record_upstream(call.tool if call else None, len(body))
+                    yield response
+            except Exception as e:
+                if not received:
+                    self.account.record_failure(e)
+                raise
+
+    return ScheduledAsyncRequestor
+
+
+def load_account_configs() -> list:
+    """Returns the credential sets for the client pool.
+
+    The REDDIT_* environment variables always define the account named
+    'default'. REDDIT_ACCOUNTS may add more, either as a JSON list or as the
+    path of a file holding one; each entry needs 'client_id',
+    'client_secret' and 'refresh_token', and may set 'name' and
+    'user_agent'.
+    """
+    configs = [{
+        "name": "default",
+        "client_id": os.environ["REDDIT_CLIENT_ID"],
+        "client_secret": os.environ["REDDIT_CLIENT_SECRET"],
+        "refresh_token": os.environ["REDDIT_REFRESH_TOKEN"],
+        "user_agent": os.environ["REDDIT_USER_AGENT"]
+    }]
+    raw = ACCOUNTS_CONFIG.strip()
+    if raw and not raw.startswith("["):
+        with open(raw) as f:
+            raw = f.read()
+    for index, entry in enumerate(json.loads(raw) if raw else [], start=1):
+        missing = [key for key in ("client_id", "client_secret", "refresh_token") if not entry.get(key)]
+        if missing:
+            raise ValueError(f"REDDIT_ACCOUNTS entry {index} is missing {', '.join(missing)}.")
+        configs.append(dict(entry, name=entry.get("name") or f"account{index}",
+                            user_agent=entry.get("user_agent") or os.environ["REDDIT_USER_AGENT"]))
+    names = [config["name"] for config in configs]
+    if len(set(names)) != len(names):
+        raise ValueError("REDDIT_ACCOUNTS account names must be unique.")
+    return configs
+
+
+class RedditAccount:
+    """One set of Reddit credentials with its own client, scheduler and health.
+
+    The praw client (and praw itself) is only built when the account first
+    serves a call. After `FAILURE_THRESHOLD` consecutive server errors or
+    transport failures the account is skipped for reads for
+    `COOLDOWN_SECONDS`.
+    """
+
+    FAILURE_THRESHOLD = 3
+    COOLDOWN_SECONDS = 60.0
+
+    def __init__(self, config: Dict[str, Any]):
+        self.name = config["name"]
+        self.config = config
+        self.scheduler = RequestScheduler(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        self.in_flight = 0
+        self.calls = 0
+        self.upstream_requests = 0
+        self.failures = 0
+        self.last_error = None
+        self.cooldown_until = 0.0
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    def get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def _create_client(self):
+        import praw
+
+        # PRAW using refresh token
+        return praw.Reddit(
+            client_id=self.config["client_id"].strip(),
+            client_secret=self.config["client_secret"].strip(),
+            refresh_token=self.config["refresh_token"].strip(),
+            user_agent=self.config["user_agent"].strip(),
+            oauth_url=os.environ.get("REDDIT_OAUTH_URL", "https://oauth.reddit.com"),
+            reddit_url=os.environ.get("REDDIT_URL", "https://www.reddit.com"),
+            requestor_class=bounded_requestor_class(),
+            requestor_kwargs={"account": self}
+        )
+
+    def get_async_client(self):
+        """Returns the account's asyncpraw client; call it from the event loop."""
+        if self._async_client is None:
+            import asyncpraw
+
+            self._async_client = asyncpraw.Reddit(
+                client_id=self.config["client_id"].strip(),
+                client_secret=self.config["client_secret"].strip(),
+                refresh_token=self.config["refresh_token"].strip(),
+                user_agent=self.config["user_agent"].strip(),
+                oauth_url=os.environ.get("REDDIT_OAUTH_URL", "https://oauth.reddit.com"),
+                reddit_url=os.environ.get("REDDIT_URL", "https://www.reddit.com"),
+                requestor_class=scheduled_async_requestor_class(),
+                requestor_kwargs={"account": self}
+            )
+        return self._async_client
+
+    def record_response(self, status_code: int) -> None:
+        with self._lock:
+            self.upstream_requests += 1
+            if status_code >= 500 or status_code == 401:
+                self._fail(f"HTTP {status_code}")
+            else:
+                self.failures = 0
+
+    def record_failure(self, exc: Exception) -> None:
+        with self._lock:
+            self.upstream_requests += 1
+            self._fail(type(exc).__name__)
+
+    def _fail(self, reason: str) -> None:
+        self.failures += 1
+        self.last_error = reason
+        if self.failures >= self.FAILURE_THRESHOLD:
+            self.cooldown_until = time.monotonic() + self.COOLDOWN_SECONDS
+
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.cooldown_until
+
+    def available(self) -> bool:
+        return self.healthy() and not self.scheduler.blocked_seconds()
+
+    def load(self) -> int:
+        return self.in_flight + self.scheduler.pending()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy(),
+            "cooldown_seconds": round(max(self.cooldown_until - time.monotonic(), 0.0), 1),
+            "consecutive_failures": self.failures,
+            "last_error": self.last_error,
+            "in_flight_calls": self.in_flight,
+            "calls": self.calls,
+            "upstream_requests": self.upstream_requests,
+            "client_built": self._client is not None,
+            "rate": self.scheduler.stats()
+        }
+
+
+# The pool account serving the tool call running in the current context.
+current_account = contextvars.ContextVar("current_account", default=None)
+
+
+class ClientPool:
+    """A pool of Reddit accounts that stands in for a single praw.Reddit client.
+
+    Attribute access is forwarded to the client of the account serving the
+    current tool call (the write account outside of tool calls), so tool
+    bodies use `reddit` exactly as they would a praw.Reddit instance.
+
+    Reads are spread over the healthy accounts that are not rate blocked,
+    either to the least loaded one (in-flight calls plus queued requests,
+    ties broken round-robin) or strictly round-robin. Writes, and reads that
+    depend on who is logged in, always go to the write account.
+    """
+
+    STRATEGIES = ("least_loaded", "round_robin")
+
+    def __init__(self, configs: list, write_account: str = "default", strategy: str = "least_loaded"):
+        self.accounts = [RedditAccount(config) for config in configs]
+        by_name = {account.name: account for account in self.accounts}
+        if write_account not in by_name:
+            raise ValueError(f"REDDIT_WRITE_ACCOUNT '{write_account}' is not a configured account.")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"REDDIT_MCP_POOL_STRATEGY must be one of {', '.join(self.STRATEGIES)}.")
+        self.owner = by_name[write_account]
+        self.strategy = strategy
+        self._turn = itertools.count()
+
+    def select(self, pinned: bool = False) -> RedditAccount:
+        """Picks the account for a call; `pinned` calls use the write account."""
+        if pinned or len(self.accounts) == 1:
+            return self.owner
+        candidates = [account for account in self.accounts if account.available()] or self.accounts
+        start = next(self._turn) % len(candidates)
+        rotated = candidates[start:] + candidates[:start]
+        if self.strategy == "round_robin":
+            return rotated[0]
+        return min(rotated, key=RedditAccount.load)
+
+    def current(self) -> RedditAccount:
+        return current_account.get() or self.owner
+
+    def get_client(self):
+        return self.current().get_client()
+
+    def scheduler_stats(self) -> Dict[str, Any]:
+        return {
+            "write_account": self.owner.name,
+            "accounts": {account.name: account.scheduler.stats() for account in self.accounts}
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "write_account": self.owner.name,
+            "accounts": {account.name: account.stats() for account in self.accounts}
+        }
+
+    def __getattr__(self, name):
+        return getattr(self.get_client(), name)
+
+
+reddit = ClientPool(load_account_configs(), WRITE_ACCOUNT, POOL_STRATEGY)
+
+class MeteredFastMCP(FastMCP):
+    """FastMCP that counts the bytes of each tool result it sends.
+
+    The text content FastMCP serialized for the client is measured, so
+    results are not serialized a second time, on the event loop, just to
+    be counted.
+    """
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        result = await super().call_tool(name, arguments)
+        content = result[0] if isinstance(result, tuple) else result
+        metrics.record_response(name, sum(len(getattr(block, "text", "")) for block in content))
+        return result
+
 
 # MCP server must be global
-mcp = FastMCP("reddit")
+mcp = MeteredFastMCP("reddit")
+_startup_marks.append(("server_setup", time.perf_counter()))
+
+_worker_limiter = anyio.CapacityLimiter(WORKER_THREADS)
+
+
+async def get_async_reddit():
+    """Returns the asyncpraw client of the account serving the current call.
+
+    asyncpraw is an optional dependency that is only needed when
+    REDDIT_MCP_NATIVE_ASYNC is enabled. Its requests go through the
+    account's scheduler, like those of the praw clients.
+    """
+    return reddit.current().get_async_client()
+
+
+@functools.cache
+def _native_async_available() -> bool:
+    if not NATIVE_ASYNC:
+        return False
+    try:
+        import asyncpraw  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class TTLCache:
+    """A thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+
+    Keys are `(tool_name, args)` tuples as built by `cache_key`. Hit, miss,
+    expiry and eviction counters are kept for `get_cache_stats`.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """Returns `(True, value)` for a live entry, otherwise `(False, None)`."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key, value, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, tool_names, **match) -> int:
+        """Drops every entry for `tool_names` whose arguments include `match`."""
+        match = dict(_normalize_args(match))
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] in tool_names
+                and all(dict(key[1]).get(name) == value for name, value in match.items())
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def invalidate_key(self, key) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+
+def _normalize_args(kwargs: Dict[str, Any]) -> tuple:
+    # Subreddit and user names are case-insensitive on Reddit.
+    normalized = []
+    for name, value in sorted(kwargs.items()):
+        if name in ("subreddit", "username") and isinstance(value, str):
+            value = value.strip().lower()
+        elif isinstance(value, list):
+            value = tuple(value)
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def cache_key(tool_name: str, kwargs: Dict[str, Any]) -> tuple:
+    return (tool_name, _normalize_args(kwargs))
+
+
+response_cache = TTLCache(CACHE_MAX_ENTRIES)
+
+
+def open_database(filename: str) -> sqlite3.Connection:
+    """Opens a SQLite database under DATA_DIR for use by the current thread.
+
+    WAL mode lets several server processes read while one writes, and the
+    busy timeout makes writers queue instead of failing on a locked database.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+    connection = sqlite3.connect(os.path.join(DATA_DIR, filename), timeout=10.0, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+# Seconds a persisted object stays fresh, by kind.
+DISK_CACHE_TTLS = {
+    "submission": 900,
+    "comments": 600,
+    "trophies": 86400,
+    "created_utc": 30 * 86400
+}
+
+
+class DiskCache:
+    """A SQLite-backed object cache that survives restarts.
+
+    Entries are keyed by the Reddit fullname of the object (with a suffix
+    where one object has several cached views) and expire after the TTL of
+    their kind. When the stored payload grows past `max_bytes`, expired and
+    then least recently used entries are deleted. The database is opened on
+    first use. Failures are counted and treated as misses, so a broken or
+    busy cache never fails a tool call.
+    """
+
+    EVICT_EVERY = 64
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(self, filename: str, max_bytes: int, ttls: Dict[str, float]):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.ttls = ttls
+        self.enabled = max_bytes > 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = open_database(self.filename)
+            # Incremental auto-vacuum only takes effect on a new database.
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                " key TEXT PRIMARY KEY, kind TEXT NOT NULL, data TEXT NOT NULL, size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS objects_accessed ON objects (accessed_at)")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def get(self, key: str):
+        """Returns `(found, value)`; expired entries are misses."""
+        if not self.enabled:
+            return False, None
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT data, expires_at, accessed_at FROM objects WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is None or row[1] <= now:
+                self._count("misses")
+                return False, None
+            if now - row[2] > self.TOUCH_INTERVAL:
+                connection.execute("UPDATE objects SET accessed_at = ? WHERE key = ?", (now, key))
+            self._count("hits")
+            return True, json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError):
+            self._count("errors")
+            return False, None
+
+    def set(self, key: str, kind: str, value) -> None:
+        if not self.enabled:
+            return
+        try:
+            data = json.dumps(value)
+            now = time.time()
+            self._connection().execute(
+                "INSERT OR REPLACE INTO objects (key, kind, data, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, data, len(data), now + self.ttls[kind], now)
+            )
+            self._count("writes")
+            with self._lock:
+                self._writes += 1
+                due = self._writes % self.EVICT_EVERY == 0
+            if due:
+                self.evict()
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            self._count("errors")
+
+    def delete(self, key: str) -> None:
+        """Drops an object and every view cached under it."""
+        if not self.enabled:
+            return
+        try:
+            self._connection().execute(
+                "DELETE FROM objects WHERE key = ? OR substr(key, 1, ?) = ?", (key, len(key) + 1, key + "/")
+            )
+        except (sqlite3.Error, OSError):
+            self._count("errors")
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        if not self.enabled:
+            return
+        try:
+            self._connection().execute("DELETE FROM objects")
+        except (sqlite3.Error, OSError):
+            self._count("errors")
+
+    def evict(self) -> int:
+        """Drops expired entries, then the least recently used ones over the size bound."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            removed = connection.execute("DELETE FROM objects WHERE expires_at <= ?", (time.time(),)).rowcount
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes * 0.9
+                doomed, freed = [], 0
+                for key, size in connection.execute("SELECT key, size FROM objects ORDER BY accessed_at"):
+                    if freed >= excess:
+                        break
+                    doomed.append((key,))
+                    freed += size
+                connection.executemany("DELETE FROM objects WHERE key = ?", doomed)
+                removed += len(doomed)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if removed:
+            connection.execute("PRAGMA incremental_vacuum")
+        self._count("evictions", removed)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(enabled=self.enabled, path=os.path.join(DATA_DIR, self.filename), max_bytes=self.max_bytes)
+        if self.enabled:
+            try:
+                entries, size = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects"
+                ).fetchone()
+                stats.update(entries=entries, bytes=size)
+            except (sqlite3.Error, OSError):
+                stats["errors"] += 1
+        return stats
+
+
+disk_cache = DiskCache("cache.sqlite3", int(DISK_CACHE_MAX_MB * 1024 * 1024), DISK_CACHE_TTLS)
+
+CORPUS_FLUSH_SECONDS = 2.0
+CORPUS_PENDING_MAX = 20000
+CORPUS_TIME_RANGES = {
+    'hour': 3600, 'day': 86400, 'week': 7 * 86400, 'month': 30 * 86400, 'year': 365 * 86400, 'all': None
+}
+CORPUS_SORTS = ('relevance', 'new', 'top')
+
+
+class CorpusIndex:
+    """A local SQLite FTS5 index of the posts and comments the server fetched.
+
+    Listing pages and comment trees hand their raw things to `add()`, which
+    only queues them; the background poller writes the queue in one
+    transaction every CORPUS_FLUSH_SECONDS, so tool calls never wait on the
+    index. A thing seen again is updated in place. Things not seen for
+    CORPUS_RETENTION_DAYS are dropped, and when the database grows past
+    `max_bytes` the least recently seen ones go first. Like DiskCache,
+    failures are counted and never fail a tool call.
+    """
+
+    def __init__(self, filename: str, max_bytes: int):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.enabled = max_bytes > 0
+        self._local = threading.local()
+        self._pending = deque(maxlen=CORPUS_PENDING_MAX)
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self._stats = {"queued": 0, "written": 0, "evictions": 0, "errors": 0}
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = open_database(self.filename)
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS things (
+                    id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, kind TEXT NOT NULL,
+                    subreddit TEXT, author TEXT, created_utc REAL, score INTEGER, title TEXT,
+                    body TEXT, permalink TEXT, link_id TEXT, seen_at REAL NOT NULL);
+                CREATE INDEX IF NOT EXISTS things_subreddit ON things (subreddit, created_utc);
+                CREATE INDEX IF NOT EXISTS things_created ON things (created_utc);
+                CREATE INDEX IF NOT EXISTS things_seen ON things (seen_at);
+                CREATE VIRTUAL TABLE IF NOT EXISTS things_fts USING fts5(
+                    title, body, content='things', content_rowid='id', tokenize='porter unicode61');
+                CREATE TRIGGER IF NOT EXISTS things_insert AFTER INSERT ON things BEGIN
+                    INSERT INTO things_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+                END;
+                CREATE TRIGGER IF NOT EXISTS things_delete AFTER DELETE ON things BEGIN
+                    INSERT INTO things_fts (things_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+                END;
+                CREATE TRIGGER IF NOT EXISTS things_update AFTER UPDATE OF title, body ON things
+                WHEN old.title IS NOT new.title OR old.body IS NOT new.body BEGIN
+                    INSERT INTO things_fts (things_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+                    INSERT INTO things_fts (rowid, title, body) VALUES (new.id, new.title, new.body);
+                END;
+            """)
+            self._local.connection = connection
+        return connection
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def add(self, children) -> None:
+        """Queues raw `t3`/`t1` listing children for indexing."""
+        if not self.enabled:
+            return
+        things = [child for child in children if child.get("kind") in ("t3", "t1")]
+        if not things:
+            return
+        self._pending.extend(things)
+        self._count("queued", len(things))
+        if not self._scheduled:
+            self._scheduled = True
+            poller.schedule("corpus/flush", CORPUS_FLUSH_SECONDS, self.flush, run_now=False)
+
+    @staticmethod
+    def _row(kind: str, data: Dict[str, Any], now: float) -> tuple:
+        if kind == "t3":
+            title, body, link_id = data.get("title"), data.get("selftext") or None, data.get("name")
+        else:
+            title, body, link_id = data.get("link_title"), data.get("body"), data.get("link_id")
+        return (
+            data.get("name") or f"{kind}_{data.get('id')}", kind, (data.get("subreddit") or "").lower() or None,
+            data.get("author"), data.get("created_utc"), data.get("score"), title, body,
+            data.get("permalink"), link_id, now
+        )
+
+    def flush(self) -> int:
+        """Writes the queued things; returns how many were written."""
+        batch = []
+        while self._pending and len(batch) < CORPUS_PENDING_MAX:
+            try:
+                batch.append(self._pending.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return 0
+        now = time.time()
+        rows = [self._row(child["kind"], child["data"], now) for child in batch if child.get("data")]
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT INTO things (name, kind, subreddit, author, created_utc, score, title, body, permalink, link_id, seen_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (name) DO UPDATE SET score = excluded.score, title = COALESCE(excluded.title, title),"
+                    " body = excluded.body, seen_at = excluded.seen_at",
+                    rows
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            self._count("written", len(rows))
+            self.evict()
+        except (sqlite3.Error, OSError):
+            self._count("errors")
+        return len(rows)
+
+    def _used_bytes(self, connection: sqlite3.Connection) -> int:
+        pages = connection.execute("PRAGMA page_count").fetchone()[0] - connection.execute("PRAGMA freelist_count").fetchone()[0]
+        return pages * connection.execute("PRAGMA page_size").fetchone()[0]
+
+    def evict(self) -> int:
+        """Drops things not seen within the retention window, then the least recently seen over the size bound."""
+        connection = self._connection()
+        removed = connection.execute(
+            "DELETE FROM things WHERE seen_at < ?", (time.time() - CORPUS_RETENTION_DAYS * 86400,)
+        ).rowcount
+        used = self._used_bytes(connection)
+        if used > self.max_bytes:
+            total = connection.execute("SELECT COUNT(*) FROM things").fetchone()[0]
+            doomed = max(int(total * (1 - self.max_bytes * 0.9 / used)), 1)
+            removed += connection.execute(
+                "DELETE FROM things WHERE id IN (SELECT id FROM things ORDER BY seen_at LIMIT ?)", (doomed,)
+            ).rowcount
+        if removed:
+            # Merge the index segments so the deleted entries actually free pages.
+            connection.execute("INSERT INTO things_fts (things_fts) VALUES ('optimize')")
+            connection.execute("PRAGMA incremental_vacuum")
+            self._count("evictions", removed)
+        return removed
+
+    def search(self, query: str, subreddit: Optional[str] = None, time_range: str = 'all', kind: Optional[str] = None,
+               author: Optional[str] = None, sort: str = 'relevance', limit: int = 25) -> list:
+        self.flush()
+        clauses, params = ["things_fts MATCH ?"], [query]
+        if subreddit:
+            clauses.append("t.subreddit = ?")
+            params.append(subreddit.strip().lower().removeprefix('r/'))
+        if CORPUS_TIME_RANGES[time_range] is not None:
+            clauses.append("t.created_utc >= ?")
+            params.append(time.time() - CORPUS_TIME_RANGES[time_range])
+        if kind:
+            clauses.append("t.kind = ?")
+            params.append(kind)
+        if author:
+            clauses.append("t.author = ?")
+            params.append(author)
+        order = {"relevance": "rank", "new": "t.created_utc DESC", "top": "t.score DESC"}[sort]
+        sql = (
+            "SELECT t.name, t.kind, t.subreddit, t.author, t.created_utc, t.score, t.title, t.permalink, t.link_id,"
+            " snippet(things_fts, -1, '[', ']', '…', 16), bm25(things_fts, 2.0, 1.0) AS rank"
+            f" FROM things_fts JOIN things t ON t.id = things_fts.rowid WHERE {' AND '.join(clauses)}"
+            f" ORDER BY {order} LIMIT ?"
+        )
+        connection = self._connection()
+        try:
+            rows = connection.execute(sql, params + [limit]).fetchall()
+        except sqlite3.OperationalError:
+            # Not valid FTS5 query syntax: search for the words as given.
+            params[0] = " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+            rows = connection.execute(sql, params + [limit]).fetchall()
+        columns = ("fullname", "type", "subreddit", "author", "created_utc", "score", "title", "permalink", "link_id", "snippet")
+        results = []
+        for row in rows:
+            result = dict(zip(columns, row))
+            result["type"] = "post" if result["type"] == "t3" else "comment"
+            result["rank"] = round(-row[-1], 4)
+            results.append(result)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(enabled=self.enabled, path=os.path.join(DATA_DIR, self.filename), max_bytes=self.max_bytes,
+                     pending=len(self._pending))
+        if self.enabled:
+            try:
+                connection = self._connection()
+                stats.update(things=connection.execute("SELECT COUNT(*) FROM things").fetchone()[0],
+                             bytes=self._used_bytes(connection))
+            except (sqlite3.Error, OSError):
+                stats["errors"] += 1
+        return stats
+
+
+corpus_index = CorpusIndex("corpus.sqlite3", int(CORPUS_MAX_MB * 1024 * 1024))
+
+# Single-flight table: identical concurrent calls of a read-only tool share
+# one upstream fetch. Only touched from the event loop, so no lock.
+_inflight_calls = {}
+_single_flight_stats = {"leaders": 0, "coalesced": 0}
+
+
+def single_flight_stats() -> Dict[str, Any]:
+    return {"in_flight": len(_inflight_calls), **_single_flight_stats}
+
+
+PARTIAL_RESULT_TTL = 600
+
+# Progress of the in-flight calls of tools registered with `progress=True`,
+# keyed like _inflight_calls.
+_inflight_progress = {}
+
+# Results of calls that every client cancelled, keyed by the token announced
+# in their progress notifications.
+_partial_results = TTLCache(128)
+
+current_progress = contextvars.ContextVar("current_progress", default=None)
+
+
+class CallProgress:
+    """Progress, deadline and cancellation of one long-running tool call.
+
+    The tool body calls `report_progress()` from its worker thread after
+    each page. That sends an MCP progress notification to every client
+    waiting on the call (coalesced calls share one CallProgress) and returns
+    False once the deadline has passed or every client has cancelled; the
+    body then stops reading and returns what it has, marked partial, with a
+    cursor to resume from. A cancelled call's result cannot be sent back on
+    its request, so it is kept under the token named in the notifications
+    and can be fetched with `get_partial_result`.
+    """
+
+    def __init__(self, deadline_seconds: Optional[float]):
+        self.loop = asyncio.get_running_loop()
+        self.deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        self.token = secrets.token_urlsafe(12)
+        self.contexts = []
+        self.waiters = 0
+        self.cancelled = False
+
+    def attach(self, ctx) -> None:
+        self.waiters += 1
+        if ctx is not None:
+            self.contexts.append(ctx)
+
+    def detach(self, ctx, cancelled: bool) -> None:
+        self.waiters -= 1
+        if ctx is not None:
+            self.contexts.remove(ctx)
+        if cancelled and self.waiters == 0:
+            self.cancelled = True
+
+    def update(self, done: float, total: Optional[float], message: str) -> bool:
+        if self.cancelled or (self.deadline is not None and time.monotonic() >= self.deadline):
+            return False
+        if self.contexts:
+            message = f"{message} (partial result token: {self.token})"
+            self.loop.call_soon_threadsafe(self._notify, done, total, message)
+        return True
+
+    def _notify(self, done, total, message) -> None:
+        for ctx in self.contexts:
+            task = asyncio.ensure_future(ctx.report_progress(done, total, message))
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+
+def progress_context():
+    """The FastMCP context of the current request, if the client asked for progress."""
+    try:
+        ctx = mcp.get_context()
+        meta = ctx.request_context.meta
+    except (LookupError, ValueError):
+        return None
+    return ctx if meta is not None and meta.progressToken is not None else None
+
+
+def report_progress(done: float, total: Optional[float] = None, message: str = "") -> bool:
+    """Reports the current call's progress; returns False when it should stop early."""
+    progress = current_progress.get()
+    return progress is None or progress.update(done, total, message)
+
+# Fan-out work inside a single tool call (batched lookups, parallel shards)
+# runs here rather than on the tool worker pool, so a tool waiting on its
+# own sub-requests can never starve the pool it is running on.
+_fanout_executor = ThreadPoolExecutor(max_workers=MAX_INFLIGHT_REQUESTS, thread_name_prefix="reddit-fanout")
+
+
+def run_concurrently(func, items) -> list:
+    """Calls `func(item)` for every item concurrently, preserving input order.
+
+    Each element of the returned list is `(True, result)` or
+    `(False, exception)`, so one failed item does not discard the others.
+    """
+    def call(item):
+        try:
+            return True, func(item)
+        except Exception as e:
+            return False, e
+
+    items = list(items)
+    if len(items) <= 1:
+        return [call(item) for item in items]
+    futures = [_fanout_executor.submit(contextvars.copy_context().run, call, item) for item in items]
+    return [future.result() for future in futures]
+
+
+class BackgroundPoller:
+    """Runs periodic upstream refresh jobs on a single daemon thread.
+
+    Jobs run one at a time in the scheduler's "background" lane, or the
+    lane they were scheduled with, on an account picked by the client pool
+    (the write account for `pinned` jobs). Their upstream requests are
+    counted in the server metrics under 'poller:<key>'. The thread starts
+    with the first scheduled job.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def schedule(self, key: str, interval: float, func, pinned: bool = False, run_now: bool = True, lane: str = "background") -> None:
+        """Runs `func()` every `interval` seconds until `cancel(key)`."""
+        with self._cond:
+            now = time.monotonic()
+            job = self._jobs.get(key)
+            if job is None:
+                job = {"runs": 0, "errors": 0, "last_error": None, "last_run": None,
+                       "due": now if run_now else now + max(float(interval), 1.0)}
+            job.update(interval=max(float(interval), 1.0), func=func, pinned=pinned, lane=lane)
+            if job["last_run"] is not None:
+                job["due"] = min(job["due"], now + job["interval"])
+            self._jobs[key] = job
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="reddit-poller", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def cancel(self, key: str) -> bool:
+        with self._cond:
+            return self._jobs.pop(key, None) is not None
+
+    def interval(self, key: str) -> Optional[float]:
+        with self._cond:
+            job = self._jobs.get(key)
+            return job["interval"] if job else None
+
+    def jobs(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                key: {
+                    "interval_seconds": job["interval"],
+                    "next_run_seconds": round(max(job["due"] - now, 0.0), 1),
+                    "runs": job["runs"],
+                    "errors": job["errors"],
+                    "last_error": job["last_error"],
+                    "last_run_seconds_ago": round(now - job["last_run"], 1) if job["last_run"] else None
+                }
+                for key, job in sorted(self._jobs.items())
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                due = min(self._jobs.items(), key=lambda item: item[1]["due"], default=None)
+                if due is None or due[1]["due"] > now:
+                    self._cond.wait(timeout=due[1]["due"] - now if due else None)
+                    continue
+                key, job = due
+                job["due"] = now + job["interval"]
+            error = contextvars.Context().run(self._run_job, key, job)
+            with self._cond:
+                job["runs"] += 1
+                job["last_run"] = time.monotonic()
+                if error:
+                    job["errors"] += 1
+                    job["last_error"] = error
+
+    @staticmethod
+    def _run_job(key: str, job: Dict[str, Any]) -> Optional[str]:
+        current_lane.set(job["lane"])
+        current_account.set(reddit.select(job["pinned"]))
+        current_call.set(ToolCall(f"poller:{key}"))
+        try:
+            job["func"]()
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        return None
+
+
+poller = BackgroundPoller()
+
+
+def reddit_tool(native_async=None, cache_ttl=None, invalidates=(), write=False, lane=None, coalesce=None, pinned=None, progress=False, **tool_kwargs):
+    """Registers a blocking tool with FastMCP without blocking the event loop.
+
+    The decorated function keeps its signature and docstring for the MCP
+    schema, but each call is dispatched onto the bounded worker pool;
+    coroutine functions, which must not block, are awaited directly. If
+    `native_async` is given and REDDIT_MCP_NATIVE_ASYNC is enabled, that
+    coroutine function (with the same signature) is awaited instead.
+
+    Successful results of tools with a `cache_ttl` (seconds) are served from
+    `response_cache`. Write tools list the cached tools they affect in
+    `invalidates`; a successful write drops those entries for the same
+    subreddit.
+
+    Tools marked `write=True` send their requests in the scheduler's
+    "moderation" lane; everything else uses "interactive" unless `lane`
+    says otherwise.
+
+    Each call is served by one account of the client pool. Write tools are
+    pinned to the write account, as are reads marked `pinned=True` because
+    their result depends on the logged-in user; other reads go wherever the
+    pool has capacity.
+
+    Read-only tools are coalesced by default: a call whose tool name and
+    normalized arguments match one already in flight waits for that call's
+    result instead of issuing its own requests. Pass `coalesce=False` for
+    read tools whose calls must not be shared, such as random picks, or a
+    function of the call's arguments that says whether that call may be.
+
+    Long-running reads are registered with `progress=True`: each call gets a
+    CallProgress with the deadline from its `deadline_seconds` argument (or
+    REDDIT_MCP_DEADLINE_SECONDS), which the body drives through
+    `report_progress()`.
+    """
+    tool_lane = lane or ("moderation" if write else "interactive")
+    if coalesce is None:
+        coalesce = not write
+    if pinned is None:
+        pinned = write
+
+    def decorator(func):
+        tool_name = tool_kwargs.get("name") or func.__name__
+
+        def run_in_lane(account, kwargs):
+            current_lane.set(tool_lane)
+            current_account.set(account)
+            return func(**kwargs)
+
+        async def dispatch(kwargs):
+            if asyncio.iscoroutinefunction(func):
+                return await func(**kwargs)
+            account = reddit.select(pinned)
+            account.in_flight += 1
+            account.calls += 1
+            try:
+                if native_async is not None and _native_async_available():
+                    lane_token = current_lane.set(tool_lane)
+                    account_token = current_account.set(account)
+                    try:
+                        return await native_async(**kwargs)
+                    finally:
+                        current_account.reset(account_token)
+                        current_lane.reset(lane_token)
+                return await anyio.to_thread.run_sync(
+                    contextvars.copy_context().run, run_in_lane, account, kwargs, limiter=_worker_limiter
+                )
+            finally:
+                account.in_flight -= 1
+
+        async def execute(key, kwargs, call_progress=None):
+            token = current_progress.set(call_progress)
+            try:
+                result = await dispatch(kwargs)
+            finally:
+                current_progress.reset(token)
+            if call_progress is not None and call_progress.cancelled:
+                _partial_results.set(call_progress.token, result, PARTIAL_RESULT_TTL)
+            succeeded = isinstance(result, dict) and result.get("successful")
+            if cache_ttl and succeeded:
+                response_cache.set(key, result, cache_ttl)
+            if invalidates and succeeded:
+                scope = {name: kwargs[name] for name in ("subreddit",) if name in kwargs}
+                response_cache.invalidate(invalidates, **scope)
+            return result
+
+        @functools.wraps(func)
+        async def runner(**kwargs):
+            call = ToolCall(tool_name)
+            token = current_call.set(call)
+            started = time.perf_counter()
+            result = None
+            try:
+                result = await serve(kwargs)
+                return result
+            except BaseException as e:
+                call.error = type(e).__name__
+                raise
+            finally:
+                current_call.reset(token)
+                metrics.record_call(call, time.perf_counter() - started, result)
+
+        async def serve(kwargs):
+            key = cache_key(tool_name, kwargs)
+            if cache_ttl:
+                found, cached = response_cache.get(key)
+                if found:
+                    return cached
+            if not (coalesce(kwargs) if callable(coalesce) else coalesce):
+                if not progress:
+                    return await execute(key, kwargs)
+                # Shielded like a shared fetch, so that a cancelled caller
+                # lets the call stop at its next page and keep its partial result.
+                call_progress = CallProgress(kwargs.get("deadline_seconds") or DEADLINE_SECONDS)
+                task = asyncio.ensure_future(execute(key, kwargs, call_progress))
+                return await follow(asyncio.shield(task), call_progress)
+
+            # The shared fetch runs as its own task so that a cancelled
+            # caller does not cancel it for the others waiting on it.
+            task = _inflight_calls.get(key)
+            if task is None:
+                call_progress = CallProgress(kwargs.get("deadline_seconds") or DEADLINE_SECONDS) if progress else None
+                task = asyncio.ensure_future(execute(key, kwargs, call_progress))
+                _inflight_calls[key] = task
+                if call_progress is not None:
+                    _inflight_progress[key] = call_progress
+                task.add_done_callback(lambda done, key=key: forget(key, done))
+                _single_flight_stats["leaders"] += 1
+            else:
+                _single_flight_stats["coalesced"] += 1
+            return await follow(asyncio.shield(task), _inflight_progress.get(key))
+
+        def forget(key, task):
+            if _inflight_calls.get(key) is task:
+                del _inflight_calls[key]
+                _inflight_progress.pop(key, None)
+
+        async def follow(awaitable, call_progress):
+            """Awaits a call's result while receiving its progress."""
+            if call_progress is None:
+                return await awaitable
+            ctx = progress_context()
+            call_progress.attach(ctx)
+            cancelled = False
+            try:
+                return await awaitable
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                call_progress.detach(ctx, cancelled)
+
+        mcp.tool(**tool_kwargs)(runner)
+        return func
+    return decorator
 
 from typing import Optional
 
-@mcp.tool()
-def get_hot_posts(subreddit: str, limit: int = 5) -> dict:
+LISTING_PAGE_SIZE = 100
+
+# Output field name -> key in the raw `t3` listing JSON. Listing tools read
+# only these keys from the already-fetched page, so no lazy PRAW object is
+# ever built or refreshed while serializing.
+POST_FIELDS = {
+    "id": "id",
+    "fullname": "name",
+    "title": "title",
+    "author": "author",
+    "subreddit": "subreddit",
+    "score": "score",
+    "upvote_ratio": "upvote_ratio",
+    "num_comments": "num_comments",
+    "created_utc": "created_utc",
+    "url": "url",
+    "permalink": "permalink",
+    "domain": "domain",
+    "selftext": "selftext",
+    "is_self": "is_self",
+    "over_18": "over_18",
+    "spoiler": "spoiler",
+    "stickied": "stickied",
+    "locked": "locked",
+    "link_flair_text": "link_flair_text",
+}
+DEFAULT_POST_FIELDS = ("id", "title", "author", "subreddit", "score", "num_comments", "created_utc", "url")
+
+
+def post_projection(fields: Optional[list] = None) -> tuple:
+    """Resolves a `fields=` argument to `(output_name, json_key)` pairs.
+
+    Raises:
+        ValueError: If any requested field is unknown.
+    """
+    names = DEFAULT_POST_FIELDS if not fields else fields
+    unknown = [name for name in names if name not in POST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(POST_FIELDS)}.")
+    return tuple((name, POST_FIELDS[name]) for name in dict.fromkeys(names))
+
+
+def serialize_posts(children: list, projection: tuple) -> list:
+    """Projects raw listing children onto the requested fields."""
+    return [{name: child["data"].get(key) for name, key in projection} for child in children]
+
+
+LISTING_MAX_ITEMS = 1000
+
+
+class ListingReader:
+    """Reads a Reddit listing page by page between `after`/`before` cursors.
+
+    Each page is serialized as soon as it arrives, so only one page of raw
+    JSON is held at a time. A single read returns at most LISTING_MAX_ITEMS
+    items; larger limits are served in chunks by following the returned
+    `after` cursor. With `before`, the listing is read backwards from that
+    item, towards the top, and the items keep their listing order.
+
+    Drive it with `next_params()` and `add_page()`, so that the same reader
+    works for blocking and asyncio clients. `checkpoint()` between pages
+    reports progress and ends the read early when the call must stop.
+    """
+
+    def __init__(self, limit: int, serialize, params: Optional[Dict[str, Any]] = None,
+                 after: Optional[str] = None, before: Optional[str] = None):
+        self.limit = min(max(limit, 0), LISTING_MAX_ITEMS)
+        self.serialize = serialize
+        self.params = params or {}
+        self.backwards = bool(before)
+        self.started_inside = bool(after or before)
+        self.anchor = before or after
+        self.items = []
+        self.first_name = None
+        self.last_name = None
+        self.more = True
+        self.partial = False
+
+    def next_params(self) -> Optional[Dict[str, Any]]:
+        """Query parameters for the next page, or None when the read is done."""
+        if not self.more or len(self.items) >= self.limit:
+            return None
+        page = dict(self.params, limit=min(LISTING_PAGE_SIZE, self.limit - len(self.items)), raw_json=1)
+        if self.anchor:
+            page["before" if self.backwards else "after"] = self.anchor
+        return page
+
+    def add_page(self, listing: Dict[str, Any]) -> None:
+        children = listing["data"]["children"]
+        if not children:
+            self.more = False
+            return
+        corpus_index.add(children)
+        # Only kept items count toward the limit: read from the anchor side
+        # until it is reached, and resume after the last child looked at.
+        used, kept = [], []
+        for child in (reversed(children) if self.backwards else children):
+            if len(self.items) + len(kept) >= self.limit:
+                break
+            used.append(child)
+            item = self.serialize(child)
+            if item is not None:
+                kept.append(item)
+        cut_short = len(used) < len(children)
+        if self.backwards:
+            used.reverse()
+            kept.reverse()
+        names = [_thing_name(child["data"]) for child in used]
+        if self.backwards:
+            self.items[:0] = kept
+            self.first_name, self.anchor = names[0], names[0]
+            self.last_name = self.last_name or names[-1]
+            self.more = cut_short or listing["data"].get("before") is not None
+        else:
+            self.items.extend(kept)
+            self.first_name = self.first_name or names[0]
+            self.last_name, self.anchor = names[-1], names[-1]
+            self.more = cut_short or listing["data"].get("after") is not None
+
+    def checkpoint(self) -> bool:
+        """Reports progress between pages; False stops the read early, as partial."""
+        if self.next_params() is None:
+            return True
+        direction = "before" if self.backwards else "after"
+        message = f"{len(self.items)} of {self.limit} items read, next page {direction}={self.anchor}"
+        self.partial = not report_progress(len(self.items), self.limit, message)
+        return not self.partial
+
+    def result(self) -> tuple:
+        """Returns `(items, cursors)`; a cursor is None when that end was reached.
+
+        A read stopped early by `checkpoint()` also has 'partial' set.
+        """
+        if self.backwards:
+            cursors = {"after": self.last_name, "before": self.first_name if self.more else None}
+        else:
+            cursors = {"after": self.last_name if self.more else None,
+                       "before": self.first_name if self.started_inside else None}
+        if self.partial:
+            cursors["partial"] = True
+        return self.items, cursors
+
+
+def _thing_name(data: Dict[str, Any]) -> str:
+    # Moderation log entries have no fullname; their id is the cursor.
+    return data.get("name") or data.get("id")
+
+
+def read_listing(path: str, limit: int, serialize, params: Optional[Dict[str, Any]] = None,
+                 after: Optional[str] = None, before: Optional[str] = None) -> tuple:
+    """Reads a listing through the client pool; returns `(items, cursors)`.
+
+    `serialize` turns one raw child into an output item, or None to skip it;
+    skipped children do not count toward `limit`.
+    """
+    reader = ListingReader(limit, serialize, params, after, before)
+    while (page_params := reader.next_params()) is not None:
+        reader.add_page(reddit.request(method="GET", path=path, params=page_params))
+        if not reader.checkpoint():
+            break
+    return reader.result()
+
+
+async def read_listing_async(path: str, limit: int, serialize, params: Optional[Dict[str, Any]] = None,
+                             after: Optional[str] = None, before: Optional[str] = None) -> tuple:
+    """asyncpraw counterpart of `read_listing`."""
+    client = await get_async_reddit()
+    reader = ListingReader(limit, serialize, params, after, before)
+    while (page_params := reader.next_params()) is not None:
+        reader.add_page(await client.request(method="GET", path=path, params=page_params))
+        if not reader.checkpoint():
+            break
+    return reader.result()
+
+
+def fetch_listing(path: str, limit: int, params: Optional[Dict[str, Any]] = None) -> list:
+    """Fetches up to `limit` raw children of a listing, 100 per request."""
+    return read_listing(path, limit, lambda child: child, params)[0]
+
+
+def post_serializer(fields: Optional[list] = None):
+    """Returns a serializer for raw `t3` children with the `fields` projection."""
+    projection = post_projection(fields)
+    return lambda child: {name: child["data"].get(key) for name, key in projection}
+
+
+def list_posts(path: str, limit: int, fields: Optional[list] = None, params: Optional[Dict[str, Any]] = None,
+               after: Optional[str] = None, before: Optional[str] = None) -> tuple:
+    """Reads a post listing with the `fields` projection; returns `(posts, cursors)`."""
+    return read_listing(path, limit, post_serializer(fields), params, after, before)
+
+
+async def _get_hot_posts_async(subreddit: str, limit: int = 5, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    try:
+        posts, cursors = await read_listing_async(f"/r/{subreddit}/hot", limit, post_serializer(fields), after=after, before=before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
+    except Exception as e:
+        note_tool_error(e)
+        return {"successful": False, "error": str(e)}
+
+
+@reddit_tool(native_async=_get_hot_posts_async)
+def get_hot_posts(subreddit: str, limit: int = 5, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Fetches a list of "hot" posts from a specified subreddit.
 
     Retrieves top posts from the "hot" section of a given subreddit,
@@ -51,25 +1901,32 @@ def get_hot_posts(subreddit: str, limit: int = 5) -> dict:
     Args:
         subreddit (str): The name of the subreddit to fetch posts from (e.g., 'python'). (Required)
         limit (int): The maximum number of posts to retrieve. Defaults to 5. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        dict: A dictionary containing a 'successful' status boolean and a 'data'field with a list of post objects. Each object includes thetitle, url, score, and author.
+        dict: A dictionary containing a 'successful' status boolean and a 'data'field with a list of post objects holding the requested fields.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
-    posts = []
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     try:
-        for submission in reddit.subreddit(subreddit).hot(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "url": submission.url,
-                "score": submission.score,
-                "author": str(submission.author)
-            })
-        return {"successful": True, "data": posts}
+        posts, cursors = list_posts(f"/r/{subreddit}/hot", limit, fields, after=after, before=before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": str(e)}
 
 
-@mcp.tool()
+@reddit_tool()
 def get_user_info(username: str) -> dict:
     """Get basic information about a Reddit user.
 
@@ -97,9 +1954,10 @@ def get_user_info(username: str) -> dict:
             }
         return {"successful": False, "error": f"Could not retrieve info for user {username}"}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": str(e)}
     
-@mcp.tool()
+@reddit_tool(write=True)
 def create_reddit_post(subreddit: str, title: str, kind: str, text: Optional[str] = None, url: Optional[str] = None, flair_id: Optional[str] = None) -> dict:
     """Creates a new post on a specified subreddit.
 
@@ -138,6 +1996,7 @@ def create_reddit_post(subreddit: str, title: str, kind: str, text: Optional[str
 
         return {"successful": True, "data": {"post_id": submission.id, "full_url": submission.url}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": str(e)}
 
         # 2. Return success status and the new post's ID
@@ -152,7 +2011,7 @@ def create_reddit_post(subreddit: str, title: str, kind: str, text: Optional[str
 
 # Re-run your server after adding this code!
 # python reddit_server.py
-@mcp.tool()
+@reddit_tool(write=True)
 def delete_reddit_comment(id: str) -> dict:
     """Deletes a Reddit comment authored by the authenticated user.
 
@@ -171,9 +2030,34 @@ def delete_reddit_comment(id: str) -> dict:
         comment.delete()
         return {"successful": True, "data": {"status": f"Comment with ID '{id}' was successfully deleted."}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to delete comment: {str(e)}"}
 
-@mcp.tool()
+@reddit_tool(write=True)
+def delete_reddit_comments_batch(ids: list[str], dry_run: bool = False) -> Dict[str, Any]:
+    """Deletes many comments authored by the authenticated user.
+
+    The deletions run concurrently within the moderation rate budget, and
+    one failed item does not stop the others.
+
+    Args:
+        ids (list[str]): Fullname IDs (t1_...) or bare IDs of the comments to
+                         delete, at most 1000. (Required)
+        dry_run (bool): Only look the comments up and report what would be
+                        deleted. Defaults to False. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with 'succeeded' and 'failed' counts and
+                        one result per distinct input ID, with 'successful'
+                        and a 'status' or 'error' message. Dry-run results
+                        also show each item's author and subreddit.
+    """
+    def _delete(fullname):
+        reddit.comment(fullname.split('_', 1)[1]).delete()
+        return f"Comment with ID '{fullname}' was successfully deleted."
+    return run_batch(ids, _delete, "delete comment {}", ('t1',), dry_run)
+
+@reddit_tool(write=True)
 def delete_reddit_post(id: str) -> dict:
     """Deletes a Reddit post authored by the authenticated user.
 
@@ -190,11 +2074,38 @@ def delete_reddit_post(id: str) -> dict:
     try:
         submission = reddit.submission(id)
         submission.delete()
+        disk_cache.delete(id if id.startswith('t3_') else f"t3_{id}")
         return {"successful": True, "data": {"status": f"Post with ID '{id}' was successfully deleted."}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to delete post: {str(e)}"}
 
-@mcp.tool()
+@reddit_tool(write=True)
+def delete_reddit_posts_batch(ids: list[str], dry_run: bool = False) -> Dict[str, Any]:
+    """Deletes many posts authored by the authenticated user.
+
+    The deletions run concurrently within the moderation rate budget, and
+    one failed item does not stop the others.
+
+    Args:
+        ids (list[str]): Fullname IDs (t3_...) or bare IDs of the posts to
+                         delete, at most 1000. (Required)
+        dry_run (bool): Only look the posts up and report what would be
+                        deleted. Defaults to False. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with 'succeeded' and 'failed' counts and
+                        one result per distinct input ID, with 'successful'
+                        and a 'status' or 'error' message. Dry-run results
+                        also show each item's author and subreddit.
+    """
+    def _delete(fullname):
+        reddit.submission(fullname.split('_', 1)[1]).delete()
+        disk_cache.delete(fullname)
+        return f"Post with ID '{fullname}' was successfully deleted."
+    return run_batch(ids, _delete, "delete post {}", ('t3',), dry_run)
+
+@reddit_tool(write=True)
 def edit_reddit_content(thing_id: str, text: str) -> dict:
     """Edits the body of an existing self-post or comment.
 
@@ -222,9 +2133,10 @@ def edit_reddit_content(thing_id: str, text: str) -> dict:
         item.edit(text)
         return {"successful": True, "data": {"status": f"Content ID '{thing_id}' was successfully updated."}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to edit content: {str(e)}."}
 
-@mcp.tool()
+@reddit_tool(cache_ttl=1800)
 def get_link_flair(subreddit: str) -> dict:
     """Fetches the available link (post) flairs for a subreddit.
 
@@ -248,10 +2160,244 @@ def get_link_flair(subreddit: str) -> dict:
             })
         return {"successful": True, "data": flair_list}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve flairs for r/{subreddit}: {str(e)}."}
 
-@mcp.tool()
-def post_reddit_comment(thing_id: str, text: str) -> dict:
+WRITE_QUEUE_INTERVAL = 1.0
+WRITE_QUEUE_BATCH = 25
+WRITE_MAX_ATTEMPTS = 8
+WRITE_RETRY_BASE_SECONDS = 5.0
+WRITE_RETRY_MAX_SECONDS = 600.0
+# A job still 'running' this long after it was claimed belongs to a server that died.
+WRITE_LEASE_SECONDS = 300.0
+WRITE_JOB_RETENTION_DAYS = 7
+WRITE_JOB_STATES = ('pending', 'running', 'done', 'failed', 'superseded')
+
+
+def write_retry_delay(error: Exception, attempts: int, kind: str) -> Optional[float]:
+    """Returns how long to wait before retrying a failed queued write, or None to give up.
+
+    Rate limits (HTTP 429, or Reddit's RATELIMIT error when commenting) are
+    retried by every kind of job. Server and connection errors are retried
+    only for votes: a comment may have been created before the error, and
+    posting it again would duplicate it.
+    """
+    import prawcore
+    from praw.exceptions import RedditAPIException
+
+    hint = 0.0
+    if isinstance(error, prawcore.exceptions.TooManyRequests):
+        hint = float(error.response.headers.get("retry-after") or 0)
+    elif isinstance(error, RedditAPIException) and any(item.error_type == "RATELIMIT" for item in error.items):
+        # "Take a break for 9 minutes before trying again."
+        match = re.search(r"(\d+) (second|minute)", str(error))
+        if match:
+            hint = int(match.group(1)) * (60 if match.group(2) == "minute" else 1)
+    elif not (kind == "vote" and isinstance(error, (prawcore.exceptions.ServerError, prawcore.exceptions.RequestException))):
+        return None
+    backoff = min(WRITE_RETRY_BASE_SECONDS * 2 ** (attempts - 1), WRITE_RETRY_MAX_SECONDS)
+    return max(hint, backoff, reddit.owner.scheduler.blocked_seconds())
+
+
+class WriteQueue:
+    """A persistent write-behind queue for votes and comments.
+
+    `enqueue` records a job in SQLite and returns its id at once; a poller
+    job in the moderation lane, on the write account, claims due jobs and
+    makes the writes. A new vote supersedes any pending vote on the same
+    fullname, so only the latest direction is sent. Failed jobs are retried
+    with exponential backoff when `write_retry_delay` allows it, up to
+    WRITE_MAX_ATTEMPTS attempts. Jobs survive restarts and several server
+    processes may share the database: claims are made in a write
+    transaction, and a claim older than WRITE_LEASE_SECONDS is taken to be
+    from a server that died. Finished jobs are kept for
+    WRITE_JOB_RETENTION_DAYS.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = open_database(self.filename)
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY, kind TEXT NOT NULL, target TEXT NOT NULL, args TEXT NOT NULL,
+                    state TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, due_at REAL NOT NULL,
+                    created_at REAL NOT NULL, updated_at REAL NOT NULL, result TEXT, error TEXT,
+                    superseded_by TEXT);
+                CREATE INDEX IF NOT EXISTS jobs_due ON jobs (state, due_at);
+                CREATE INDEX IF NOT EXISTS jobs_target ON jobs (kind, target, state);
+                CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated_at);
+            """)
+            self._local.connection = connection
+        return connection
+
+    def _transaction(self, func):
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return result
+
+    def start(self, run_now: bool = False) -> None:
+        """Makes sure the poller job that works through the queue is scheduled.
+
+        Unless `run_now`, the first run waits WRITE_QUEUE_INTERVAL.
+        """
+        if poller.interval("writes/drain") is None:
+            poller.schedule("writes/drain", WRITE_QUEUE_INTERVAL, self.drain, pinned=True, run_now=run_now, lane="moderation")
+
+    def enqueue(self, kind: str, target: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        job_id = secrets.token_urlsafe(9)
+        now = time.time()
+        # Votes wait one interval, so votes sent in quick succession collapse
+        # before any of them is made.
+        due_at = now + WRITE_QUEUE_INTERVAL if kind == "vote" else now
+
+        def _insert(connection):
+            superseded = []
+            if kind == "vote":
+                superseded = [row[0] for row in connection.execute(
+                    "SELECT id FROM jobs WHERE kind = 'vote' AND target = ? AND state = 'pending'", (target,)
+                )]
+                connection.execute(
+                    "UPDATE jobs SET state = 'superseded', superseded_by = ?, updated_at = ?"
+                    " WHERE kind = 'vote' AND target = ? AND state = 'pending'", (job_id, now, target)
+                )
+            connection.execute(
+                "INSERT INTO jobs (id, kind, target, args, state, due_at, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, 'pending', ?, ?, ?)", (job_id, kind, target, json.dumps(args), due_at, now, now)
+            )
+            return superseded
+
+        superseded = self._transaction(_insert)
+        self.start()
+        return {"job_id": job_id, "state": "pending", "superseded": superseded}
+
+    def _claim(self, connection) -> list:
+        now = time.time()
+        stale = now - WRITE_LEASE_SECONDS
+        connection.execute(
+            "UPDATE jobs SET state = 'pending', updated_at = ? WHERE state = 'running' AND updated_at < ? AND kind = 'vote'",
+            (now, stale)
+        )
+        connection.execute(
+            "UPDATE jobs SET state = 'failed', updated_at = ?, error = 'The server stopped while posting; check"
+            " whether the comment was created before posting it again.' WHERE state = 'running' AND updated_at < ?",
+            (now, stale)
+        )
+        jobs = connection.execute(
+            "SELECT id, kind, target, args, attempts, created_at FROM jobs WHERE state = 'pending' AND due_at <= ?"
+            " ORDER BY created_at LIMIT ?", (now, WRITE_QUEUE_BATCH)
+        ).fetchall()
+        connection.executemany(
+            "UPDATE jobs SET state = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+            [(now, job[0]) for job in jobs]
+        )
+        return [{"id": id, "kind": kind, "target": target, "args": json.loads(args), "attempts": attempts + 1,
+                 "created_at": created_at} for id, kind, target, args, attempts, created_at in jobs]
+
+    def drain(self) -> int:
+        """Makes the due writes; returns how many jobs were attempted.
+
+        The job stays scheduled while the queue is empty: cancelling it here
+        could race an `enqueue` that saw it still scheduled. An empty queue
+        costs one read, without taking the write lock.
+        """
+        if not self._connection().execute(
+            "SELECT 1 FROM jobs WHERE state IN ('pending', 'running') LIMIT 1"
+        ).fetchone():
+            return 0
+        actions = {"vote": _cast_vote, "comment": _post_comment}
+        jobs = self._transaction(self._claim)
+        outcomes = run_concurrently(lambda job: actions[job["kind"]](job["target"], **job["args"]), jobs)
+        now = time.time()
+        updates = []
+        for job, (ok, outcome) in zip(jobs, outcomes):
+            if ok:
+                updates.append(("done", now, json.dumps(outcome), None, job["id"]))
+                continue
+            note_tool_error(outcome)
+            delay = write_retry_delay(outcome, job["attempts"], job["kind"])
+            if delay is None or job["attempts"] >= WRITE_MAX_ATTEMPTS:
+                updates.append(("failed", now, None, str(outcome), job["id"]))
+            else:
+                updates.append(("pending", now + delay, None, str(outcome), job["id"]))
+
+        def _finish(connection):
+            connection.executemany(
+                "UPDATE jobs SET state = ?, due_at = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+                [(state, due_at, result, error, now, id) for state, due_at, result, error, id in updates]
+            )
+            # A retried vote must not overtake a newer vote on the same fullname.
+            connection.execute(
+                "UPDATE jobs SET state = 'superseded', updated_at = ?, superseded_by = (SELECT newer.id FROM jobs AS newer"
+                " WHERE newer.kind = 'vote' AND newer.target = jobs.target AND newer.created_at > jobs.created_at"
+                " ORDER BY newer.created_at DESC LIMIT 1) WHERE kind = 'vote' AND state = 'pending' AND EXISTS"
+                " (SELECT 1 FROM jobs AS newer WHERE newer.kind = 'vote' AND newer.target = jobs.target"
+                " AND newer.created_at > jobs.created_at AND newer.state IN ('pending', 'running', 'done'))",
+                (now,)
+            )
+            connection.execute(
+                "DELETE FROM jobs WHERE state IN ('done', 'failed', 'superseded') AND updated_at < ?",
+                (now - WRITE_JOB_RETENTION_DAYS * 86400,)
+            )
+
+        self._transaction(_finish)
+        return len(jobs)
+
+    def status(self, job_ids: Optional[list] = None, state: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        connection = self._connection()
+        clauses, params = [], []
+        if job_ids:
+            clauses.append(f"id IN ({', '.join('?' * len(job_ids))})")
+            params.extend(job_ids)
+        if state:
+            clauses.append("state = ?")
+            params.append(state)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = connection.execute(
+            "SELECT id, kind, target, state, attempts, due_at, created_at, updated_at, result, error, superseded_by"
+            f" FROM jobs{where} ORDER BY created_at DESC LIMIT ?", params + [limit]
+        ).fetchall()
+        now = time.time()
+        jobs = [{
+            "job_id": id, "kind": kind, "target": target, "state": job_state, "attempts": attempts,
+            "retry_in_seconds": round(max(due_at - now, 0.0), 1) if job_state == 'pending' else None,
+            "created_utc": created_at, "updated_utc": updated_at,
+            "result": json.loads(result) if result else None, "error": error, "superseded_by": superseded_by
+        } for id, kind, target, job_state, attempts, due_at, created_at, updated_at, result, error, superseded_by in rows]
+        counts = dict.fromkeys(WRITE_JOB_STATES, 0)
+        counts.update(connection.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+        if job_ids:
+            missing = set(job_ids) - {job["job_id"] for job in jobs}
+            jobs.extend({"job_id": id, "state": None, "error": "Unknown job id."} for id in job_ids if id in missing)
+        return {"counts": counts, "jobs": jobs}
+
+
+write_queue = WriteQueue("writes.sqlite3")
+
+
+def _post_comment(thing_id: str, text: str) -> Dict[str, Any]:
+    kind, id = thing_id.split('_', 1)
+    parent = reddit.submission(id) if kind == 't3' else reddit.comment(id)
+    new_comment = parent.reply(text)
+    return {
+        "comment_id": new_comment.id,
+        "fullname": new_comment.fullname,
+        "permalink": new_comment.permalink
+    }
+
+
+@reddit_tool(write=True)
+def post_reddit_comment(thing_id: str, text: str, queue: bool = False) -> dict:
     """Posts a comment replying to a submission or another comment.
 
     Creates a new comment on Reddit under a specified parent object. The
@@ -261,68 +2407,667 @@ def post_reddit_comment(thing_id: str, text: str) -> dict:
         thing_id (str): The fullname ID of the parent post (e.g., 't3_abcxyz')
                         or comment (e.g., 't1_abcxyz') to reply to. (Required)
         text (str): The markdown-formatted content for the comment. (Required)
+        queue (bool): Return a job id at once and post the comment in the
+                      background, retrying while Reddit rate limits it; see
+                      `get_write_queue_status`. Defaults to False. (Optional)
 
     Returns:
         dict: A dictionary containing the ID, fullname, and permalink of the
-              newly created comment on success.
+              newly created comment on success, or the 'job_id' of the
+              queued write.
     """
     try:
-        if thing_id.startswith('t3_'):
-            parent = reddit.submission(thing_id)
-        elif thing_id.startswith('t1_'):
-            parent = reddit.comment(thing_id)
-        else:
+        if not thing_id.startswith(('t1_', 't3_')):
             return {"successful": False, "error": "Invalid 'thing_id' format. Must start with 't1_' or 't3_'."}
-            
-        new_comment = parent.reply(text)
-        
-        return {
-            "successful": True,
-            "data": {
-                "comment_id": new_comment.id,
-                "fullname": new_comment.fullname,
-                "permalink": new_comment.permalink
-            }
-        }
+        if queue:
+            return {"successful": True, "data": write_queue.enqueue("comment", thing_id, {"text": text})}
+        return {"successful": True, "data": _post_comment(thing_id, text)}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to post comment: {str(e)}."}
-@mcp.tool()
-def retrieve_post_comments(article: str) -> dict:
-    """Retrieves all comments from a specific Reddit post.
+COMMENT_SORTS = ['confidence', 'top', 'new', 'controversial', 'old', 'random', 'qa', 'live']
+
+
+def sorted_deterministically(kwargs: Dict[str, Any]) -> bool:
+    """`coalesce` for comment tools: calls with the 'random' sort are not shared."""
+    return kwargs.get("sort") != 'random'
+
+
+MORECHILDREN_BATCH_SIZE = 100
+COMMENT_CURSOR_TTL = 1800
+# For `max_chars`: comment text to cut, and fields to drop before cutting it.
+COMMENT_TEXT_FIELDS = ("body",)
+COMMENT_OPTIONAL_FIELDS = ("permalink",)
+
+# Walkers for partially read threads, keyed by the opaque cursor handed out
+# to the caller. Resuming a cursor consumes it.
+_comment_cursors = TTLCache(256)
+
+
+class CommentWalker:
+    """Walks a submission's comment forest breadth-first from raw API JSON.
 
-    Fetches a flattened list of all comments and replies for a given post,
-    identified by its article ID.
+    MoreComments stubs are expanded lazily when the walk reaches them, using
+    at most `replace_more_limit` requests (None for no limit). Up to
+    `prefetch` stubs near the head of the queue are expanded concurrently.
+    The consumer may stop at any point; the walker then holds the rest of the
+    tree and can be stored to resume later.
+    """
+
+    def __init__(self, article: str, sort: str = 'confidence', max_depth: Optional[int] = None,
+                 replace_more_limit: Optional[int] = 32, prefetch: int = MAX_INFLIGHT_REQUESTS):
+        self.article = article[3:] if article.startswith('t3_') else article
+        self.link_fullname = f"t3_{self.article}"
+        self.sort = sort
+        self.max_depth = max_depth
+        self.more_budget = replace_more_limit
+        self.prefetch = max(1, prefetch)
+        self.submission = None
+        self.queue = deque()
+        self.deferred = []
+        self.requests_made = 0
+        self.errors = []
+
+    def load(self, limit: Optional[int] = None) -> None:
+        """Fetches the submission and the initial comment tree."""
+        params = {"sort": self.sort, "raw_json": 1}
+        if limit:
+            params["limit"] = limit
+        if self.max_depth is not None:
+            params["depth"] = self.max_depth + 1
+        link_listing, comment_listing = reddit.request(
+            method="GET", path=f"/comments/{self.article}", params=params
+        )
+        self.requests_made += 1
+        self.submission = link_listing["data"]["children"][0]["data"]
+        corpus_index.add(link_listing["data"]["children"])
+        self.queue.extend(self._nodes(comment_listing["data"]["children"], 0))
+
+    def has_more(self) -> bool:
+        return bool(self.queue or self.deferred)
+
+    def requeue(self, comments: list) -> None:
+        """Puts `(depth, comment_data)` pairs from `walk()` back at the head of the queue.
+
+        Their replies are already queued, so they are not walked twice.
+        """
+        self.queue.extendleft({"kind": "t1", "depth": depth, "data": data} for depth, data in reversed(comments))
+
+    def resume(self, replace_more_limit: Optional[int]) -> None:
+        """Re-queues stubs skipped for lack of budget and grants a new budget."""
+        self.queue.extendleft(reversed(self.deferred))
+        self.deferred = []
+        self.more_budget = replace_more_limit
+
+    def walk(self):
+        """Yields `(depth, comment_data)` pairs in breadth-first order."""
+        while self.queue:
+            node = self.queue[0]
+            if node["kind"] == "more":
+                if "expanded" not in node:
+                    if self.more_budget is not None and self.more_budget <= 0:
+                        self.deferred.append(self.queue.popleft())
+                        continue
+                    self._prefetch()
+                self.queue.popleft()
+                if node["expanded"] is None:
+                    del node["expanded"]
+                    self.deferred.append(node)
+                else:
+                    self.queue.extendleft(reversed(node.pop("expanded")))
+                continue
+            self.queue.popleft()
+            data = node["data"]
+            replies = data.pop("replies", None)
+            if replies:
+                self.queue.extend(self._nodes(replies["data"]["children"], node["depth"] + 1))
+            yield node["depth"], data
+
+    def _nodes(self, things, depth: int) -> list:
+        if self.max_depth is not None and depth > self.max_depth:
+            return []
+        corpus_index.add(things)
+        return [{"kind": t["kind"], "depth": depth, "data": t["data"]} for t in things if t["kind"] in ("t1", "more")]
+
+    def _prefetch(self) -> None:
+        pending = []
+        for node in self.queue:
+            if node["kind"] != "more" or "expanded" in node:
+                continue
+            if self.more_budget is not None and len(pending) >= self.more_budget:
+                break
+            pending.append(node)
+            if len(pending) >= self.prefetch:
+                break
+        if self.more_budget is not None:
+            self.more_budget -= len(pending)
+        self.requests_made += len(pending)
+        for node, (ok, outcome) in zip(pending, run_concurrently(self._expand, pending)):
+            if ok:
+                node["expanded"] = outcome
+            else:
+                node["expanded"] = None
+                self.errors.append(str(outcome))
+
+    def _expand(self, node) -> list:
+        data = node["data"]
+        if not data.get("children"):
+            # A "continue this thread" stub: load the parent's subtree.
+            parent_id = data["parent_id"].split('_', 1)[1]
+            _, listing = reddit.request(
+                method="GET", path=f"/comments/{self.article}/_/{parent_id}",
+                params={"sort": self.sort, "raw_json": 1}
+            )
+            children = listing["data"]["children"]
+            replies = children[0]["data"].get("replies") if children else None
+            return self._nodes(replies["data"]["children"] if replies else [], node["depth"])
+
+        batch, rest = data["children"][:MORECHILDREN_BATCH_SIZE], data["children"][MORECHILDREN_BATCH_SIZE:]
+        response = reddit.request(
+            method="GET", path="/api/morechildren",
+            params={
+                "api_type": "json",
+                "link_id": self.link_fullname,
+                "children": ",".join(batch),
+                "sort": self.sort,
+                "raw_json": 1
+            }
+        )
+        nodes = self._nodes(_nest_things(response["json"]["data"]["things"]), node["depth"])
+        if rest:
+            remainder = dict(data, children=rest, count=max(data.get("count", 0) - len(batch), len(rest)))
+            nodes.append({"kind": "more", "depth": node["depth"], "data": remainder})
+        return nodes
+
+
+def _nest_things(things: list) -> list:
+    """Rebuilds reply trees from the flat thing list /api/morechildren returns."""
+    names = {t["data"].get("name") for t in things}
+    replies = {}
+    roots = []
+    for thing in things:
+        parent = thing["data"].get("parent_id")
+        if parent in names:
+            replies.setdefault(parent, []).append(thing)
+        else:
+            roots.append(thing)
+    for thing in things:
+        if thing["kind"] == "t1":
+            children = replies.get(thing["data"]["name"])
+            thing["data"]["replies"] = {"data": {"children": children}} if children else ""
+    return roots
+
+
+def store_comment_cursor(walker: CommentWalker) -> str:
+    token = secrets.token_urlsafe(16)
+    _comment_cursors.set(token, walker, COMMENT_CURSOR_TTL)
+    return token
+
+
+def take_comment_cursor(token: str) -> Optional[CommentWalker]:
+    found, walker = _comment_cursors.get(token)
+    if found:
+        _comment_cursors.invalidate_key(token)
+    return walker
+
+
+@reddit_tool(progress=True, coalesce=sorted_deterministically)
+def retrieve_post_comments(article: str, sort: str = 'confidence', max_comments: int = 500, max_depth: Optional[int] = None, replace_more_limit: Optional[int] = 32, cursor: Optional[str] = None, deadline_seconds: Optional[float] = None, max_chars: Optional[int] = None, format: str = 'records') -> dict:
+    """Retrieves comments from a specific Reddit post, a page at a time.
+
+    Walks the comment tree breadth-first and returns a flattened page of
+    comments. "Load more comments" stubs are expanded as the walk reaches
+    them, several concurrently, within the `replace_more_limit` budget. When
+    the page is full or the budget runs out, a `next_cursor` is returned that
+    continues the walk where it stopped.
 
     Args:
         article (str): The ID of the post (e.g., 'abcxyz' or 't3_abcxyz') from
                        which to retrieve comments. (Required)
+        sort (str): Comment order: 'confidence' (best), 'top', 'new',
+                    'controversial', 'old', 'random', 'qa' or 'live'.
+                    Defaults to 'confidence'. (Optional)
+        max_comments (int): The maximum number of comments to return in this
+                            page. Defaults to 500. (Optional)
+        max_depth (Optional[int]): The deepest reply level to include, where 0
+                                   means top-level comments only. (Optional)
+        replace_more_limit (Optional[int]): The maximum number of "load more
+                                            comments" requests for this page;
+                                            None means no limit. Defaults to 32. (Optional)
+        cursor (Optional[str]): A `next_cursor` from a previous call on the same
+                                post. The sort and depth of the original call
+                                are kept. Cursors expire after 30 minutes. (Optional)
+        deadline_seconds (float): Stop after this many seconds and return the
+                                  comments read so far, marked 'partial'.
+                                  Defaults to 50. (Optional)
+        max_chars (int): Output budget in characters of JSON. Over budget,
+                         permalinks are dropped, then the longest bodies are
+                         cut, then trailing comments are left out and start
+                         the next page; what was elided is reported under
+                         'truncated'. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        dict: A dictionary containing a list of comment objects. Each object
-              includes the comment's ID, author, body, score, and permalink.
+        dict: A dictionary containing a list of comment objects and a
+              `next_cursor` (None once the whole tree has been read). Each
+              object includes the comment's ID, author, body, score,
+              permalink, parent ID and depth. 'partial' is True when the
+              deadline cut the page short, or when "load more" requests
+              failed; their messages are listed under 'errors'.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    if sort not in COMMENT_SORTS:
+        return {"successful": False, "error": f"Invalid sort. Use one of: {COMMENT_SORTS}"}
     try:
-        submission = reddit.submission(article)
-        submission.comments.replace_more(limit=None)
-        
-        comments_list = submission.comments.list()
-        
+        # Only first pages that hold the whole walk are persisted: a
+        # next_cursor would not survive a restart. Random orders are not.
+        disk_key = None
+        if not cursor and sort != 'random':
+            disk_key = f"{CommentWalker(article).link_fullname}/comments?sort={sort}&max_comments={max_comments}&max_depth={max_depth}&replace_more_limit={replace_more_limit}"
+            found, retrieved_comments = disk_cache.get(disk_key)
+            if found:
+                response = budget_response({"successful": True, "data": retrieved_comments, "next_cursor": None},
+                                           max_chars, COMMENT_TEXT_FIELDS, COMMENT_OPTIONAL_FIELDS)
+                # A cached page has no walker to resume from, so one that
+                # would lose trailing comments to the budget is read again.
+                if not response.get("truncated", {}).get("items_dropped"):
+                    return format_response(response, format)
+        if cursor:
+            walker = take_comment_cursor(cursor)
+            if walker is None:
+                return {"successful": False, "error": "Unknown or expired cursor."}
+            if walker.link_fullname != CommentWalker(article).link_fullname:
+                return {"successful": False, "error": f"Cursor does not belong to article ID '{article}'."}
+            walker.resume(replace_more_limit)
+        else:
+            walker = CommentWalker(article, sort=sort, max_depth=max_depth, replace_more_limit=replace_more_limit)
+            walker.load(limit=min(max(max_comments, 1), 500))
+        errors_before = len(walker.errors)
+
         retrieved_comments = []
-        for comment in comments_list:
-            if hasattr(comment, 'author'):
+        walked = []
+        requests_seen = 0
+        stopped = False
+        if max_comments > 0:
+            for depth, comment in walker.walk():
+                walked.append((depth, comment))
                 retrieved_comments.append({
-                    "comment_id": comment.id,
-                    "author": str(comment.author),
-                    "body": comment.body,
-                    "score": comment.score,
-                    "permalink": comment.permalink
+                    "comment_id": comment["id"],
+                    "author": str(comment.get("author")),
+                    "body": comment.get("body"),
+                    "score": comment.get("score"),
+                    "permalink": comment.get("permalink"),
+                    "parent_id": comment.get("parent_id"),
+                    "depth": depth
                 })
-
-        return {"successful": True, "data": retrieved_comments}
+                if len(retrieved_comments) >= max_comments:
+                    break
+                if walker.requests_made != requests_seen:
+                    requests_seen = walker.requests_made
+                    message = f"{len(retrieved_comments)} of up to {max_comments} comments read"
+                    if not report_progress(len(retrieved_comments), max_comments, message):
+                        stopped = True
+                        break
+
+        errors = walker.errors[errors_before:]
+        if disk_key and not walker.has_more() and not errors:
+            disk_cache.set(disk_key, "comments", retrieved_comments)
+        response = budget_response({"successful": True, "data": retrieved_comments, "next_cursor": None},
+                                   max_chars, COMMENT_TEXT_FIELDS, COMMENT_OPTIONAL_FIELDS)
+        dropped = response.get("truncated", {}).get("items_dropped")
+        if dropped:
+            # Comments left out for the budget come first on the next page.
+            walker.requeue(walked[-dropped:])
+        if walker.has_more():
+            response["next_cursor"] = store_comment_cursor(walker)
+            if stopped:
+                response["partial"] = True
+        if errors:
+            # The failed "load more" stubs are retried from next_cursor.
+            response.update(partial=True, errors=errors)
+        return format_response(response, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve comments for article ID '{article}': {str(e)}."}
-@mcp.tool()
-def retrieve_reddit_posts(subreddit: str, size: int = 5) -> dict:
+
+
+@reddit_tool(coalesce=False)
+def get_partial_result(token: str) -> dict:
+    """Retrieves what a cancelled long-running call had read before it stopped.
+
+    `retrieve_post_comments`, `get_user_comments` and `get_moderation_log`
+    name a partial result token in their progress notifications. If the
+    call is cancelled, it stops at the next page and its result, with the
+    cursor to resume from, is kept under that token for 10 minutes.
+
+    Args:
+        token (str): The partial result token from a progress notification. (Required)
+
+    Returns:
+        dict: The cancelled call's response, marked 'partial' with a resume
+              cursor if it stopped early.
+    """
+    found, result = _partial_results.get(token)
+    if not found:
+        return {"successful": False, "error": "Unknown or expired token, or the call was not cancelled."}
+    return result
+
+
+COMMENT_SCORE_BINS = (-1, 0, 1, 2, 10, 100, 1000)
+
+
+def _load_comment_arrays(walker: CommentWalker, max_comments: int) -> tuple:
+    """Walks a thread into parallel columns: score, created_utc, depth,
+    parent index (-1 for top-level or unknown parents) and author id.
+
+    Returns `(columns, authors, stopped)`, where `authors` maps author ids
+    back to names and `stopped` tells whether the call had to stop early.
+    """
+    scores, created, depths, parents, author_ids = [], [], [], [], []
+    index = {}
+    author_index = {}
+    requests_seen = 0
+    stopped = False
+    for depth, comment in walker.walk():
+        index[comment.get("name") or f"t1_{comment['id']}"] = len(scores)
+        scores.append(comment.get("score") or 0)
+        created.append(comment.get("created_utc") or 0.0)
+        depths.append(depth)
+        parents.append(index.get(comment.get("parent_id"), -1))
+        author = comment.get("author") or "[deleted]"
+        author_ids.append(author_index.setdefault(author, len(author_index)))
+        if len(scores) >= max_comments:
+            break
+        if walker.requests_made != requests_seen:
+            requests_seen = walker.requests_made
+            if not report_progress(len(scores), max_comments, f"{len(scores)} of up to {max_comments} comments read"):
+                stopped = True
+                break
+    return (scores, created, depths, parents, author_ids), list(author_index), stopped
+
+
+def _score_bucket_labels() -> list:
+    """Labels of the score histogram buckets bounded by COMMENT_SCORE_BINS."""
+    edges = COMMENT_SCORE_BINS
+    return [f"< {edges[0]}"] + [
+        f"{low}" if high - low == 1 else f"{low}..{high - 1}" for low, high in zip(edges, edges[1:])
+    ] + [f">= {edges[-1]}"]
+
+
+def _percentile(ordered: list, q: float) -> float:
+    # Linear interpolation between closest ranks, as numpy.percentile does.
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize_comment_lists(columns: tuple, authors: list, op: Optional[str], post_created: float,
+                            top_n: int, bins: int) -> Dict[str, Any]:
+    """Pure Python counterpart of `summarize_comment_arrays`, used without NumPy."""
+    score, created, depth, parent, author = columns
+    count = len(score)
+    if count == 0:
+        return {"comments": 0}
+
+    def rounded(value):
+        return round(float(value), 2)
+
+    ordered = sorted(score)
+    bucket_counts = [0] * (len(COMMENT_SCORE_BINS) + 1)
+    for value in score:
+        bucket_counts[bisect.bisect_right(COMMENT_SCORE_BINS, value)] += 1
+    score_summary = {
+        "mean": rounded(statistics.fmean(score)),
+        "std": rounded(statistics.pstdev(score)),
+        "min": ordered[0],
+        "median": rounded(_percentile(ordered, 50)),
+        "p90": rounded(_percentile(ordered, 90)),
+        "p99": rounded(_percentile(ordered, 99)),
+        "max": ordered[-1],
+        "negative": sum(1 for value in score if value < 0),
+        "histogram": {label: n for label, n in zip(_score_bucket_labels(), bucket_counts) if n}
+    }
+
+    deleted = authors.index("[deleted]") if "[deleted]" in authors else -1
+    comment_counts = [0] * len(authors)
+    score_totals = [0] * len(authors)
+    for who, value in zip(author, score):
+        comment_counts[who] += 1
+        score_totals[who] += value
+    ranked = [i for i in sorted(range(len(authors)), key=lambda i: -comment_counts[i]) if i != deleted][:top_n]
+    top_authors = [
+        {"author": authors[i], "comments": comment_counts[i], "total_score": score_totals[i]}
+        for i in ranked
+    ]
+
+    start = post_created or min(created)
+    age = [max((value - start) / 3600.0, 0.0) for value in created]
+    low = min(age)
+    width = (max(max(age), low + 1.0) - low) / bins
+    activity_counts = [0] * bins
+    for value in age:
+        activity_counts[min(int((value - low) / width), bins - 1)] += 1
+    activity = {
+        "start_hours": rounded(low),
+        "bucket_hours": rounded(width),
+        "comments": activity_counts,
+        "median_hours": rounded(statistics.median(age)),
+        "first_hour_share": rounded(sum(1 for value in age if value < 1) / count)
+    }
+
+    depth_counts = [0] * (max(depth) + 1)
+    depth_totals = [0] * (max(depth) + 1)
+    for level, value in zip(depth, score):
+        depth_counts[level] += 1
+        depth_totals[level] += value
+    depth_profile = {
+        "max_depth": max(depth),
+        "mean_depth": rounded(statistics.fmean(depth)),
+        "comments_per_depth": depth_counts,
+        "mean_score_per_depth": [rounded(total / max(n, 1)) for total, n in zip(depth_totals, depth_counts)]
+    }
+
+    reply_counts = [0] * count
+    for index in parent:
+        if index >= 0:
+            reply_counts[index] += 1
+    busiest = reply_counts.index(max(reply_counts))
+    replies = {
+        "top_level": depth.count(0),
+        "without_replies": reply_counts.count(0),
+        "max_direct_replies": reply_counts[busiest],
+        "mean_direct_replies": rounded(statistics.fmean(reply_counts))
+    }
+
+    op_id = authors.index(op) if op in authors else -1
+    op_rows = [i for i, who in enumerate(author) if who == op_id]
+    op_set = set(op_rows)
+    op_participation = {
+        "author": op,
+        "comments": len(op_rows),
+        "share": rounded(len(op_rows) / count),
+        "mean_score": rounded(statistics.fmean(score[i] for i in op_rows)) if op_rows else None,
+        "replied_to_users": len({author[parent[i]] for i in op_rows if parent[i] >= 0}),
+        "replies_received": sum(1 for index in parent if index in op_set)
+    }
+
+    return {
+        "comments": count,
+        "unique_authors": len(authors) - (deleted >= 0),
+        "score": score_summary,
+        "top_authors": top_authors,
+        "activity": activity,
+        "depth": depth_profile,
+        "replies": replies,
+        "op": op_participation
+    }
+
+
+def summarize_comment_arrays(np, columns: tuple, authors: list, op: Optional[str], post_created: float,
+                             top_n: int, bins: int) -> Dict[str, Any]:
+    """Computes thread statistics from the columns of `_load_comment_arrays`."""
+    score = np.asarray(columns[0], dtype=np.int64)
+    created = np.asarray(columns[1], dtype=np.float64)
+    depth = np.asarray(columns[2], dtype=np.int32)
+    parent = np.asarray(columns[3], dtype=np.int64)
+    author = np.asarray(columns[4], dtype=np.int64)
+    count = len(score)
+    if count == 0:
+        return {"comments": 0}
+
+    def rounded(value):
+        return round(float(value), 2)
+
+    percentiles = np.percentile(score, [50, 90, 99])
+    edges = np.array(COMMENT_SCORE_BINS + (np.iinfo(np.int64).max,))
+    bucket_counts = np.bincount(np.searchsorted(edges, score, side='right'), minlength=len(edges) + 1)
+    bucket_labels = _score_bucket_labels()
+    score_summary = {
+        "mean": rounded(score.mean()),
+        "std": rounded(score.std()),
+        "min": int(score.min()),
+        "median": rounded(percentiles[0]),
+        "p90": rounded(percentiles[1]),
+        "p99": rounded(percentiles[2]),
+        "max": int(score.max()),
+        "negative": int((score < 0).sum()),
+        "histogram": {label: int(n) for label, n in zip(bucket_labels, bucket_counts[:len(bucket_labels)]) if n}
+    }
+
+    deleted = authors.index("[deleted]") if "[deleted]" in authors else -1
+    comment_counts = np.bincount(author, minlength=len(authors))
+    score_totals = np.bincount(author, weights=score, minlength=len(authors))
+    ranked = np.argsort(-comment_counts, kind='stable')
+    ranked = ranked[ranked != deleted][:top_n]
+    top_authors = [
+        {"author": authors[i], "comments": int(comment_counts[i]), "total_score": int(score_totals[i])}
+        for i in ranked
+    ]
+
+    age = np.clip((created - (post_created or created.min())) / 3600.0, 0, None)
+    activity_counts, activity_edges = np.histogram(age, bins=bins, range=(age.min(), max(age.max(), age.min() + 1.0)))
+    activity = {
+        "start_hours": rounded(activity_edges[0]),
+        "bucket_hours": rounded(activity_edges[1] - activity_edges[0]),
+        "comments": activity_counts.tolist(),
+        "median_hours": rounded(np.median(age)),
+        "first_hour_share": rounded((age < 1).mean())
+    }
+
+    depth_counts = np.bincount(depth)
+    depth_scores = np.bincount(depth, weights=score) / np.maximum(depth_counts, 1)
+    depth_profile = {
+        "max_depth": int(depth.max()),
+        "mean_depth": rounded(depth.mean()),
+        "comments_per_depth": depth_counts.tolist(),
+        "mean_score_per_depth": [rounded(value) for value in depth_scores]
+    }
+
+    has_parent = parent >= 0
+    reply_counts = np.bincount(parent[has_parent], minlength=count)
+    busiest = int(reply_counts.argmax())
+    replies = {
+        "top_level": int((depth == 0).sum()),
+        "without_replies": int((reply_counts == 0).sum()),
+        "max_direct_replies": int(reply_counts[busiest]),
+        "mean_direct_replies": rounded(reply_counts.mean())
+    }
+
+    op_id = authors.index(op) if op in authors else -1
+    op_mask = author == op_id
+    op_parents = parent[op_mask & has_parent]
+    op_participation = {
+        "author": op,
+        "comments": int(op_mask.sum()),
+        "share": rounded(op_mask.mean()),
+        "mean_score": rounded(score[op_mask].mean()) if op_mask.any() else None,
+        "replied_to_users": int(len(np.unique(author[op_parents]))),
+        "replies_received": int(np.isin(parent, np.flatnonzero(op_mask)).sum())
+    }
+
+    return {
+        "comments": count,
+        "unique_authors": len(authors) - (deleted >= 0),
+        "score": score_summary,
+        "top_authors": top_authors,
+        "activity": activity,
+        "depth": depth_profile,
+        "replies": replies,
+        "op": op_participation
+    }
+
+
+@reddit_tool(progress=True, coalesce=sorted_deterministically)
+def analyze_post_comments(article: str, sort: str = 'confidence', max_comments: int = 5000, replace_more_limit: Optional[int] = 32, top_n: int = 10, bins: int = 24, deadline_seconds: Optional[float] = None) -> dict:
+    """Computes statistics over a post's comment thread.
+
+    Reads the comment tree like `retrieve_post_comments`, loads it into
+    columns (score, time, depth, parent and author) and returns a compact
+    summary instead of comment text: score distribution, most active
+    authors, activity over time, depth profile, reply structure and the
+    original poster's participation. The columns are NumPy arrays when
+    NumPy is installed; otherwise the same summary is computed in plain
+    Python, more slowly on large threads.
+
+    Args:
+        article (str): The ID of the post (e.g., 'abcxyz' or 't3_abcxyz'). (Required)
+        sort (str): Comment order used to read the thread, which decides what
+                    is read first when the thread is larger than `max_comments`.
+                    Defaults to 'confidence'. (Optional)
+        max_comments (int): The maximum number of comments to analyze. Defaults to 5000. (Optional)
+        replace_more_limit (Optional[int]): The maximum number of "load more
+                                            comments" requests; None means no
+                                            limit. Defaults to 32. (Optional)
+        top_n (int): How many of the most active authors to list. Defaults to 10. (Optional)
+        bins (int): The number of time buckets in the activity histogram. Defaults to 24. (Optional)
+        deadline_seconds (float): Stop reading after this many seconds and
+                                  analyze what was read, marked 'partial'.
+                                  Defaults to 50. (Optional)
+
+    Returns:
+        dict: A dictionary containing the statistics, with 'complete' False
+              when only part of the thread was read. Failed "load more"
+              requests are listed under 'errors' and mark the result partial.
+    """
+    if sort not in COMMENT_SORTS:
+        return {"successful": False, "error": f"Invalid sort. Use one of: {COMMENT_SORTS}"}
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    try:
+        walker = CommentWalker(article, sort=sort, replace_more_limit=replace_more_limit)
+        walker.load(limit=min(max(max_comments, 1), 500))
+        columns, authors, stopped = _load_comment_arrays(walker, max(max_comments, 1))
+        submission = walker.submission
+        args = (columns, authors, submission.get("author"), submission.get("created_utc") or 0.0,
+                max(top_n, 0), max(bins, 1))
+        summary = summarize_comment_arrays(np, *args) if np is not None else summarize_comment_lists(*args)
+        summary["post"] = {
+            "id": submission.get("id"),
+            "title": submission.get("title"),
+            "num_comments": submission.get("num_comments")
+        }
+        summary["complete"] = not walker.has_more()
+        summary["requests"] = walker.requests_made
+        response = {"successful": True, "data": summary}
+        if stopped:
+            response["partial"] = True
+        if walker.errors:
+            # Subtrees behind these failed "load more" requests are missing.
+            response.update(partial=True, errors=walker.errors)
+        return response
+    except Exception as e:
+        note_tool_error(e)
+        return {"successful": False, "error": f"Failed to analyze comments for article ID '{article}': {str(e)}."}
+
+
+@reddit_tool()
+def retrieve_reddit_posts(subreddit: str, size: int = 5, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves a number of hot posts from a specified subreddit.
 
     Fetches a list of posts from the "hot" section of a given subreddit,
@@ -331,27 +3076,32 @@ def retrieve_reddit_posts(subreddit: str, size: int = 5) -> dict:
     Args:
         subreddit (str): The name of the subreddit (e.g., 'python'). (Required)
         size (int): The maximum number of posts to retrieve. Defaults to 5. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        dict: A dictionary containing a list of post objects. Each object
-              includes the title, ID, URL, score, and author.
+        dict: A dictionary containing a list of post objects holding the
+              requested fields.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
-    posts = []
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     try:
-        for submission in reddit.subreddit(subreddit).hot(limit=size):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "url": submission.url,
-                "score": submission.score,
-                "author": str(submission.author)
-            })
-        
-        return {"successful": True, "data": posts}
+        posts, cursors = list_posts(f"/r/{subreddit}/hot", size, fields, after=after, before=before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve posts for r/{subreddit}: {str(e)}."}
-@mcp.tool()
-def retrieve_specific_content(id: str) -> dict:
+@reddit_tool()
+def retrieve_specific_content(id: str, max_chars: Optional[int] = None) -> dict:
     """Retrieves detailed information for a specific post or comment.
 
     Fetches data for a single Reddit content item, identified by its unique
@@ -360,38 +3110,182 @@ def retrieve_specific_content(id: str) -> dict:
     Args:
         id (str): The fullname ID of the post (e.g., 't3_abcxyz') or comment
                   (e.g., 't1_abcxyz') to retrieve. (Required)
+        max_chars (int): Output budget in characters of JSON. Over budget, the
+                         body text (then the title) is cut and the number of
+                         elided characters is reported under 'truncated'. (Optional)
 
     Returns:
         dict: A dictionary containing detailed information about the content,
               such as ID, author, score, and body or title text.
     """
     try:
-        item = next(reddit.info(fullnames=[id]))
-
-        data = {
-            "id": item.id,
-            "fullname": item.fullname,
-            "object_type": item.fullname.split('_')[0],
-            "score": getattr(item, 'score', None),
-            "author": str(getattr(item, 'author', 'Unknown')),
-            "created_utc": getattr(item, 'created_utc', None)
-        }
-
-        if data["object_type"] == 't3':
-            data['title'] = getattr(item, 'title', None)
-            data['text_body'] = getattr(item, 'selftext', None)
-        
-        elif data["object_type"] == 't1':
-            data['body'] = getattr(item, 'body', None)
-
-        return {"successful": True, "data": data}
-    except StopIteration:
-        return {"successful": False, "error": f"Content not found for ID: {id}."}
+        # Through /api/info, so the item also reaches the local corpus index.
+        found, failed = fetch_things([id])
+        if id in failed:
+            return {"successful": False, "error": f"Failed to retrieve content: {failed[id]}"}
+        if id not in found:
+            return {"successful": False, "error": f"Content not found for ID: {id}."}
+        data = _serialize_content(found[id]["kind"], found[id]["data"])
+        return budget_response({"successful": True, "data": data}, max_chars, ("text_body", "body", "title"))
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve content: {str(e)}"}
     
-@mcp.tool()
-def search_across_subreddits(search_query: str, limit: int = 5, restrict_sr: bool = False, sort: str = 'relevance') -> dict:
+INFO_BATCH_SIZE = 100
+
+
+def _serialize_content(kind: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds the `retrieve_specific_content` payload from raw thing JSON."""
+    content = {
+        "id": data.get("id"),
+        "fullname": data.get("name"),
+        "object_type": kind,
+        "score": data.get("score"),
+        "author": str(data.get("author")),
+        "created_utc": data.get("created_utc")
+    }
+    if kind == 't3':
+        content['title'] = data.get('title')
+        content['text_body'] = data.get('selftext')
+    elif kind == 't1':
+        content['body'] = data.get('body')
+    return content
+
+
+def fetch_things(fullnames: list) -> tuple:
+    """Resolves fullnames through /api/info, INFO_BATCH_SIZE per request.
+
+    The chunks are requested concurrently. Returns `(found, failed)`: raw
+    things by fullname, and error messages by fullname for the chunks whose
+    request failed. Fullnames in neither do not exist.
+    """
+    def fetch_chunk(chunk):
+        response = reddit.request(
+            method="GET", path="/api/info", params={"id": ",".join(chunk), "raw_json": 1}
+        )
+        return response["data"]["children"]
+
+    chunks = [fullnames[i:i + INFO_BATCH_SIZE] for i in range(0, len(fullnames), INFO_BATCH_SIZE)]
+    found = {}
+    failed = {}
+    for chunk, (ok, outcome) in zip(chunks, run_concurrently(fetch_chunk, chunks)):
+        if not ok:
+            failed.update(dict.fromkeys(chunk, str(outcome)))
+            continue
+        corpus_index.add(outcome)
+        for child in outcome:
+            found[child["data"]["name"]] = child
+    return found, failed
+
+
+BATCH_MAX_ITEMS = 1000
+
+
+def _fullname(id: str, kinds: tuple) -> Optional[str]:
+    """Returns `id` as a fullname of one of `kinds`, prefixing bare IDs with the first, or None."""
+    prefix, _, rest = id.partition('_')
+    if rest and len(prefix) == 2 and prefix[0] == 't' and prefix[1].isdigit():
+        return id if prefix in kinds else None
+    return f"{kinds[0]}_{id}"
+
+
+def run_batch(ids: list, action, verb: str, kinds: tuple, dry_run: bool = False, concurrent: bool = True) -> Dict[str, Any]:
+    """Applies `action(fullname)` to every distinct ID and reports per item.
+
+    `action` returns a status message or raises. The items run concurrently
+    on the fan-out pool, in the calling tool's scheduler lane, so a batch
+    is paced by the same rate budget as single calls; with `concurrent=False`
+    they run one after another, in order. A failed item does not stop the
+    others. With `dry_run` nothing is changed: the items are looked up through
+    /api/info and each result says whether it exists and what would be done,
+    from `verb`, a template such as "delete comment {}".
+    """
+    if len(ids) > BATCH_MAX_ITEMS:
+        return {"successful": False, "error": f"At most {BATCH_MAX_ITEMS} IDs can be given per call."}
+    results = {}
+    wanted = []
+    for id in dict.fromkeys(ids):
+        fullname = _fullname(id, kinds)
+        if fullname is None:
+            results[id] = {"id": id, "successful": False,
+                           "error": f"Invalid ID. Must start with {' or '.join(repr(kind + '_') for kind in kinds)}."}
+        else:
+            if fullname not in wanted:
+                wanted.append(fullname)
+            results[id] = fullname
+
+    def _run():
+        outcomes = {}
+        if dry_run:
+            found, failed = fetch_things(wanted)
+            for fullname in wanted:
+                if fullname in found:
+                    data = found[fullname]["data"]
+                    outcomes[fullname] = {"successful": True, "status": f"Would {verb.format(repr(fullname))}.",
+                                          "author": data.get("author"), "subreddit": data.get("subreddit")}
+                else:
+                    outcomes[fullname] = {"successful": False, "error": failed.get(fullname, "Content not found.")}
+        else:
+            if concurrent:
+                done = run_concurrently(action, wanted)
+            else:
+                done = [run_concurrently(action, [fullname])[0] for fullname in wanted]
+            for fullname, (ok, outcome) in zip(wanted, done):
+                if ok:
+                    outcomes[fullname] = {"successful": True, "status": outcome}
+                else:
+                    note_tool_error(outcome)
+                    outcomes[fullname] = {"successful": False, "error": str(outcome)}
+        items = []
+        for id, result in results.items():
+            items.append({"id": id, "fullname": result, **outcomes[result]} if isinstance(result, str) else result)
+        succeeded = sum(1 for item in items if item["successful"])
+        return {"dry_run": dry_run, "succeeded": succeeded, "failed": len(items) - succeeded, "results": items}
+    return safe_execute(_run)
+
+
+@reddit_tool()
+def retrieve_contents_batch(ids: list[str]) -> Dict[str, Any]:
+    """Retrieves many posts and comments in as few requests as possible.
+
+    Resolves fullnames through Reddit's /api/info endpoint, 100 per request,
+    with the requests for each chunk made concurrently. Results come back in
+    the same order as `ids`.
+
+    Args:
+        ids (list[str]): Fullname IDs of posts (t3_...), comments (t1_...) or
+                         subreddits (t5_...) to retrieve. (Required)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing one entry per input ID. Found
+                        items have 'found': True and the same fields as
+                        `retrieve_specific_content`; missing or invalid IDs
+                        have 'found': False and an 'error' message.
+    """
+    def _get():
+        wanted = []
+        for fullname in ids:
+            if fullname.split('_')[0] in ('t1', 't3', 't5') and fullname not in wanted:
+                wanted.append(fullname)
+        things, failed = fetch_things(wanted)
+        found = {name: _serialize_content(child["kind"], child["data"]) for name, child in things.items()}
+
+        results = []
+        for fullname in ids:
+            if fullname in found:
+                results.append({"found": True, **found[fullname]})
+            elif fullname in failed:
+                results.append({"fullname": fullname, "found": False, "error": failed[fullname]})
+            elif fullname in wanted:
+                results.append({"fullname": fullname, "found": False, "error": "Content not found."})
+            else:
+                results.append({"fullname": fullname, "found": False, "error": "Invalid fullname. Must start with 't1_', 't3_' or 't5_'."})
+        return results
+    return safe_execute(_get)
+
+
+@reddit_tool()
+def search_across_subreddits(search_query: str, limit: int = 5, restrict_sr: bool = False, sort: str = 'relevance', after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Searches for posts across all of Reddit.
 
     Performs a global search for a given query and returns matching posts.
@@ -403,35 +3297,93 @@ def search_across_subreddits(search_query: str, limit: int = 5, restrict_sr: boo
         limit (int): The maximum number of results to return. Defaults to 5. (Optional)
         restrict_sr (bool): This parameter is ignored by the function. (Optional)
         sort (str): The method for sorting results. Defaults to 'relevance'. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of post objects that match the
               search query.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
-    results = []
-    try:
-        search_results = reddit.subreddit('all').search(
-            query=search_query,
-            sort=sort,
-            limit=limit,
-            syntax='lucene'
-        )
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    def serialize(child):
+        if child["kind"] != 't3':
+            return None
+        item = child["data"]
+        return {
+            "type": "post",
+            "title": item.get("title"),
+            "id": item["id"],
+            "subreddit": item.get("subreddit"),
+            "score": item.get("score"),
+            "created_utc": item.get("created_utc")
+        }
 
-        for item in search_results:
-            if hasattr(item, 'title'):
-                results.append({
-                    "type": "post",
-                    "title": item.title,
-                    "id": item.id,
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc
-                })
-        
-        return {"successful": True, "data": results}
+    try:
+        params = {"q": search_query, "sort": sort, "syntax": 'lucene', "t": 'all'}
+        results, cursors = read_listing("/r/all/search", limit, serialize, params, after, before)
+        return format_response({"successful": True, "data": results, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to perform search: {str(e)}."}
-@mcp.tool()
+
+
+@reddit_tool()
+def search_local_corpus(query: str, subreddit: Optional[str] = None, time_range: str = 'all', kind: Optional[str] = None, author: Optional[str] = None, sort: str = 'relevance', limit: int = 25, format: str = 'records') -> dict:
+    """Searches the posts and comments this server has already fetched.
+
+    Every post and comment returned by a listing, comment or batch tool is
+    kept in a local full-text index, so this answers in milliseconds and
+    makes no request to Reddit. It only finds what was fetched before, for
+    at most REDDIT_MCP_CORPUS_RETENTION_DAYS. The query supports SQLite FTS5
+    syntax: words, "exact phrases", prefix*, AND, OR, NOT and
+    title:word; anything else is searched as plain words.
+
+    Args:
+        query (str): The words or FTS5 query to search for. (Required)
+        subreddit (str): Only return items from this subreddit. (Optional)
+        time_range (str): Only return items created within the last 'hour',
+                          'day', 'week', 'month' or 'year'. Defaults to
+                          'all'. (Optional)
+        kind (str): 'post' or 'comment' to return only that type. (Optional)
+        author (str): Only return items by this user. (Optional)
+        sort (str): 'relevance' (title matches weigh double), 'new' or
+                    'top'. Defaults to 'relevance'. (Optional)
+        limit (int): The maximum number of results, up to 100. Defaults to
+                     25. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
+
+    Returns:
+        dict: A dictionary containing the matching items with fullname, type,
+              subreddit, author, created_utc, score, title, permalink,
+              link_id, a 'snippet' with matches in [brackets], and 'rank'
+              (higher is more relevant).
+    """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    if time_range not in CORPUS_TIME_RANGES:
+        return {"successful": False, "error": f"time_range must be one of: {', '.join(CORPUS_TIME_RANGES)}."}
+    if sort not in CORPUS_SORTS:
+        return {"successful": False, "error": f"sort must be one of: {', '.join(CORPUS_SORTS)}."}
+    if kind not in (None, 'post', 'comment'):
+        return {"successful": False, "error": "kind must be 'post' or 'comment'."}
+    if not corpus_index.enabled:
+        return {"successful": False, "error": "The local corpus is disabled (REDDIT_MCP_CORPUS_MB=0)."}
+    kind = {'post': 't3', 'comment': 't1'}.get(kind)
+    limit = max(1, min(limit, 100))
+    response = safe_execute(lambda: corpus_index.search(query, subreddit, time_range, kind, author, sort, limit))
+    return format_response(response, format)
+
+
+@reddit_tool(cache_ttl=900)
 def get_subreddit_details(subreddit: str) -> dict:
     """Retrieves metadata for a specified subreddit.
 
@@ -458,8 +3410,9 @@ def get_subreddit_details(subreddit: str) -> dict:
             }
         }
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": str(e)}
-@mcp.tool()
+@reddit_tool(write=True)
 def send_private_message(recipient: str, subject: str, message: str) -> dict:
     """Sends a private message to a specified Reddit user.
 
@@ -479,38 +3432,274 @@ def send_private_message(recipient: str, subject: str, message: str) -> dict:
         reddit.redditor(recipient).message(subject=subject, body=message)
         return {"successful": True, "data": {"status": f"Message sent to {recipient}."}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to send message: {str(e)}"}
 
-@mcp.tool()
-def get_new_submissions(subreddit: str, limit: int = 5) -> dict:
+FEED_MAX_POSTS = 250
+FEED_MIN_REFRESH_SECONDS = 2.0
+FEED_VERIFY_SECONDS = 60.0
+WATCH_INTERVAL_SECONDS = float(os.environ.get("REDDIT_MCP_WATCH_INTERVAL", "30"))
+INBOX_POLL_SECONDS = float(os.environ.get("REDDIT_MCP_INBOX_INTERVAL", "15"))
+
+
+def _post_number(post_id: str) -> int:
+    # Reddit ids are base 36 counters, so a larger number is a newer post.
+    return int(post_id[3:] if post_id.startswith('t3_') else post_id, 36)
+
+
+class SubredditFeed:
+    """The newest posts of one subreddit, kept current with small incremental fetches.
+
+    `posts` holds raw listing JSON, newest first, with no gaps: every post
+    newer than the last one in the list is in it. A refresh asks only for
+    posts newer than the newest known one (`before=`), so an idle subreddit
+    costs one near-empty response. Because that anchor may have been
+    removed, which makes Reddit return nothing, an empty answer is checked
+    against a plain first page at most every `FEED_VERIFY_SECONDS`.
+    """
+
+    def __init__(self, subreddit: str):
+        self.subreddit = subreddit
+        self.posts = []
+        self.refreshed_at = 0.0
+        self.verified_at = 0.0
+        self.exhausted = False
+        self._lock = threading.Lock()
+
+    def refresh(self, max_age: float = 0.0) -> None:
+        """Fetches new posts unless the feed was refreshed within `max_age` seconds."""
+        with self._lock:
+            if time.monotonic() - self.refreshed_at < max_age:
+                return
+            path = f"/r/{self.subreddit}/new"
+            if not self.posts:
+                self._replace([child["data"] for child in fetch_listing(path, LISTING_PAGE_SIZE)])
+            else:
+                fresh = self._fetch_newer(path)
+                if fresh:
+                    self.posts[:0] = fresh
+                elif time.monotonic() - self.verified_at >= FEED_VERIFY_SECONDS:
+                    self._merge_first_page(path)
+                del self.posts[FEED_MAX_POSTS:]
+            self.refreshed_at = time.monotonic()
+
+    def _replace(self, posts: list) -> None:
+        self.posts = posts[:FEED_MAX_POSTS]
+        self.exhausted = len(posts) < LISTING_PAGE_SIZE
+        self.verified_at = time.monotonic()
+
+    def _fetch_newer(self, path: str) -> list:
+        fresh = []
+        anchor = self.posts[0]["name"]
+        while len(fresh) < FEED_MAX_POSTS:
+            listing = reddit.request(method="GET", path=path,
+                                     params={"limit": LISTING_PAGE_SIZE, "before": anchor, "raw_json": 1})
+            corpus_index.add(listing["data"]["children"])
+            page = [child["data"] for child in listing["data"]["children"]]
+            fresh[:0] = page
+            if len(page) < LISTING_PAGE_SIZE:
+                break
+            anchor = page[0]["name"]
+        return fresh
+
+    def _merge_first_page(self, path: str) -> None:
+        page = [child["data"] for child in fetch_listing(path, 25)]
+        known = {post["name"] for post in self.posts}
+        if page and page[-1]["name"] not in known and _post_number(page[-1]["id"]) > _post_number(self.posts[0]["id"]):
+            # More new posts than one page while the anchor was dead: the
+            # old buffer no longer connects, so start over from this page.
+            self._replace(page)
+            return
+        newest = _post_number(self.posts[0]["id"])
+        self.posts[:0] = [post for post in page if post["name"] not in known and _post_number(post["id"]) > newest]
+        self.verified_at = time.monotonic()
+
+    def extend_back(self, is_newer) -> None:
+        """Pages further back until the oldest buffered post fails `is_newer`."""
+        with self._lock:
+            path = f"/r/{self.subreddit}/new"
+            while (self.posts and not self.exhausted and len(self.posts) < FEED_MAX_POSTS
+                   and is_newer(self.posts[-1])):
+                listing = reddit.request(method="GET", path=path, params={
+                    "limit": LISTING_PAGE_SIZE, "after": self.posts[-1]["name"], "raw_json": 1
+                })
+                corpus_index.add(listing["data"]["children"])
+                page = [child["data"] for child in listing["data"]["children"]]
+                self.posts.extend(page[:FEED_MAX_POSTS - len(self.posts)])
+                self.exhausted = len(page) < LISTING_PAGE_SIZE
+
+    def newer_than(self, is_newer) -> list:
+        with self._lock:
+            return [post for post in self.posts if is_newer(post)]
+
+
+_feeds = OrderedDict()
+_feeds_lock = threading.Lock()
+MAX_FEEDS = 256
+
+
+def subreddit_feed(subreddit: str) -> SubredditFeed:
+    key = subreddit.strip().lower()
+    with _feeds_lock:
+        feed = _feeds.get(key)
+        if feed is None:
+            feed = _feeds[key] = SubredditFeed(key)
+            for stale in list(_feeds)[:max(len(_feeds) - MAX_FEEDS, 0)]:
+                if poller.interval(f"new/{stale}") is None:
+                    del _feeds[stale]
+        _feeds.move_to_end(key)
+        return feed
+
+
+def since_predicate(since: str):
+    """Turns a `since` cursor (a t3_ fullname or a UNIX timestamp) into a post filter."""
+    if since.startswith('t3_'):
+        number = _post_number(since)
+        return lambda post: _post_number(post["id"]) > number
+    try:
+        timestamp = float(since)
+    except ValueError:
+        raise ValueError("Invalid since cursor. Use a post fullname (e.g. 't3_abcxyz') or a UNIX timestamp.")
+    return lambda post: post.get("created_utc", 0) > timestamp
+
+
+def new_submissions_since(subreddit: str, since: str, limit: int, fields: Optional[list] = None) -> Dict[str, Any]:
+    """Serves the posts newer than `since` from the subreddit's feed, oldest `limit` first."""
+    projection = post_projection(fields)
+    is_newer = since_predicate(since)
+    feed = subreddit_feed(subreddit)
+    watched = poller.interval(f"new/{feed.subreddit}")
+    feed.refresh(max_age=watched or FEED_MIN_REFRESH_SECONDS)
+    feed.extend_back(is_newer)
+    newer = feed.newer_than(is_newer)
+    page = newer[-limit:] if limit > 0 else []
+    next_cursor = page[0]["name"] if page else since
+    return {
+        "successful": True,
+        "data": serialize_posts([{"data": post} for post in page], projection),
+        "next_cursor": next_cursor,
+        "has_more": len(newer) > len(page),
+        # The cursor is older than anything the feed can hold, so posts
+        # between it and the first returned one were skipped.
+        "gap": bool(newer) and newer[-1] is feed.posts[-1] and not feed.exhausted
+    }
+
+
+async def _get_new_submissions_async(subreddit: str, limit: int = 5, fields: Optional[list[str]] = None, since: Optional[str] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
+    if since is not None:
+        # Cursor reads are served from the shared feed, which is synchronous.
+        return await anyio.to_thread.run_sync(
+            contextvars.copy_context().run, functools.partial(get_new_submissions, subreddit, limit, fields, since, format=format),
+            limiter=_worker_limiter
+        )
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    try:
+        posts, cursors = await read_listing_async(f"/r/{subreddit}/new", limit, post_serializer(fields), after=after, before=before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
+    except Exception as e:
+        note_tool_error(e)
+        return {"successful": False, "error": f"Failed to retrieve new posts: {str(e)}"}
+
+@reddit_tool(native_async=_get_new_submissions_async)
+def get_new_submissions(subreddit: str, limit: int = 5, fields: Optional[list[str]] = None, since: Optional[str] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves the newest posts from a subreddit.
 
     Fetches a list of the most recent submissions in a given subreddit,
     sorted chronologically.
 
+    With `since`, only posts newer than the cursor are returned, together
+    with a `next_cursor` to pass on the next poll. If more than `limit` new
+    posts are waiting, the oldest of them are returned first and `has_more`
+    is True. Cursor reads share one incrementally refreshed copy of the
+    subreddit's newest posts, which `watch_subreddit` keeps warm. That copy
+    holds at most 250 posts; 'gap' is True when the cursor is older than
+    all of them and some posts were skipped.
+
     Args:
         subreddit (str): The name of the subreddit. (Required)
         limit (int): The maximum number of posts to retrieve. Defaults to 5. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        since (str): A post fullname (e.g. 't3_abcxyz') or UNIX timestamp; only
+                     newer posts are returned. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        dict: A dictionary containing a list of the newest post objects,
-              including title, ID, URL, and author.
+        dict: A dictionary containing a list of the newest post objects
+              holding the requested fields, plus 'next_cursor', 'has_more'
+              and 'gap' when `since` is given, or else 'after' and 'before'
+              cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     try:
-        posts = []
-        for submission in reddit.subreddit(subreddit).new(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "url": submission.url,
-                "created_utc": submission.created_utc,
-                "author": str(submission.author)
-            })
-        return {"successful": True, "data": posts}
+        if since is not None:
+            return format_response(new_submissions_since(subreddit, since, limit, fields), format)
+        posts, cursors = list_posts(f"/r/{subreddit}/new", limit, fields, after=after, before=before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve new posts: {str(e)}"}
-@mcp.tool()
-def get_user_comments(username: str, limit: int = 10) -> dict:
+@reddit_tool(coalesce=False)
+def watch_subreddit(subreddit: str, interval_seconds: int = 30) -> Dict[str, Any]:
+    """Keeps a subreddit's newest posts warm on the server.
+
+    A background poller refreshes the subreddit's new-post feed every
+    `interval_seconds`, so `get_new_submissions` calls with `since` are
+    answered without contacting Reddit. Calling it again changes the interval.
+
+    Args:
+        subreddit (str): The name of the subreddit to watch. (Required)
+        interval_seconds (int): Seconds between refreshes. Defaults to 30. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with the watched subreddits and their
+                        poll state.
+    """
+    def _watch():
+        feed = subreddit_feed(subreddit)
+        poller.schedule(f"new/{feed.subreddit}", interval_seconds, feed.refresh)
+        return watched_subreddits()
+    return safe_execute(_watch)
+
+
+@reddit_tool(coalesce=False)
+def unwatch_subreddit(subreddit: str) -> Dict[str, Any]:
+    """Stops the background refresh of a watched subreddit.
+
+    Args:
+        subreddit (str): The name of the subreddit to stop watching. (Required)
+
+    Returns:
+        Dict[str, Any]: A dictionary with the remaining watched subreddits.
+    """
+    def _unwatch():
+        if not poller.cancel(f"new/{subreddit.strip().lower()}"):
+            raise ValueError(f"r/{subreddit} is not being watched.")
+        return watched_subreddits()
+    return safe_execute(_unwatch)
+
+
+def watched_subreddits() -> Dict[str, Any]:
+    return {key[4:]: job for key, job in poller.jobs().items() if key.startswith("new/")}
+
+
+for _subreddit in filter(None, os.environ.get("REDDIT_MCP_WATCH_SUBREDDITS", "").split(",")):
+    # Starts the poller thread, but nothing is fetched until its first run.
+    _feed = subreddit_feed(_subreddit)
+    poller.schedule(f"new/{_feed.subreddit}", WATCH_INTERVAL_SECONDS, _feed.refresh)
+
+
+@reddit_tool(progress=True)
+def get_user_comments(username: str, limit: int = 10, after: Optional[str] = None, before: Optional[str] = None, deadline_seconds: Optional[float] = None, format: str = 'records') -> dict:
     """Retrieves the most recent comments made by a user.
 
     Fetches a list of a user's latest comments from across Reddit, sorted
@@ -519,26 +3708,43 @@ def get_user_comments(username: str, limit: int = 10) -> dict:
     Args:
         username (str): The Reddit username whose comments to retrieve. (Required)
         limit (int): The maximum number of comments to return. Defaults to 10. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        deadline_seconds (float): Stop after this many seconds and return the
+                                  items read so far, marked 'partial'.
+                                  Defaults to 50. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of comment objects, including the
               comment ID, subreddit, body, and score.
+              'after' and 'before' are cursors for the neighbouring pages, and
+              'partial' is True when the deadline cut the read short.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    def serialize(child):
+        comment = child["data"]
+        return {
+            "comment_id": comment["id"],
+            "subreddit": comment.get("subreddit"),
+            "body": comment.get("body"),
+            "score": comment.get("score"),
+            "created_utc": comment.get("created_utc")
+        }
+
     try:
-        comments = []
-        for comment in reddit.redditor(username).comments.new(limit=limit):
-            comments.append({
-                "comment_id": comment.id,
-                "subreddit": str(comment.subreddit),
-                "body": comment.body,
-                "score": comment.score,
-                "created_utc": comment.created_utc
-            })
-        return {"successful": True, "data": comments}
+        comments, cursors = read_listing(f"/user/{username}/comments", limit, serialize, {"sort": "new"}, after, before)
+        return format_response({"successful": True, "data": comments, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve comments for {username}: {str(e)}"}
-@mcp.tool()
-def get_top_posts(subreddit: str, time_filter: str = 'day', limit: int = 10) -> dict:
+@reddit_tool()
+def get_top_posts(subreddit: str, time_filter: str = 'day', limit: int = 10, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves the top-scoring posts from a subreddit for a time period.
 
     Fetches the highest-scoring posts based on a specified time frame.
@@ -548,27 +3754,34 @@ def get_top_posts(subreddit: str, time_filter: str = 'day', limit: int = 10) ->
         subreddit (str): The name of the subreddit. (Required)
         time_filter (str): The time window to filter by. Defaults to 'day'. (Optional)
         limit (int): The maximum number of posts to retrieve. Defaults to 10. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of the top-scoring post objects
               for the specified time frame.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     if time_filter not in ['hour', 'day', 'week', 'month', 'year', 'all']:
         return {"successful": False, "error": "Invalid time_filter. Use 'hour', 'day', 'week', 'month', 'year', or 'all'."}
         
     try:
-        posts = []
-        for submission in reddit.subreddit(subreddit).top(time_filter=time_filter, limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "score": submission.score,
-                "author": str(submission.author)
-            })
-        return {"successful": True, "data": posts}
+        posts, cursors = list_posts(f"/r/{subreddit}/top", limit, fields, {"t": time_filter}, after, before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve top posts: {str(e)}"}
-@mcp.tool()
+@reddit_tool()
 def get_submission_details(submission_id: str) -> dict:
     """Retrieves metadata for a single post using its short ID.
 
@@ -583,23 +3796,42 @@ def get_submission_details(submission_id: str) -> dict:
               number of comments, and whether it is a self-post.
     """
     try:
-        submission = reddit.submission(submission_id)
-        
-        return {
-            "successful": True,
-            "data": {
-                "title": submission.title,
-                "subreddit": str(submission.subreddit),
-                "upvote_ratio": submission.upvote_ratio,
-                "num_comments": submission.num_comments,
-                "is_self": submission.is_self
+        key = submission_id if submission_id.startswith('t3_') else f"t3_{submission_id}"
+        found, details = disk_cache.get(key)
+        if not found:
+            things, failed = fetch_things([key])
+            if key in failed:
+                return {"successful": False, "error": f"Submission lookup failed: {failed[key]}"}
+            if key not in things:
+                return {"successful": False, "error": f"Submission not found for ID: {submission_id}."}
+            post = things[key]["data"]
+            details = {
+                "title": post.get("title"),
+                "subreddit": post.get("subreddit"),
+                "upvote_ratio": post.get("upvote_ratio"),
+                "num_comments": post.get("num_comments"),
+                "is_self": post.get("is_self")
             }
-        }
+            disk_cache.set(key, "submission", details)
+        return {"successful": True, "data": details}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Submission lookup failed: {str(e)}"}
 
-@mcp.tool()
-def vote_on_content(fullname: str, direction: int = 1) -> dict:
+def _cast_vote(fullname: str, direction: int) -> Dict[str, Any]:
+    kind, id = fullname.split('_', 1)
+    thing = reddit.comment(id) if kind == 't1' else reddit.submission(id)
+    if direction == 1:
+        thing.upvote()
+    elif direction == -1:
+        thing.downvote()
+    else:
+        thing.clear_vote()
+    return {"status": f"Vote of {direction} cast on {fullname}."}
+
+
+@reddit_tool(write=True)
+def vote_on_content(fullname: str, direction: int = 1, queue: bool = False) -> dict:
     """Casts a vote on a Reddit post or comment.
 
     Applies an upvote, downvote, or removes a vote from a specific content
@@ -610,28 +3842,71 @@ def vote_on_content(fullname: str, direction: int = 1) -> dict:
                         to vote on. (Required)
         direction (int): The vote direction: 1 for upvote, -1 for downvote,
                          or 0 to remove a vote. Defaults to 1. (Optional)
+        queue (bool): Return a job id at once and cast the vote in the
+                      background, retrying on rate limits and server errors.
+                      A queued vote replaces any vote on the same fullname
+                      that is still waiting. Defaults to False. (Optional)
 
     Returns:
-        dict: A dictionary containing a confirmation message on success.
+        dict: A dictionary containing a confirmation message on success, or
+              the 'job_id' of the queued write and the ids of the waiting
+              votes it 'superseded'.
     """
     try:
-        thing = reddit.comment(fullname) if fullname.startswith('t1_') else reddit.submission(fullname)
-        
-        if direction == 1:
-            thing.upvote()
-        elif direction == -1:
-            thing.downvote()
-        elif direction == 0:
-            thing.clear_vote()
-        else:
+        if direction not in (1, -1, 0):
             return {"successful": False, "error": "Invalid direction. Must be 1, -1, or 0."}
-
-        return {"successful": True, "data": {"status": f"Vote of {direction} cast on {fullname}."}}
+        if not fullname.startswith(('t1_', 't3_')):
+            fullname = f"t3_{fullname}"
+        if queue:
+            return {"successful": True, "data": write_queue.enqueue("vote", fullname, {"direction": direction})}
+        return {"successful": True, "data": _cast_vote(fullname, direction)}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Voting failed: {str(e)}"}
 
-@mcp.tool()
-def search_subreddits(query: str, limit: int = 10) -> dict:
+
+@reddit_tool(coalesce=False)
+def get_write_queue_status(job_ids: Optional[list[str]] = None, state: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+    """Reports the outcome of writes queued by `vote_on_content` and `post_reddit_comment`.
+
+    Jobs are 'pending' (waiting, possibly for a retry), 'running', 'done'
+    (with the write's result), 'failed' (with the last error) or
+    'superseded' (a later vote on the same fullname replaced it). Finished
+    jobs are kept for 7 days.
+
+    Args:
+        job_ids (list[str]): Only report these jobs. (Optional)
+        state (str): Only report jobs in this state. (Optional)
+        limit (int): The maximum number of jobs to return, newest first.
+                     Defaults to 50. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with job 'counts' per state and the
+                        'jobs', each with its kind, target, state, attempts,
+                        seconds until the next retry, result or error.
+    """
+    if state is not None and state not in WRITE_JOB_STATES:
+        return {"successful": False, "error": f"state must be one of: {', '.join(WRITE_JOB_STATES)}."}
+    return safe_execute(write_queue.status, job_ids, state, max(1, min(limit, 500)))
+
+
+if os.path.exists(os.path.join(DATA_DIR, write_queue.filename)):
+    # Picks up jobs left pending by a previous run, now that the write helpers
+    # exist; the database is only opened by the poller thread.
+    write_queue.start(run_now=True)
+
+def _serialize_subreddit(child: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds a subreddit search result from raw `t5` JSON."""
+    sub = child["data"]
+    return {
+        "name": sub.get("display_name"),
+        "subscribers": sub.get("subscribers"),
+        "public_description": sub.get("public_description")
+    }
+
+
+@reddit_tool()
+def search_subreddits(query: str, limit: int = 10, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Searches for subreddits by name or description.
 
     Finds Reddit communities that match a given search query and returns
@@ -640,23 +3915,28 @@ def search_subreddits(query: str, limit: int = 10) -> dict:
     Args:
         query (str): The text to search for in subreddit names and descriptions. (Required)
         limit (int): The maximum number of subreddits to return. Defaults to 10. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of matching subreddits, each with its
               name, subscriber count, and public description.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     try:
-        subreddits = []
-        for sub in reddit.subreddits.search(query, limit=limit):
-            subreddits.append({
-                "name": str(sub.display_name),
-                "subscribers": sub.subscribers,
-                "public_description": sub.public_description
-            })
-        return {"successful": True, "data": subreddits}
+        subreddits, cursors = read_listing("/subreddits/search", limit, _serialize_subreddit, {"q": query}, after, before)
+        return format_response({"successful": True, "data": subreddits, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Subreddit search failed: {str(e)}"}
-@mcp.tool()
+@reddit_tool()
 def get_redditor_trophies(username: str) -> dict:
     """Retrieves the list of trophies awarded to a user.
 
@@ -670,6 +3950,11 @@ def get_redditor_trophies(username: str) -> dict:
               trophy includes a name, description, and icon URL.
     """
     try:
+        # Redditor fullnames need an extra lookup, so key by name instead.
+        key = f"u/{username.lower()}/trophies"
+        found, trophies = disk_cache.get(key)
+        if found:
+            return {"successful": True, "data": trophies}
         user = reddit.redditor(username)
         trophies = []
         
@@ -679,10 +3964,12 @@ def get_redditor_trophies(username: str) -> dict:
                 "description": getattr(trophy, 'description', 'No description'),
                 "icon_url": getattr(trophy, 'icon_url', None)
             })
+        disk_cache.set(key, "trophies", trophies)
         return {"successful": True, "data": trophies}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve trophies for {username}: {str(e)}"}
-@mcp.tool()
+@reddit_tool(cache_ttl=3600)
 def get_subreddit_rules(subreddit: str) -> dict:
     """Retrieves the official rules for a subreddit.
 
@@ -710,11 +3997,12 @@ def get_subreddit_rules(subreddit: str) -> dict:
         
         return {"successful": True, "data": rule_list}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve rules for r/{subreddit}: {str(e)}"}
 from typing import Optional
 
-@mcp.tool()
-def get_subreddit_listings(subreddit: str, listing_type: str = 'hot', time_filter: Optional[str] = None, limit: int = 10) -> dict:
+@reddit_tool()
+def get_subreddit_listings(subreddit: str, listing_type: str = 'hot', time_filter: Optional[str] = None, limit: int = 10, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves posts from a subreddit based on a listing type.
 
     Fetches posts from a specified listing ('hot', 'top', 'new', 'rising', 
@@ -727,32 +4015,122 @@ def get_subreddit_listings(subreddit: str, listing_type: str = 'hot', time_filte
         time_filter (Optional[str]): The time window for 'top' or 'controversial'
                                      listings. e.g., 'day', 'week', 'all'. (Optional)
         limit (int): The maximum number of posts to return. Defaults to 10. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of post objects from the specified listing.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     listing_type = listing_type.lower()
     if listing_type not in ['hot', 'top', 'new', 'rising', 'controversial']:
         return {"successful": False, "error": "Invalid listing_type."}
         
     try:
-        sub = reddit.subreddit(subreddit)
-        
-        if listing_type == 'hot':
-            submissions = sub.hot(limit=limit)
-        elif listing_type == 'new':
-            submissions = sub.new(limit=limit)
-        elif listing_type == 'rising':
-            submissions = sub.rising(limit=limit)
-        elif listing_type in ['top', 'controversial']:
-            submissions = getattr(sub, listing_type)(time_filter=time_filter or 'day', limit=limit)
-        
-        posts = [{"title": s.title, "id": s.id, "score": s.score, "author": str(s.author)} for s in submissions]
-        
-        return {"successful": True, "data": posts}
+        params = {"t": time_filter or 'day'} if listing_type in ['top', 'controversial'] else None
+        posts, cursors = list_posts(f"/r/{subreddit}/{listing_type}", limit, fields, params, after, before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve {listing_type} posts for r/{subreddit}: {str(e)}"}
-@mcp.tool()
+
+
+# Subreddits per `a+b+c` path; keeps request URLs well under Reddit's limits.
+MULTI_SHARD_SIZE = 25
+MULTI_MAX_SUBREDDITS = 250
+
+
+def _hot_rank(post: Dict[str, Any]) -> float:
+    """Reddit's classic hot ranking, used to merge hot and rising shards."""
+    score = post.get("score") or 0
+    sign = (score > 0) - (score < 0)
+    return sign * math.log10(max(abs(score), 1)) + ((post.get("created_utc") or 0) - 1134028003) / 45000
+
+
+# Merge key per listing type; higher comes first.
+MULTI_LISTING_KEYS = {
+    'hot': _hot_rank,
+    'rising': _hot_rank,
+    'new': lambda post: post.get("created_utc") or 0,
+    'top': lambda post: post.get("score") or 0,
+}
+
+
+@reddit_tool()
+def get_multi_subreddit_listing(subreddits: list[str], listing_type: str = 'hot', limit: int = 25, time_filter: str = 'day', fields: Optional[list[str]] = None, format: str = 'records') -> dict:
+    """Retrieves one merged listing of posts from many subreddits.
+
+    Subreddits are combined into 'a+b+c' multi-subreddit paths of up to 25
+    names, and those shards are fetched in parallel, so watching 40
+    subreddits costs about as long as watching one. The shards are merged
+    by hot rank, time or score and duplicate posts are dropped.
+
+    Args:
+        subreddits (list[str]): The subreddit names, e.g. ['python', 'learnpython']. (Required)
+        listing_type (str): 'hot', 'new', 'top' or 'rising'. Defaults to 'hot'. (Optional)
+        limit (int): The maximum number of posts to return. Defaults to 25. (Optional)
+        time_filter (str): The period for 'top': 'hour', 'day', 'week', 'month',
+                           'year' or 'all'. Defaults to 'day'. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
+
+    Returns:
+        dict: A dictionary containing the merged list of post objects, the
+              number of 'shards' fetched, and 'errors' for shards that failed.
+    """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+    listing_type = listing_type.lower()
+    if listing_type not in MULTI_LISTING_KEYS:
+        return {"successful": False, "error": f"Invalid listing_type. Use one of: {list(MULTI_LISTING_KEYS)}"}
+    names = list(dict.fromkeys(name.strip().lower().removeprefix('r/') for name in subreddits if name.strip()))
+    if not names or len(names) > MULTI_MAX_SUBREDDITS:
+        return {"successful": False, "error": f"Pass between 1 and {MULTI_MAX_SUBREDDITS} subreddits."}
+    try:
+        projection = post_projection(fields)
+        params = {"t": time_filter} if listing_type == 'top' else None
+        shards = ["+".join(names[i:i + MULTI_SHARD_SIZE]) for i in range(0, len(names), MULTI_SHARD_SIZE)]
+
+        def fetch(shard):
+            return read_listing(f"/r/{shard}/{listing_type}", limit, lambda child: child["data"], params)[0]
+
+        results = run_concurrently(fetch, shards)
+        errors = [f"r/{shard}: {outcome}" for shard, (ok, outcome) in zip(shards, results) if not ok]
+        if len(errors) == len(shards):
+            return {"successful": False, "error": "; ".join(errors)}
+
+        # Each shard is put in merge order first: Reddit's own hot order is
+        # close to, but not exactly, the classic hot rank.
+        key = MULTI_LISTING_KEYS[listing_type]
+        merged = heapq.merge(*(sorted(posts, key=key, reverse=True) for ok, posts in results if ok), key=key, reverse=True)
+        seen = set()
+        posts = []
+        for post in merged:
+            if post["name"] in seen:
+                continue
+            seen.add(post["name"])
+            posts.append({name: post.get(raw) for name, raw in projection})
+            if len(posts) >= limit:
+                break
+        return format_response({"successful": True, "data": posts, "shards": len(shards), "errors": errors}, format)
+    except Exception as e:
+        note_tool_error(e)
+        return {"successful": False, "error": f"Failed to retrieve the merged listing: {str(e)}"}
+@reddit_tool(write=True)
 def send_mod_mail(subreddit: str, subject: str, message: str) -> dict:
     """Sends a message to the moderators of a subreddit.
 
@@ -771,9 +4149,10 @@ def send_mod_mail(subreddit: str, subject: str, message: str) -> dict:
         reddit.subreddit(subreddit).message(subject=subject, message=message)
         return {"successful": True, "data": {"status": f"Modmail sent successfully to moderators of r/{subreddit}."}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to send modmail: {str(e)}"}
-@mcp.tool()
-def get_subreddit_sidebar(subreddit: str) -> dict:
+@reddit_tool(cache_ttl=3600)
+def get_subreddit_sidebar(subreddit: str, max_chars: Optional[int] = None) -> dict:
     """Retrieves the content of a subreddit's sidebar.
 
     Fetches the raw markdown description and the short public description
@@ -781,6 +4160,9 @@ def get_subreddit_sidebar(subreddit: str) -> dict:
 
     Args:
         subreddit (str): The name of the subreddit whose sidebar to retrieve. (Required)
+        max_chars (int): Output budget in characters of JSON. Over budget, the
+                         sidebar markdown is cut first and the number of
+                         elided characters is reported under 'truncated'. (Optional)
 
     Returns:
         dict: A dictionary containing the sidebar's markdown content, short
@@ -788,18 +4170,19 @@ def get_subreddit_sidebar(subreddit: str) -> dict:
     """
     try:
         sub = reddit.subreddit(subreddit)
-        return {
+        return budget_response({
             "successful": True,
             "data": {
                 "description_md": getattr(sub, 'description', None),
                 "public_description": getattr(sub, 'public_description', None),
                 "subscribers": getattr(sub, 'subscribers', None)
             }
-        }
+        }, max_chars, ("description_md", "public_description"))
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve sidebar content for r/{subreddit}: {str(e)}"}
-@mcp.tool()
-def get_subreddits_by_topic(topic: str, limit: int = 10) -> dict:
+@reddit_tool()
+def get_subreddits_by_topic(topic: str, limit: int = 10, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves a list of subreddits related to a topic.
 
     Searches for and returns Reddit communities whose topic, name, or
@@ -808,23 +4191,28 @@ def get_subreddits_by_topic(topic: str, limit: int = 10) -> dict:
     Args:
         topic (str): The topic or theme to search for. (Required)
         limit (int): The maximum number of subreddits to return. Defaults to 10. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of related subreddits, each with its
               name, subscriber count, and public description.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     try:
-        subreddits = []
-        for sub in reddit.subreddits.search(topic, limit=limit):
-            subreddits.append({
-                "name": str(sub.display_name),
-                "subscribers": sub.subscribers,
-                "public_description": sub.public_description
-            })
-        return {"successful": True, "data": subreddits}
+        subreddits, cursors = read_listing("/subreddits/search", limit, _serialize_subreddit, {"q": topic}, after, before)
+        return format_response({"successful": True, "data": subreddits, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to search subreddits by topic: {str(e)}"}
-@mcp.tool()
+@reddit_tool(cache_ttl=1800)
 def get_moderators(subreddit: str) -> dict:
     """Retrieves the list of moderators for a subreddit.
 
@@ -846,8 +4234,9 @@ def get_moderators(subreddit: str) -> dict:
             "data": {"moderators": mod_list, "count": len(mod_list)}
         }
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve moderators for r/{subreddit}: {str(e)}"}
-@mcp.tool()
+@reddit_tool()
 def get_user_flair(subreddit: str, username: str) -> dict:
     """Retrieves a user's flair in a specific subreddit.
 
@@ -880,8 +4269,9 @@ def get_user_flair(subreddit: str, username: str) -> dict:
             }
         }
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve flair for {username} in r/{subreddit}: {str(e)}"}
-@mcp.tool()
+@reddit_tool(pinned=True)
 def list_multireddits() -> dict:
     """Lists the authenticated user's Multireddits (Custom Feeds).
 
@@ -903,39 +4293,10 @@ def list_multireddits() -> dict:
             })
         return {"successful": True, "data": multis}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve multireddits: {str(e)}"}
-@mcp.tool()
-def get_multireddit_posts(multireddit_name: str, limit: int = 10) -> dict:
-    """Retrieves hot posts from a user's specific Multireddit.
-
-    Fetches a list of posts from the 'hot' section of one of the authenticated
-    user's custom feeds (Multireddits).
-
-    Args:
-        multireddit_name (str): The name of the Multireddit to retrieve posts from. (Required)
-        limit (int): The maximum number of posts to return. Defaults to 10. (Optional)
-
-    Returns:
-        dict: A dictionary containing a list of post objects from the
-              specified Multireddit.
-    """
-    try:
-        posts = []
-        multi = reddit.multireddit(reddit.user.me().name, multireddit_name)
-        
-        for submission in multi.hot(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "subreddit": str(submission.subreddit),
-                "score": submission.score
-            })
-        return {"successful": True, "data": posts}
-    except Exception as e:
-        return {"successful": False, "error": f"Failed to retrieve posts from multireddit '{multireddit_name}': {str(e)}"}
-    
-@mcp.tool()
-def get_multireddit_posts(multireddit_name: str, limit: int = 10) -> dict:
+@reddit_tool(pinned=True)
+def get_multireddit_posts(multireddit_name: str, limit: int = 10, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves hot posts from a user's specific Multireddit.
 
     Fetches a list of posts from the 'hot' section of one of the authenticated
@@ -944,26 +4305,32 @@ def get_multireddit_posts(multireddit_name: str, limit: int = 10) -> dict:
     Args:
         multireddit_name (str): The name of the Multireddit to retrieve posts from. (Required)
         limit (int): The maximum number of posts to return. Defaults to 10. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of post objects from the
               specified Multireddit.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     try:
-        posts = []
-        multi = reddit.multireddit(reddit.user.me().name, multireddit_name)
-        
-        for submission in multi.hot(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "subreddit": str(submission.subreddit),
-                "score": submission.score
-            })
-        return {"successful": True, "data": posts}
+        path = f"/user/{reddit.user.me().name}/m/{multireddit_name}/hot"
+        posts, cursors = list_posts(path, limit, fields, after=after, before=before)
+        return format_response({"successful": True, "data": posts, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve posts from multireddit '{multireddit_name}': {str(e)}"}
-@mcp.tool()
+@reddit_tool(pinned=True)
 def get_blocked_users() -> dict:
     """Retrieves the authenticated user's list of blocked users.
 
@@ -983,9 +4350,10 @@ def get_blocked_users() -> dict:
             })
         return {"successful": True, "data": {"blocked_users": blocked_users, "count": len(blocked_users)}}
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve blocked users: {str(e)}"}
-@mcp.tool()
-def get_moderated_subs(limit: int = 25) -> dict:
+@reddit_tool(pinned=True)
+def get_moderated_subs(limit: int = 25, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Lists subreddits the authenticated user moderates.
 
     Retrieves a list of all communities for which the authenticated user
@@ -993,24 +4361,33 @@ def get_moderated_subs(limit: int = 25) -> dict:
 
     Args:
         limit (int): The maximum number of subreddits to return. Defaults to 25. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of subreddit objects, each including
               the subreddit's name and subscriber count.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+
+    def serialize(child):
+        return {"name": child["data"].get("display_name"), "subscribers": child["data"].get("subscribers"), "is_moderator": True}
+
     try:
-        subs = []
-        for sub in reddit.user.me().moderator_of(limit=limit):
-            subs.append({
-                "name": str(sub.display_name),
-                "subscribers": sub.subscribers,
-                "is_moderator": True
-            })
-        return {"successful": True, "data": subs}
+        subs, cursors = read_listing("/subreddits/mine/moderator", limit, serialize, after=after, before=before)
+        return format_response({"successful": True, "data": subs, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve moderated subreddits: {str(e)}"}
-@mcp.tool()
-def get_unread_messages(limit: int = 10) -> dict:
+@reddit_tool(pinned=True)
+def get_unread_messages(limit: int = 10, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> dict:
     """Retrieves unread messages from the user's inbox.
 
     Fetches a list of all unread items for the authenticated user, which can
@@ -1018,28 +4395,45 @@ def get_unread_messages(limit: int = 10) -> dict:
 
     Args:
         limit (int): The maximum number of unread items to return. Defaults to 10. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         dict: A dictionary containing a list of unread message objects, each with
               its type, subject, author, and a text preview.
+              'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+
+    def serialize(item):
+        return {
+            "type": item["name"].split('_')[0],
+            "subject": item.get('subject') or 'N/A',
+            "author": str(item.get('author') or 'Reddit'),
+            "is_new": True,
+            "text_preview": (item.get('body') or item.get('subject') or '')[:100]
+        }
+
     try:
-        messages = []
-        for item in reddit.inbox.unread(limit=limit):
-            messages.append({
-                "type": item.fullname.split('_')[0],
-                "subject": getattr(item, 'subject', 'N/A'),
-                "author": str(getattr(item, 'author', 'Reddit')),
-                "is_new": True,
-                "text_preview": getattr(item, 'body', getattr(item, 'subject', ''))[:100]
-            })
-            
-        return {"successful": True, "data": messages}
+        unread = None if (after or before) else inbox_watcher.unread_snapshot(limit)
+        if unread is not None:
+            cursors = {"after": unread[-1]["name"] if len(unread) == limit else None, "before": None}
+            return format_response({"successful": True, "data": [serialize(item) for item in unread], **cursors}, format)
+        messages, cursors = read_listing("/message/unread", limit, lambda child: serialize(child["data"]),
+                                         after=after, before=before)
+        return format_response({"successful": True, "data": messages, **cursors}, format)
     except Exception as e:
+        note_tool_error(e)
         return {"successful": False, "error": f"Failed to retrieve unread messages: {str(e)}"}
 
 
-@mcp.tool()
+@reddit_tool(pinned=True)
 def get_subreddit_traffic_stats(subreddit: str) -> Dict[str, Any]:
     """Retrieves traffic statistics for a moderated subreddit.
 
@@ -1064,7 +4458,7 @@ def get_subreddit_traffic_stats(subreddit: str) -> Dict[str, Any]:
     return safe_execute(_get)
 
 
-@mcp.tool()
+@reddit_tool(write=True)
 def create_post_collection(subreddit: str, title: str, description: str = "") -> Dict[str, Any]:
     """Creates a new post collection in a moderated subreddit.
 
@@ -1096,7 +4490,7 @@ def create_post_collection(subreddit: str, title: str, description: str = "") ->
     return safe_execute(_create)
 
 
-@mcp.tool()
+@reddit_tool(write=True)
 def add_post_to_collection(collection_id: str, post_id: str) -> Dict[str, Any]:
     """Adds a post to an existing collection in a subreddit.
 
@@ -1111,13 +4505,42 @@ def add_post_to_collection(collection_id: str, post_id: str) -> Dict[str, Any]:
         Dict[str, Any]: A dictionary with a status confirmation message.
     """
     def _add():
-        collection = reddit.subreddit(None).collections(collection_id=collection_id)
-        collection.add_post(post_id)
+        from praw.models import Collection
+        collection = Collection(reddit.get_client(), collection_id=collection_id)
+        collection.mod.add_post(post_id)
         return {"status": f"Post '{post_id}' added to collection '{collection_id}'."}
     return safe_execute(_add)
 
 
-@mcp.tool()
+@reddit_tool(write=True)
+def add_posts_to_collection_batch(collection_id: str, post_ids: list[str], dry_run: bool = False) -> Dict[str, Any]:
+    """Adds many posts to an existing collection in a subreddit.
+
+    The posts are added one after another, in the order given, so they keep
+    that order in the collection; one failed item does not stop the others.
+    Requires moderator permissions in the collection's subreddit.
+
+    Args:
+        collection_id (str): The unique ID of the collection. (Required)
+        post_ids (list[str]): Fullname IDs (t3_...) or bare IDs of the posts
+                              to add, at most 1000. (Required)
+        dry_run (bool): Only look the posts up and report what would be
+                        added. Defaults to False. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with 'succeeded' and 'failed' counts and
+                        one result per distinct input ID, with 'successful'
+                        and a 'status' or 'error' message. Dry-run results
+                        also show each item's author and subreddit.
+    """
+    def _add(fullname):
+        from praw.models import Collection
+        Collection(reddit.get_client(), collection_id=collection_id).mod.add_post(fullname)
+        return f"Post '{fullname}' added to collection '{collection_id}'."
+    return run_batch(post_ids, _add, "add post {} to collection " + repr(collection_id), ('t3',), dry_run, concurrent=False)
+
+
+@reddit_tool(write=True)
 def sticky_post(post_id: str, state: bool = True, slot: int = 1) -> Dict[str, Any]:
     """Stickies or un-stickies a post in a subreddit.
 
@@ -1140,7 +4563,43 @@ def sticky_post(post_id: str, state: bool = True, slot: int = 1) -> Dict[str, An
     return safe_execute(_sticky)
 
 
-@mcp.tool()
+@reddit_tool(write=True)
+def sticky_posts_batch(post_ids: list[str], state: bool = True, dry_run: bool = False) -> Dict[str, Any]:
+    """Stickies or un-stickies several posts in a subreddit.
+
+    Stickying fills the slots in the order given, so at most two posts can
+    be stickied per call: the first goes to slot 1, the second to slot 2.
+    Un-stickying runs concurrently for any number of posts. Requires
+    moderator permissions.
+
+    Args:
+        post_ids (list[str]): Fullname IDs (t3_...) or bare IDs of the posts.
+                              (Required)
+        state (bool): Set to `True` to sticky, `False` to un-sticky. Defaults
+                      to `True`. (Optional)
+        dry_run (bool): Only look the posts up and report what would be
+                        done. Defaults to False. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with 'succeeded' and 'failed' counts and
+                        one result per distinct input ID, with 'successful'
+                        and a 'status' or 'error' message. Dry-run results
+                        also show each item's author and subreddit.
+    """
+    order = list(dict.fromkeys(filter(None, (_fullname(id, ('t3',)) for id in post_ids))))
+    if state and len(order) > 2:
+        return {"successful": False, "error": "At most two posts can be stickied at once."}
+
+    def _sticky(fullname):
+        slot = order.index(fullname) + 1
+        reddit.submission(fullname.split('_', 1)[1]).mod.sticky(state=state, bottom=(slot == 2))
+        if state:
+            return f"Post '{fullname}' has been Stickied in slot {slot}."
+        return f"Post '{fullname}' has been Un-stickied."
+    return run_batch(post_ids, _sticky, "sticky post {}" if state else "un-sticky post {}", ('t3',), dry_run, concurrent=not state)
+
+
+@reddit_tool(write=True)
 def add_wiki_editor(subreddit: str, username: str) -> Dict[str, Any]:
     """Grants a user permission to edit a subreddit's wiki.
 
@@ -1160,7 +4619,7 @@ def add_wiki_editor(subreddit: str, username: str) -> Dict[str, Any]:
     return safe_execute(_add)
 
 
-@mcp.tool()
+@reddit_tool(pinned=True)
 def list_approved_submitters(subreddit: str) -> Dict[str, Any]:
     """Lists the approved submitters for a subreddit.
 
@@ -1184,7 +4643,7 @@ def list_approved_submitters(subreddit: str) -> Dict[str, Any]:
         return contributors
     return safe_execute(_get)
 
-@mcp.tool()
+@reddit_tool()
 def list_wiki_pages(subreddit: str) -> Dict[str, Any]:
     """Retrieves a list of all wiki pages in a subreddit.
 
@@ -1202,8 +4661,8 @@ def list_wiki_pages(subreddit: str) -> Dict[str, Any]:
     return safe_execute(_get)
 
 
-@mcp.tool()
-def get_moderation_log(subreddit: str, limit: int = 25) -> Dict[str, Any]:
+@reddit_tool(pinned=True, progress=True)
+def get_moderation_log(subreddit: str, limit: int = 25, after: Optional[str] = None, before: Optional[str] = None, deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
     """Retrieves the moderation log for a subreddit.
 
     Fetches a list of moderator actions performed in a subreddit. This requires
@@ -1212,27 +4671,301 @@ def get_moderation_log(subreddit: str, limit: int = 25) -> Dict[str, Any]:
     Args:
         subreddit (str): The name of the subreddit. (Required)
         limit (int): The maximum number of log entries to retrieve. Defaults to 25. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        deadline_seconds (float): Stop after this many seconds and return the
+                                  items read so far, marked 'partial'.
+                                  Defaults to 50. (Optional)
 
     Returns:
         Dict[str, Any]: A dictionary containing a list of log entries, each with
                         details about the action, target, and moderator.
+                        'after' and 'before' are cursors for the neighbouring pages,
+                        and 'partial' is True when the deadline cut the read short.
     """
+    def serialize(child):
+        log_item = child["data"]
+        return {
+            "action": log_item.get("action"),
+            "target_author": log_item.get("target_author"),
+            "target_fullname": log_item.get("target_fullname"),
+            "description": log_item.get("description"),
+            "moderator": log_item.get("mod"),
+            "created_utc": log_item.get("created_utc")
+        }
+
     def _get():
-        log_entries = []
-        for log_item in reddit.subreddit(subreddit).mod.log(limit=limit):
-            log_entries.append({
-                "action": log_item.action,
-                "target_author": getattr(log_item, 'target_author', None),
-                "target_fullname": getattr(log_item, 'target_fullname', None),
-                "description": getattr(log_item, 'description', None),
-                "moderator": str(log_item.mod),
-                "created_utc": log_item.created_utc
-            })
-        return log_entries
-    return safe_execute(_get)
+        return read_listing(f"/r/{subreddit}/about/log", limit, serialize, after=after, before=before)
+    return safe_execute_listing(_get)
+
+
+MODLOG_PAGE_SIZE = 500
+MODLOG_BACKFILL = 2000
+MODLOG_RETENTION_DAYS = float(os.environ.get("REDDIT_MCP_MODLOG_RETENTION_DAYS", "90"))
+MODLOG_GROUPS = ("moderator", "action", "target_author")
+
 
+class ModlogStore:
+    """A local, indexed copy of subreddit moderation logs in SQLite.
 
-@mcp.tool()
+    `sync` pages through /about/log from the newest entry and stops at the
+    newest entry stored by the previous sync (the high-water mark), so each
+    sync only downloads what is new. When `max_entries` runs out before the
+    mark is reached, the mark still moves to the newest entry and the unread
+    stretch below it is recorded as a gap (a cursor and the old mark), which
+    later syncs fill with the budget left after reading what is new. Entries
+    are indexed by moderator,
+    action, target author and target fullname within a subreddit and time,
+    and entries older than MODLOG_RETENTION_DAYS are pruned. Several server
+    processes may share the database.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = open_database(self.filename)
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS modlog (
+                    id TEXT PRIMARY KEY, subreddit TEXT NOT NULL, created_utc REAL NOT NULL,
+                    action TEXT, moderator TEXT, target_author TEXT, target_fullname TEXT,
+                    target_title TEXT, target_permalink TEXT, details TEXT, description TEXT);
+                CREATE INDEX IF NOT EXISTS modlog_time ON modlog (subreddit, created_utc);
+                CREATE INDEX IF NOT EXISTS modlog_moderator ON modlog (subreddit, moderator, created_utc);
+                CREATE INDEX IF NOT EXISTS modlog_action ON modlog (subreddit, action, created_utc);
+                CREATE INDEX IF NOT EXISTS modlog_target_author ON modlog (subreddit, target_author, created_utc);
+                CREATE INDEX IF NOT EXISTS modlog_target_fullname ON modlog (target_fullname);
+                CREATE TABLE IF NOT EXISTS modlog_sync (
+                    subreddit TEXT PRIMARY KEY, newest_id TEXT, newest_utc REAL, synced_at REAL);
+                CREATE TABLE IF NOT EXISTS modlog_gaps (
+                    subreddit TEXT NOT NULL, after TEXT NOT NULL, stop_id TEXT, stop_utc REAL,
+                    PRIMARY KEY (subreddit, after));
+            """)
+            self._local.connection = connection
+        return connection
+
+    def _read(self, subreddit: str, after: Optional[str], stop_id: Optional[str], stop_utc: Optional[float],
+              max_entries: int) -> tuple:
+        """Reads entries from `after` down to the `stop_id` mark.
+
+        Returns `(entries, reached)`; `reached` is False when `max_entries`
+        ran out first.
+        """
+        fetched = []
+        while len(fetched) < max_entries:
+            params = {"limit": min(MODLOG_PAGE_SIZE, max_entries - len(fetched)), "raw_json": 1}
+            if after:
+                params["after"] = after
+            listing = reddit.request(method="GET", path=f"/r/{subreddit}/about/log", params=params)
+            page = [child["data"] for child in listing["data"]["children"]]
+            for entry in page:
+                if entry["id"] == stop_id or (stop_utc is not None and entry["created_utc"] < stop_utc):
+                    return fetched, True
+                fetched.append(entry)
+            after = listing["data"].get("after")
+            if not after or not page:
+                return fetched, True
+        return fetched, False
+
+    def sync(self, subreddit: str, max_entries: int = MODLOG_BACKFILL) -> Dict[str, Any]:
+        """Fetches entries newer than the high-water mark, then fills recorded gaps, and stores them."""
+        key = subreddit.strip().lower()
+        connection = self._connection()
+        state = connection.execute(
+            "SELECT newest_id, newest_utc FROM modlog_sync WHERE subreddit = ?", (key,)
+        ).fetchone()
+        newest_id, newest_utc = state or (None, None)
+        fetched, caught_up = self._read(subreddit, None, newest_id, newest_utc, max_entries)
+        new_gaps, filled_gaps = [], {}
+        if not caught_up and newest_id is not None and fetched:
+            new_gaps.append((fetched[-1]["id"], newest_id, newest_utc))
+        if fetched:
+            newest_id, newest_utc = fetched[0]["id"], fetched[0]["created_utc"]
+        # The first sync's backfill limit is not a gap: older history was not asked for.
+        caught_up = caught_up or state is None
+        for after, stop_id, stop_utc in connection.execute(
+            "SELECT after, stop_id, stop_utc FROM modlog_gaps WHERE subreddit = ?", (key,)
+        ).fetchall():
+            if len(fetched) >= max_entries:
+                break
+            entries, reached = self._read(subreddit, after, stop_id, stop_utc, max_entries - len(fetched))
+            fetched.extend(entries)
+            filled_gaps[after] = None if reached or not entries else entries[-1]["id"]
+        gaps_left = connection.execute(
+            "SELECT COUNT(*) FROM modlog_gaps WHERE subreddit = ?", (key,)
+        ).fetchone()[0] + len(new_gaps) - sum(1 for cursor in filled_gaps.values() if cursor is None)
+
+        rows = [(
+            entry["id"], key, entry["created_utc"], entry.get("action"), entry.get("mod"),
+            entry.get("target_author"), entry.get("target_fullname"), entry.get("target_title"),
+            entry.get("target_permalink"), entry.get("details"), entry.get("description")
+        ) for entry in fetched]
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            inserted = connection.executemany(
+                "INSERT OR IGNORE INTO modlog VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            ).rowcount
+            connection.execute(
+                "INSERT OR REPLACE INTO modlog_sync VALUES (?, ?, ?, ?)", (key, newest_id, newest_utc, time.time())
+            )
+            for after, cursor in filled_gaps.items():
+                if cursor is None:
+                    connection.execute("DELETE FROM modlog_gaps WHERE subreddit = ? AND after = ?", (key, after))
+                else:
+                    connection.execute(
+                        "UPDATE modlog_gaps SET after = ? WHERE subreddit = ? AND after = ?", (cursor, key, after)
+                    )
+            connection.executemany(
+                "INSERT OR REPLACE INTO modlog_gaps VALUES (?, ?, ?, ?)",
+                [(key, after, stop_id, stop_utc) for after, stop_id, stop_utc in new_gaps]
+            )
+            connection.execute(
+                "DELETE FROM modlog WHERE subreddit = ? AND created_utc < ?",
+                (key, time.time() - MODLOG_RETENTION_DAYS * 86400)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return {
+            "subreddit": key,
+            "fetched": len(fetched),
+            "inserted": max(inserted, 0),
+            # False when max_entries ran out before reaching the previous sync.
+            "caught_up": caught_up,
+            # Unread stretches of the log that later syncs will fill.
+            "gaps": gaps_left,
+            "stored": self.count(key)
+        }
+
+    def count(self, subreddit: str) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM modlog WHERE subreddit = ?", (subreddit.strip().lower(),)
+        ).fetchone()[0]
+
+    def last_synced(self, subreddit: str) -> Optional[float]:
+        row = self._connection().execute(
+            "SELECT synced_at FROM modlog_sync WHERE subreddit = ?", (subreddit.strip().lower(),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def query(self, subreddit: str, moderator: Optional[str] = None, action: Optional[str] = None,
+              target: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None,
+              group_by: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+        clauses, params = ["subreddit = ?"], [subreddit.strip().lower()]
+        if moderator:
+            clauses.append("moderator = ?")
+            params.append(moderator)
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if target:
+            clauses.append("(target_fullname = ? OR target_author = ?)")
+            params.extend((target, target))
+        if since is not None:
+            clauses.append("created_utc >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_utc < ?")
+            params.append(until)
+        where = " AND ".join(clauses)
+        connection = self._connection()
+        total = connection.execute(f"SELECT COUNT(*) FROM modlog WHERE {where}", params).fetchone()[0]
+        if group_by:
+            rows = connection.execute(
+                f"SELECT {group_by}, COUNT(*) AS n FROM modlog WHERE {where} GROUP BY {group_by} ORDER BY n DESC LIMIT ?",
+                params + [limit]
+            ).fetchall()
+            return {"total": total, "groups": [{group_by: value, "count": count} for value, count in rows]}
+        rows = connection.execute(
+            "SELECT id, action, moderator, target_author, target_fullname, target_title, target_permalink,"
+            f" details, description, created_utc FROM modlog WHERE {where} ORDER BY created_utc DESC LIMIT ?",
+            params + [limit]
+        ).fetchall()
+        columns = ("id", "action", "moderator", "target_author", "target_fullname", "target_title",
+                   "target_permalink", "details", "description", "created_utc")
+        return {"total": total, "entries": [dict(zip(columns, row)) for row in rows]}
+
+
+modlog_store = ModlogStore("modlog.sqlite3")
+
+
+@reddit_tool(pinned=True, coalesce=False)
+def sync_moderation_log(subreddit: str, max_entries: int = MODLOG_BACKFILL, interval_seconds: Optional[int] = None) -> Dict[str, Any]:
+    """Copies new moderation log entries into the local modlog store.
+
+    Only entries newer than the last sync are downloaded. The first sync
+    backfills up to `max_entries`. If more than `max_entries` new entries
+    arrived since the last sync, the rest are downloaded by later syncs. With `interval_seconds`, a background
+    poller keeps syncing at that interval; pass 0 to stop it. Requires
+    moderator permissions with 'log' access.
+
+    Args:
+        subreddit (str): The name of the subreddit. (Required)
+        max_entries (int): The maximum number of entries to download in this
+                           sync. Defaults to 2000. (Optional)
+        interval_seconds (Optional[int]): Keep syncing every this many seconds
+                                          in the background; 0 stops. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with the number of entries fetched and
+                        inserted, whether the sync reached the previous one
+                        ('caught_up'), how many unread stretches are left
+                        for later syncs to fill ('gaps'), and the number of
+                        stored entries.
+    """
+    def _sync():
+        key = f"modlog/{subreddit.strip().lower()}"
+        if interval_seconds == 0:
+            poller.cancel(key)
+        elif interval_seconds:
+            poller.schedule(key, interval_seconds, lambda: modlog_store.sync(subreddit), pinned=True, run_now=False)
+        return modlog_store.sync(subreddit, max_entries)
+    return safe_execute(_sync)
+
+
+@reddit_tool(coalesce=False)
+def query_moderation_log(subreddit: str, moderator: Optional[str] = None, action: Optional[str] = None, target: Optional[str] = None, since: Optional[float] = None, until: Optional[float] = None, group_by: Optional[str] = None, limit: int = 100) -> Dict[str, Any]:
+    """Answers filtered questions about a subreddit's moderation log locally.
+
+    Reads only the local modlog store filled by `sync_moderation_log`, so it
+    makes no request to Reddit. Filters combine with AND.
+
+    Args:
+        subreddit (str): The name of the subreddit. (Required)
+        moderator (Optional[str]): Only actions by this moderator. (Optional)
+        action (Optional[str]): Only this action, e.g. 'removecomment' or 'banuser'. (Optional)
+        target (Optional[str]): Only actions on this fullname or against this
+                                author. (Optional)
+        since (Optional[float]): Only entries at or after this UNIX timestamp. (Optional)
+        until (Optional[float]): Only entries before this UNIX timestamp. (Optional)
+        group_by (Optional[str]): Count entries per 'moderator', 'action' or
+                                  'target_author' instead of listing them. (Optional)
+        limit (int): The maximum number of entries or groups. Defaults to 100. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with the total number of matching entries
+                        and either the newest matching 'entries' or the
+                        'groups' with their counts, plus when the store was
+                        last synced.
+    """
+    if group_by is not None and group_by not in MODLOG_GROUPS:
+        return {"successful": False, "data": {}, "error": f"Invalid group_by. Use one of: {list(MODLOG_GROUPS)}"}
+
+    def _query():
+        result = modlog_store.query(subreddit, moderator, action, target, since, until, group_by, limit)
+        last = modlog_store.last_synced(subreddit)
+        result["last_synced_seconds_ago"] = round(time.time() - last, 1) if last else None
+        return result
+    return safe_execute(_query)
+
+
+@reddit_tool(pinned=True)
 def list_muted_users(subreddit: str) -> Dict[str, Any]:
     """Lists users muted from a subreddit's modmail.
 
@@ -1258,8 +4991,8 @@ def list_muted_users(subreddit: str) -> Dict[str, Any]:
     return safe_execute(_get)
 
 
-@mcp.tool()
-def get_controversial_posts(subreddit: str, time_filter: str = 'day', limit: int = 10) -> Dict[str, Any]:
+@reddit_tool()
+def get_controversial_posts(subreddit: str, time_filter: str = 'day', limit: int = 10, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves controversial posts from a subreddit.
 
     Fetches posts with a high level of both upvotes and downvotes from a subreddit
@@ -1270,29 +5003,33 @@ def get_controversial_posts(subreddit: str, time_filter: str = 'day', limit: int
         time_filter (str): The time window to filter by ('hour', 'day', 'week',
                            'month', 'year', 'all'). Defaults to 'day'. (Optional)
         limit (int): The maximum number of posts to return. Defaults to 10. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        Dict[str, Any]: A dictionary containing a list of controversial posts,
-                        each with its title, ID, score, and author.
+        Dict[str, Any]: A dictionary containing a list of controversial posts
+                        holding the requested fields.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     if time_filter not in ['hour', 'day', 'week', 'month', 'year', 'all']:
         return {"successful": False, "data": {}, "error": "Invalid time_filter."}
     
     def _get():
-        posts = []
-        for submission in reddit.subreddit(subreddit).controversial(time_filter=time_filter, limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "score": submission.score,
-                "num_comments": submission.num_comments,
-                "author": str(submission.author)
-            })
-        return posts
-    return safe_execute(_get)
+        return list_posts(f"/r/{subreddit}/controversial", limit, fields, {"t": time_filter}, after, before)
+    return format_response(safe_execute_listing(_get), format)
 
 
-@mcp.tool()
+@reddit_tool(pinned=True)
 def list_user_friends() -> Dict[str, Any]:
     """Retrieves the friend list of the authenticated user.
 
@@ -1314,8 +5051,8 @@ def list_user_friends() -> Dict[str, Any]:
     return safe_execute(_get)
 
 
-@mcp.tool()
-def get_trending_posts(limit: int = 10) -> Dict[str, Any]:
+@reddit_tool()
+def get_trending_posts(limit: int = 10, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves trending posts from across all of Reddit.
 
     Fetches the current trending posts by retrieving the 'hot' posts from
@@ -1323,28 +5060,44 @@ def get_trending_posts(limit: int = 10) -> Dict[str, Any]:
 
     Args:
         limit (int): The maximum number of trending posts to return. Defaults to 10. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        Dict[str, Any]: A dictionary containing a list of trending posts, each
-                        with its title, subreddit, score, and URL.
+        Dict[str, Any]: A dictionary containing a list of trending posts
+                        holding the requested fields.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     def _get():
-        posts = []
-        for submission in reddit.subreddit("popular").hot(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "subreddit": str(submission.subreddit),
-                "score": submission.score,
-                "url": submission.url,
-                "author": str(submission.author)
-            })
-        return posts
-    return safe_execute(_get)
+        return list_posts("/r/popular/hot", limit, fields, after=after, before=before)
+    return format_response(safe_execute_listing(_get), format)
+
+
+def _serialize_voted(child: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds an upvoted/downvoted entry from a raw `t1` or `t3` child."""
+    item = child["data"]
+    item_data = {"id": item["id"], "subreddit": item.get("subreddit")}
+    if child["kind"] == 't3':
+        item_data["type"] = "Post"
+        item_data["title"] = item.get("title")
+    else:
+        item_data["type"] = "Comment"
+        item_data["body"] = item.get("body")
+    return item_data
 
 
-@mcp.tool()
-def get_my_upvoted_content(limit: int = 25) -> Dict[str, Any]:
+@reddit_tool(pinned=True)
+def get_my_upvoted_content(limit: int = 25, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves content upvoted by the authenticated user.
 
     Fetches a list of posts and comments that the currently authenticated user
@@ -1352,27 +5105,28 @@ def get_my_upvoted_content(limit: int = 25) -> Dict[str, Any]:
 
     Args:
         limit (int): The maximum number of items to return. Defaults to 25. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         Dict[str, Any]: A dictionary containing a list of upvoted items,
                         distinguishing between posts and comments.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     def _get():
-        upvoted_items = []
-        for item in reddit.user.me().upvoted(limit=limit):
-            item_data = {"id": item.id, "subreddit": str(item.subreddit)}
-            if hasattr(item, 'title'):
-                item_data["type"] = "Post"
-                item_data["title"] = item.title
-            else:
-                item_data["type"] = "Comment"
-                item_data["body"] = item.body
-            upvoted_items.append(item_data)
-        return upvoted_items
-    return safe_execute(_get)
+        path = f"/user/{reddit.user.me().name}/upvoted"
+        return read_listing(path, limit, _serialize_voted, after=after, before=before)
+    return format_response(safe_execute_listing(_get), format)
 
-@mcp.tool()
-def get_my_downvoted_content(limit: int = 25) -> Dict[str, Any]:
+@reddit_tool(pinned=True)
+def get_my_downvoted_content(limit: int = 25, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves content downvoted by the authenticated user.
 
     Fetches a list of posts and comments that the currently authenticated user
@@ -1380,27 +5134,28 @@ def get_my_downvoted_content(limit: int = 25) -> Dict[str, Any]:
 
     Args:
         limit (int): The maximum number of items to return. Defaults to 25. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         Dict[str, Any]: A dictionary containing a list of downvoted items,
                         distinguishing between posts and comments.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     def _get():
-        downvoted_items = []
-        for item in reddit.user.me().downvoted(limit=limit):
-            item_data = {"id": item.id, "subreddit": str(item.subreddit)}
-            if hasattr(item, 'title'):
-                item_data["type"] = "Post"
-                item_data["title"] = item.title
-            else:
-                item_data["type"] = "Comment"
-                item_data["body"] = item.body
-            downvoted_items.append(item_data)
-        return downvoted_items
-    return safe_execute(_get)
+        path = f"/user/{reddit.user.me().name}/downvoted"
+        return read_listing(path, limit, _serialize_voted, after=after, before=before)
+    return format_response(safe_execute_listing(_get), format)
 
 
-@mcp.tool()
+@reddit_tool()
 def get_reddit_age(name: str, item_type: str) -> Dict[str, Any]:
     """Calculates the age of a Reddit account or a subreddit.
 
@@ -1419,12 +5174,18 @@ def get_reddit_age(name: str, item_type: str) -> Dict[str, Any]:
         return {"successful": False, "data": {}, "error": "Invalid item_type. Must be 'user' or 'subreddit'."}
 
     def _get():
-        if item_type.lower() == 'user':
-            item = reddit.redditor(name)
-        else: # subreddit
-            item = reddit.subreddit(name)
+        key = f"{'u' if item_type.lower() == 'user' else 'r'}/{name.lower()}/created_utc"
+        found, created_utc = disk_cache.get(key)
+        if not found:
+            if item_type.lower() == 'user':
+                item = reddit.redditor(name)
+            else: # subreddit
+                item = reddit.subreddit(name)
+            created_utc = item.created_utc
+            disk_cache.set(key, "created_utc", created_utc)
+
+        from dateutil.relativedelta import relativedelta
 
-        created_utc = item.created_utc
         creation_date = datetime.fromtimestamp(created_utc, tz=timezone.utc)
         current_date = datetime.now(timezone.utc)
         delta = relativedelta(current_date, creation_date)
@@ -1438,8 +5199,8 @@ def get_reddit_age(name: str, item_type: str) -> Dict[str, Any]:
         }
     return safe_execute(_get)
 
-@mcp.tool()
-def get_user_gilded_content(username: str, limit: int = 25) -> Dict[str, Any]:
+@reddit_tool()
+def get_user_gilded_content(username: str, limit: int = 25, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves a user's content that has received awards.
 
     Fetches a list of posts and comments made by a specific user that have
@@ -1448,34 +5209,46 @@ def get_user_gilded_content(username: str, limit: int = 25) -> Dict[str, Any]:
     Args:
         username (str): The username of the user to check. (Required)
         limit (int): The maximum number of gilded items to return. Defaults to 25. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         Dict[str, Any]: A dictionary containing a list of the user's gilded posts
                         and comments, with details for each item.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+
+    def serialize(child):
+        item = child["data"]
+        item_data = {
+            "id": item["id"],
+            "subreddit": item.get("subreddit"),
+            "awards_count": item.get("total_awards_received"),
+            "score": item.get("score")
+        }
+        if child["kind"] == 't3':
+            item_data["type"] = "Post"
+            item_data["title"] = item.get("title")
+            item_data["url"] = item.get("url")
+        else:
+            item_data["type"] = "Comment"
+            item_data["body_preview"] = (item.get("body") or '')[:150] + '...'
+            item_data["link"] = f"https://www.reddit.com{item.get('permalink')}"
+        return item_data
+
     def _get():
-        gilded_items = []
-        for item in reddit.redditor(username).gilded(limit=limit):
-            item_data = {
-                "id": item.id,
-                "subreddit": str(item.subreddit),
-                "awards_count": item.total_awards_received,
-                "score": item.score
-            }
-            if hasattr(item, 'title'):
-                item_data["type"] = "Post"
-                item_data["title"] = item.title
-                item_data["url"] = item.url
-            else:
-                item_data["type"] = "Comment"
-                item_data["body_preview"] = item.body[:150] + '...'
-                item_data["link"] = f"https://www.reddit.com{item.permalink}"
-            gilded_items.append(item_data)
-        return gilded_items
-    return safe_execute(_get)
+        return read_listing(f"/user/{username}/gilded", limit, serialize, after=after, before=before)
+    return format_response(safe_execute_listing(_get), format)
 
 
-@mcp.tool()
+@reddit_tool()
 def get_user_follower_count(username: str) -> Dict[str, Any]:
     """Retrieves the follower count for a Reddit user.
 
@@ -1498,8 +5271,8 @@ def get_user_follower_count(username: str) -> Dict[str, Any]:
     return safe_execute(_get)
 
 
-@mcp.tool()
-def get_best_feed(limit: int = 25) -> Dict[str, Any]:
+@reddit_tool(pinned=True)
+def get_best_feed(limit: int = 25, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves the authenticated user's personalized "Best" feed.
 
     Fetches posts from the user's main front page, sorted by Reddit's "Best"
@@ -1507,26 +5280,29 @@ def get_best_feed(limit: int = 25) -> Dict[str, Any]:
 
     Args:
         limit (int): The maximum number of posts to return. Defaults to 25. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         Dict[str, Any]: A dictionary containing a list of post objects from the
                         user's "Best" feed.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     def _get():
-        posts = []
-        for submission in reddit.front.best(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "subreddit": str(submission.subreddit),
-                "score": submission.score,
-                "url": submission.url,
-                "author": str(submission.author)
-            })
-        return posts
-    return safe_execute(_get)
+        return list_posts("/best", limit, fields, after=after, before=before)
+    return format_response(safe_execute_listing(_get), format)
 
-@mcp.tool()
+@reddit_tool(pinned=True)
 def list_modmail_conversations(subreddit: str, limit: int = 10) -> Dict[str, Any]:
     """Retrieves recent modmail conversations for a subreddit.
 
@@ -1554,7 +5330,7 @@ def list_modmail_conversations(subreddit: str, limit: int = 10) -> Dict[str, Any
         return conversations
     return safe_execute(_get)
 
-@mcp.tool()
+@reddit_tool(write=True)
 def ignore_reports_on_content(content_id: str) -> Dict[str, Any]:
     """Ignores all user reports on a post or comment.
 
@@ -1574,7 +5350,36 @@ def ignore_reports_on_content(content_id: str) -> Dict[str, Any]:
         return {"status": f"Reports have been ignored for content '{content_id}'."}
     return safe_execute(_ignore)
 
-@mcp.tool()
+@reddit_tool(write=True)
+def ignore_reports_on_content_batch(content_ids: list[str], dry_run: bool = False) -> Dict[str, Any]:
+    """Ignores all user reports on many posts and comments.
+
+    Clears a brigade of reported items from the moderation queue in one
+    call. The items are handled concurrently within the moderation rate
+    budget, and one failed item does not stop the others. Requires
+    moderator permissions.
+
+    Args:
+        content_ids (list[str]): Full IDs of posts (t3_...) and comments
+                                 (t1_...), at most 1000; bare IDs are taken
+                                 as comments. (Required)
+        dry_run (bool): Only look the items up and report what would be
+                        done. Defaults to False. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with 'succeeded' and 'failed' counts and
+                        one result per distinct input ID, with 'successful'
+                        and a 'status' or 'error' message. Dry-run results
+                        also show each item's author and subreddit.
+    """
+    def _ignore(fullname):
+        kind, id = fullname.split('_', 1)
+        item = reddit.submission(id) if kind == 't3' else reddit.comment(id)
+        item.mod.ignore_reports()
+        return f"Reports have been ignored for content '{fullname}'."
+    return run_batch(content_ids, _ignore, "ignore reports on {}", ('t1', 't3'), dry_run)
+
+@reddit_tool(write=True, invalidates=("get_link_flair",))
 def delete_flair_template(subreddit: str, flair_template_id: str) -> Dict[str, Any]:
     """Deletes a post flair template from a subreddit.
 
@@ -1594,7 +5399,7 @@ def delete_flair_template(subreddit: str, flair_template_id: str) -> Dict[str, A
     return safe_execute(_delete)
 
 
-@mcp.tool()
+@reddit_tool(write=True)
 def crosspost_submission(post_id: str, subreddit: str, title: Optional[str] = None) -> Dict[str, Any]:
     """Crossposts an existing submission to another subreddit.
 
@@ -1621,7 +5426,7 @@ def crosspost_submission(post_id: str, subreddit: str, title: Optional[str] = No
         }
     return safe_execute(_crosspost)
 
-@mcp.tool()
+@reddit_tool(write=True)
 def reply_to_modmail_conversation(conversation_id: str, body: str, is_author_hidden: bool = False) -> Dict[str, Any]:
     """Replies to a modmail conversation.
 
@@ -1643,8 +5448,8 @@ def reply_to_modmail_conversation(conversation_id: str, body: str, is_author_hid
     return safe_execute(_reply)
 
 
-@mcp.tool()
-def get_my_notifications(filter_type: str = 'unread', limit: int = 10) -> Dict[str, Any]:
+@reddit_tool(pinned=True)
+def get_my_notifications(filter_type: str = 'unread', limit: int = 10, after: Optional[str] = None, before: Optional[str] = None, max_chars: Optional[int] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves notifications from the authenticated user's inbox.
 
     Fetches various types of inbox items, such as messages, comment replies,
@@ -1655,41 +5460,207 @@ def get_my_notifications(filter_type: str = 'unread', limit: int = 10) -> Dict[s
                            'comment_replies', 'post_replies', 'mentions', 'messages').
                            Defaults to 'unread'. (Optional)
         limit (int): The maximum number of notifications to return. Defaults to 10. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        max_chars (int): Output budget in characters of JSON. Over budget, the
+                         longest bodies and subjects are cut, then trailing
+                         notifications are left out and 'after' points just
+                         before them; what was elided is reported under
+                         'truncated'. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
         Dict[str, Any]: A dictionary containing a list of notification objects
                         matching the filter criteria.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
     valid_filters = ['all', 'unread', 'comment_replies', 'post_replies', 'mentions', 'messages']
     if filter_type.lower() not in valid_filters:
         return {"successful": False, "data": {}, "error": f"Invalid filter_type. Use one of: {valid_filters}"}
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
+
+    names = {}
+
+    def serialize(item):
+        notification = _serialize_notification(item)
+        names[id(notification)] = item.get("name")
+        return notification
 
     def _get():
-        inbox_methods = {
-            'all': reddit.inbox.all,
-            'unread': reddit.inbox.unread,
-            'comment_replies': reddit.inbox.comment_replies,
-            'post_replies': reddit.inbox.post_replies,
-            'mentions': reddit.inbox.mentions,
-            'messages': reddit.inbox.messages
+        watched = filter_type.lower() == 'unread' and not (after or before)
+        unread = inbox_watcher.unread_snapshot(limit) if watched else None
+        if unread is not None:
+            cursors = {"after": unread[-1]["name"] if len(unread) == limit else None, "before": None}
+            return [serialize(item) for item in unread], cursors
+        inbox_paths = {
+            'all': "/message/inbox",
+            'unread': "/message/unread",
+            'comment_replies': "/message/comments",
+            'post_replies': "/message/selfreply",
+            'mentions': "/message/mentions",
+            'messages': "/message/messages"
         }
-        inbox_items = inbox_methods[filter_type.lower()](limit=limit)
-
-        notifications = []
-        for item in inbox_items:
-            notifications.append({
-                "id": item.id,
-                "author": str(getattr(item, 'author', 'N/A')),
-                "subject": getattr(item, 'subject', 'N/A'),
-                "body": getattr(item, 'body', ''),
-                "is_new": getattr(item, 'new', False),
-                "created_utc": item.created_utc
-            })
-        return notifications
-    return safe_execute(_get)
+        return read_listing(inbox_paths[filter_type.lower()], limit, lambda child: serialize(child["data"]),
+                            after=after, before=before)
+    response = safe_execute_listing(_get)
+    if not response["successful"]:
+        return response
+    response = budget_listing_response(response, max_chars, ("body", "subject"),
+                                       [names[id(item)] for item in response["data"]], after)
+    return format_response(response, format)
+
+
+INBOX_BUFFER_SIZE = 500
+
+
+def _serialize_notification(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds a `get_my_notifications` entry from raw inbox JSON."""
+    return {
+        "id": item.get("id"),
+        "author": str(item.get("author") or 'N/A'),
+        "subject": item.get("subject") or 'N/A',
+        "body": item.get("body") or '',
+        "is_new": item.get("new", False),
+        "created_utc": item.get("created_utc")
+    }
+
+
+class InboxWatcher:
+    """Polls the unread inbox once for every client and buffers what arrives.
+
+    The background poller fetches /message/unread every INBOX_POLL_SECONDS
+    on the write account. Items not seen before are appended to a bounded
+    queue with increasing sequence numbers; the oldest are dropped once it
+    holds `max_items`. Long-poll waiters on any event loop are woken as soon
+    as a poll adds items. The watcher starts on first use.
+    """
+
+    def __init__(self, interval: float, max_items: int = INBOX_BUFFER_SIZE):
+        self.interval = interval
+        self.items = deque(maxlen=max_items)
+        self.sequence = 0
+        self.unread = []
+        self.polled_at = None
+        self._seen = OrderedDict()
+        self._waiters = set()
+        self._lock = threading.Lock()
+
+    def ensure_started(self) -> None:
+        if poller.interval("inbox") is None:
+            poller.schedule("inbox", self.interval, self.poll, pinned=True)
+
+    def poll(self) -> None:
+        listing = reddit.request(method="GET", path="/message/unread",
+                                 params={"limit": LISTING_PAGE_SIZE, "raw_json": 1})
+        unread = [child["data"] for child in listing["data"]["children"]]
+        with self._lock:
+            self.unread = unread
+            self.polled_at = time.monotonic()
+            for item in reversed(unread):
+                if item["name"] in self._seen:
+                    continue
+                self._seen[item["name"]] = None
+                self.sequence += 1
+                self.items.append((self.sequence, item))
+            while len(self._seen) > 10 * self.items.maxlen:
+                self._seen.popitem(last=False)
+            waiters, self._waiters = self._waiters, set()
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(lambda future=future: future.done() or future.set_result(None))
+
+    def unread_snapshot(self, limit: int) -> Optional[list]:
+        """The unread items from the latest poll, or None if that poll is stale."""
+        with self._lock:
+            fresh = self.polled_at is not None and time.monotonic() - self.polled_at <= 2 * self.interval
+            if not fresh or limit > LISTING_PAGE_SIZE or poller.interval("inbox") is None:
+                return None
+            return self.unread[:limit]
+
+    def since(self, cursor: Optional[int], limit: int) -> tuple:
+        """Returns `(items, next_cursor, dropped)` for items after `cursor`."""
+        with self._lock:
+            if cursor is None:
+                cursor = self.items[0][0] - 1 if self.items else self.sequence
+            oldest = self.items[0][0] if self.items else self.sequence + 1
+            dropped = max(oldest - cursor - 1, 0)
+            items = [(number, item) for number, item in self.items if number > cursor][:limit]
+            next_cursor = items[-1][0] if items else max(cursor, oldest - 1)
+            return [item for _, item in items], next_cursor, dropped
+
+    async def wait(self, cursor: Optional[int], limit: int, timeout: float) -> tuple:
+        self.ensure_started()
+        deadline = time.monotonic() + timeout
+        while True:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            waiter = (loop, future)
+            with self._lock:
+                self._waiters.add(waiter)
+            items, next_cursor, dropped = self.since(cursor, limit)
+            remaining = deadline - time.monotonic()
+            if items or remaining <= 0:
+                with self._lock:
+                    self._waiters.discard(waiter)
+                return items, next_cursor, dropped, not items
+            try:
+                await asyncio.wait_for(future, remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    self._waiters.discard(waiter)
+
+
+inbox_watcher = InboxWatcher(INBOX_POLL_SECONDS)
+
+
+@reddit_tool(pinned=True, coalesce=False)
+async def wait_for_notifications(timeout: float = 30, cursor: Optional[int] = None, limit: int = 50) -> Dict[str, Any]:
+    """Waits for new inbox items and returns as soon as any arrive.
+
+    All callers share one background poll of the unread inbox. Items are
+    numbered as they arrive; pass the returned `next_cursor` on the next call
+    to receive only later items. Without a cursor, every buffered item is
+    returned, starting with what was unread when the watcher started.
+
+    Args:
+        timeout (float): Maximum seconds to wait for items, up to 300.
+                         Defaults to 30. (Optional)
+        cursor (Optional[int]): The `next_cursor` from a previous call. (Optional)
+        limit (int): The maximum number of items to return. Defaults to 50. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary with a list of inbox items (same fields as
+                        `get_my_notifications`, plus 'fullname' and 'type'),
+                        'next_cursor', 'timed_out', and 'dropped', the number
+                        of items after the cursor that fell out of the buffer.
+    """
+    try:
+        items, next_cursor, dropped, timed_out = await inbox_watcher.wait(
+            cursor, max(limit, 1), min(max(float(timeout), 0.0), 300.0)
+        )
+        notifications = [
+            {**_serialize_notification(item), "fullname": item["name"], "type": item["name"].split('_')[0]}
+            for item in items
+        ]
+        return {"successful": True, "data": {
+            "items": notifications, "next_cursor": next_cursor, "timed_out": timed_out, "dropped": dropped
+        }, "error": None}
+    except Exception as e:
+        note_tool_error(e)
+        return {"successful": False, "data": {}, "error": str(e)}
 
 
-@mcp.tool()
+if os.environ.get("REDDIT_MCP_WATCH_INBOX", "").lower() in ("1", "true", "yes"):
+    inbox_watcher.ensure_started()
+
+
+@reddit_tool()
 def find_communities_by_topic(topic: str, limit: int = 10) -> Dict[str, Any]:
     """Finds subreddit communities related to a specific topic.
 
@@ -1719,7 +5690,7 @@ def find_communities_by_topic(topic: str, limit: int = 10) -> Dict[str, Any]:
 
 
 
-@mcp.tool()
+@reddit_tool(cache_ttl=21600)
 def get_community_age_rating(subreddit: str) -> Dict[str, Any]:
     """Checks the age rating (NSFW status) of a subreddit.
 
@@ -1745,7 +5716,7 @@ def get_community_age_rating(subreddit: str) -> Dict[str, Any]:
         }
     return safe_execute(_get)
 
-@mcp.tool()
+@reddit_tool(write=True, invalidates=("get_subreddit_rules",))
 def update_subreddit_rule(subreddit: str, short_name: str, new_description: Optional[str] = None) -> Dict[str, Any]:
     """Updates the description of an existing subreddit rule.
 
@@ -1771,8 +5742,8 @@ def update_subreddit_rule(subreddit: str, short_name: str, new_description: Opti
 
 from typing import Dict, Any
 
-@mcp.tool()
-def get_rising_posts(subreddit: str, limit: int = 10) -> Dict[str, Any]:
+@reddit_tool()
+def get_rising_posts(subreddit: str, limit: int = 10, fields: Optional[list[str]] = None, after: Optional[str] = None, before: Optional[str] = None, format: str = 'records') -> Dict[str, Any]:
     """Retrieves posts from a subreddit's "Rising" feed.
 
     Fetches posts that are new and quickly gaining upvotes, indicating they may
@@ -1781,26 +5752,30 @@ def get_rising_posts(subreddit: str, limit: int = 10) -> Dict[str, Any]:
     Args:
         subreddit (str): The name of the subreddit. (Required)
         limit (int): The maximum number of posts to return. Defaults to 10. (Optional)
+        fields (list[str]): Post fields to return, e.g. ['id', 'title', 'score'].
+                            Defaults to id, title, author, subreddit, score,
+                            num_comments, created_utc and url. (Optional)
+        after (str): Start after this item, i.e. the 'after' cursor of a
+                     previous call. (Optional)
+        before (str): Return the items just before this one, i.e. the
+                      'before' cursor of a previous call. (Optional)
+        format (str): 'records' for a list of objects, or 'columnar' for one
+                      list of field names and one row per item. Defaults to
+                      'records'. (Optional)
 
     Returns:
-        Dict[str, Any]: A dictionary containing a list of rising posts, each with
-                        its title, score, and comment count.
+        Dict[str, Any]: A dictionary containing a list of rising posts holding
+                        the requested fields.
+                        'after' and 'before' are cursors for the neighbouring pages.
     """
+    if format not in RESPONSE_FORMATS:
+        return {"successful": False, "error": FORMAT_ERROR}
     def _get():
-        posts = []
-        for submission in reddit.subreddit(subreddit).rising(limit=limit):
-            posts.append({
-                "title": submission.title,
-                "id": submission.id,
-                "score": submission.score,
-                "num_comments": submission.num_comments,
-                "author": str(submission.author)
-            })
-        return posts
-    return safe_execute(_get)
+        return list_posts(f"/r/{subreddit}/rising", limit, fields, after=after, before=before)
+    return format_response(safe_execute_listing(_get), format)
 
 
-@mcp.tool()
+@reddit_tool()
 def find_best_answer_in_post(post_id: str, strategy: str = 'top_voted') -> Dict[str, Any]:
     """Finds the most likely 'answer' in a post's comment section.
 
@@ -1822,43 +5797,45 @@ def find_best_answer_in_post(post_id: str, strategy: str = 'top_voted') -> Dict[
         return {"successful": False, "data": {}, "error": f"Invalid strategy. Use one of: {valid_strategies}"}
 
     def _get():
-        submission = reddit.submission(post_id)
-        submission.comments.replace_more(limit=None)
-        
-        found_comment = None
-
+        # Walk the tree lazily and stop as soon as the strategy is satisfied,
+        # so "load more comments" stubs beyond the answer are never fetched.
         if strategy == 'top_voted':
-            if submission.comments:
-                found_comment = submission.comments[0]
-        
-        elif strategy == 'op_reply':
-            for comment in submission.comments.list():
-                if comment.author and comment.author == submission.author:
+            walker = CommentWalker(post_id, sort='top', max_depth=0, replace_more_limit=0)
+            walker.load(limit=1)
+        else:
+            walker = CommentWalker(post_id, replace_more_limit=None, prefetch=1)
+            walker.load()
+        op_name = str(walker.submission.get("author")).lower()
+
+        found_comment = None
+        for depth, comment in walker.walk():
+            if strategy == 'top_voted':
+                found_comment = comment
+            elif strategy == 'op_reply':
+                if str(comment.get("author")).lower() == op_name and op_name != '[deleted]':
                     found_comment = comment
-                    break
-                    
-        elif strategy == 'mod_reply':
-            for comment in submission.comments.list():
-                if comment.distinguished == 'moderator':
+            elif strategy == 'mod_reply':
+                if comment.get("distinguished") == 'moderator':
                     found_comment = comment
-                    break
+            if found_comment:
+                break
 
         if found_comment:
             return {
                 "strategy_used": strategy,
-                "comment_id": found_comment.id,
-                "author": str(found_comment.author),
-                "body": found_comment.body,
-                "score": found_comment.score,
-                "is_op": found_comment.author == submission.author,
-                "is_mod": found_comment.distinguished == 'moderator'
+                "comment_id": found_comment["id"],
+                "author": str(found_comment.get("author")),
+                "body": found_comment.get("body"),
+                "score": found_comment.get("score"),
+                "is_op": str(found_comment.get("author")).lower() == op_name,
+                "is_mod": found_comment.get("distinguished") == 'moderator'
             }
         else:
             return {"status": f"No answer found using strategy '{strategy}'."}
     return safe_execute(_get)
 
 
-@mcp.tool()
+@reddit_tool(coalesce=False)
 def get_random_post(subreddit: str) -> Dict[str, Any]:
     """Retrieves a single random submission from a subreddit.
 
@@ -1887,5 +5864,115 @@ def get_random_post(subreddit: str) -> Dict[str, Any]:
     return safe_execute(_get)
 
 
+@reddit_tool()
+def get_cache_stats() -> Dict[str, Any]:
+    """Reports the state of the in-process response cache.
+
+    The cache holds results of read-mostly subreddit metadata tools such as
+    rules, sidebar, moderators and link flair, each with its own TTL.
+    'disk' reports the persistent cache of submissions, comment pages,
+    trophies and creation dates.
+    'corpus' reports the local full-text index behind search_local_corpus.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the current entry count, the size
+                        bound, and hit, miss, expiry, eviction and
+                        invalidation counters. 'single_flight' reports how
+                        many identical concurrent calls shared one fetch.
+    """
+    return safe_execute(lambda: {**response_cache.stats(), "single_flight": single_flight_stats(), "disk": disk_cache.stats(),
+                                 "corpus": corpus_index.stats()})
+
+
+@reddit_tool()
+def get_scheduler_stats() -> Dict[str, Any]:
+    """Reports the state of the upstream request schedulers.
+
+    Shows, for every account of the client pool, how its requests to Reddit
+    are being paced: the token bucket, the most recent rate limit headers,
+    and per-lane queue depth and wait times for the 'moderation',
+    'interactive' and 'background' lanes.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the name of the write account and,
+                        under 'accounts', each account's token bucket state,
+                        rate limit budget, and per-lane queue depth, grant
+                        counts and average and maximum wait in seconds.
+    """
+    return safe_execute(reddit.scheduler_stats)
+
+
+@reddit_tool()
+def get_account_pool_stats() -> Dict[str, Any]:
+    """Reports the accounts in the Reddit client pool.
+
+    For each configured account, shows whether it is healthy or cooling down
+    after repeated failures, how many tool calls it is serving and has
+    served, its upstream request count, and its rate limit state.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the selection strategy, the name of
+                        the write account, and per-account health, load and
+                        scheduler state.
+    """
+    return safe_execute(reddit.stats)
+
+
+@reddit_tool(coalesce=False)
+def get_server_metrics(format: str = 'json') -> Dict[str, Any]:
+    """Reports per-tool performance metrics for this server process.
+
+    Covers every registered tool: call counts, latency histograms and
+    approximate percentiles, error counts by class, upstream Reddit requests
+    and bytes, and bytes returned to clients.
+
+    Args:
+        format (str): 'json' for a structured summary, or 'prometheus' for the
+                      Prometheus text exposition format. Defaults to 'json'. (Optional)
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the metrics, together with
+                        scheduler and cache state in 'json' format, or a
+                        single text block in 'prometheus' format.
+    """
+    if format not in ('json', 'prometheus'):
+        return {"successful": False, "data": {}, "error": "Invalid format. Use 'json' or 'prometheus'."}
+
+    def _get():
+        if format == 'prometheus':
+            return metrics.prometheus()
+        return {
+            **metrics.snapshot(),
+            "scheduler": reddit.scheduler_stats(),
+            "cache": {**response_cache.stats(), "single_flight": single_flight_stats()}
+        }
+    return safe_execute(_get)
+
+
+_startup_marks.append(("tools_registered", time.perf_counter()))
+
+
+def startup_profile() -> Dict[str, Any]:
+    """Times each startup phase, plus the deferred client construction."""
+    started = time.perf_counter()
+    reddit.get_client()
+    client_seconds = time.perf_counter() - started
+    phases = {}
+    for (_, previous), (label, mark) in zip(_startup_marks, _startup_marks[1:]):
+        phases[label] = round((mark - previous) * 1000, 2)
+    return {
+        "phases_ms": phases,
+        "total_startup_ms": round((_startup_marks[-1][1] - _startup_marks[0][1]) * 1000, 2),
+        "tools_registered": len(mcp._tool_manager.list_tools()),
+        "deferred_client_construction_ms": round(client_seconds * 1000, 2)
+    }
+
+
 if __name__ == "__main__":
+    if "--startup-profile" in sys.argv:
+        print(json.dumps(startup_profile(), indent=2))
+        sys.exit(0)
+    if os.environ.get("REDDIT_MCP_STARTUP_PROFILE"):
+        # stdout carries the MCP stdio transport, so report on stderr.
+        print(json.dumps(startup_profile()), file=sys.stderr)
     mcp.run()